@@ -0,0 +1,72 @@
+"""Compara o APP_DATA_REGEX antigo com o scanner de chaves em páginas sintéticas de 1 a 20 MB.
+
+Uso: python -m benchmarks.bench_app_data_parser
+"""
+import json
+import re
+import time
+
+from src.parsers.app_data_parser import extract_app_data
+
+LEGACY_APP_DATA_REGEX = re.compile(r'window\.__appData\s*=\s*({.*?});', re.DOTALL)
+PAGE_SIZES_MB = (1, 5, 10, 20)
+ROUNDS = 5
+
+
+def _posting(index: int, description: str) -> dict:
+    return {
+        'id': f'job-{index}',
+        'title': f'Senior Software Engineer {index}',
+        'departmentName': 'Engineering',
+        'locationName': 'Remote - Brazil' if index % 20 == 0 else 'San Francisco',
+        'secondaryLocations': [{'locationId': f'loc-{index % 7}', 'locationName': 'Anywhere (LATAM)'}],
+        'compensationTierSummary': '$120K – $180K • Offers Equity',
+        'descriptionPlain': description,
+    }
+
+
+def build_page(size_mb: int, with_terminator_in_strings: bool) -> str:
+    snippet = 'if (ok) { ship(); };' if with_terminator_in_strings else 'if (ok) { ship() }'
+    description = f'We write code like `{snippet}` and quote "braces {{}}". ' * 8
+    head = '<html><head><script>var config = {"theme": "dark"};</script></head><body>'
+    tail = '<script>window.analytics = {};</script></body></html>'
+    target = size_mb * 1024 * 1024
+
+    postings = []
+    size = 0
+    while size < target:
+        posting = _posting(len(postings), description)
+        postings.append(posting)
+        size += len(json.dumps(posting))
+
+    app_data = json.dumps({'organization': {'name': 'Bench'}, 'jobBoard': {'jobPostings': postings}})
+    return f'{head}<script>window.__appData = {app_data};</script>{tail}'
+
+
+def _best_of(function, page) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started_at = time.perf_counter()
+        function(page)
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def main() -> None:
+    print(f'{"size":>6} | {"strings with };":>15} | {"regex (str)":>12} | {"scanner (str)":>13} | {"scanner (bytes)":>15} | regex complete?')
+    for size_mb in PAGE_SIZES_MB:
+        for with_terminator_in_strings in (False, True):
+            page = build_page(size_mb, with_terminator_in_strings)
+            page_bytes = page.encode('utf-8')
+
+            regex_time = _best_of(lambda text: LEGACY_APP_DATA_REGEX.search(text).group(1), page)
+            scanner_time = _best_of(extract_app_data, page)
+            scanner_bytes_time = _best_of(extract_app_data, page_bytes)
+
+            regex_complete = LEGACY_APP_DATA_REGEX.search(page).group(1) == extract_app_data(page)
+            print(f'{size_mb:>4}MB | {str(with_terminator_in_strings):>15} | {regex_time * 1000:>10.1f}ms | '
+                  f'{scanner_time * 1000:>11.1f}ms | {scanner_bytes_time * 1000:>13.1f}ms | {regex_complete}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Mede o memo de decisões do filtro em um board sintético de 50 mil vagas com títulos únicos e poucas
+combinações de (locationName, secondaryLocations), como nos boards grandes do Ashby: avaliação sem memo,
+com memo frio (primeira execução) e com memo quente (carregado do STATE_DIR de uma execução anterior).
+
+Uso: python -m benchmarks.bench_decision_memo
+"""
+import os
+import random
+import tempfile
+import time
+
+from src.filters.decision_memo import DecisionMemo
+from src.filters.rule_engine import compile_rules
+from src.mappers.job_mapper import iter_dicts_to_projections
+from src.services.filter_jobs_service import COMPANY_RULES
+
+POSTINGS = 50_000
+LOCATION_COMBINATIONS = 300
+COMPANIES = ('eightsleep', 'supabase', 'deel', 'resend')
+
+_CITIES = ('San Francisco', 'New York', 'Remote', 'Remote - Brazil', 'Anywhere (LATAM)', 'Toronto, Canada', 'London', 'Americas',
+           'São Paulo, Brazil', 'Berlin', 'Remote - US', 'Mexico City')
+
+
+def _postings() -> list:
+    rng = random.Random(42)
+    locations = [{'locationId': f'loc-{index}', 'locationName': name} for index, name in enumerate(_CITIES)]
+    combinations = [(rng.choice(_CITIES), [dict(rng.choice(locations)) for _ in range(rng.randrange(4))])
+                    for _ in range(LOCATION_COMBINATIONS)]
+    postings = []
+    for index in range(POSTINGS):
+        location_name, secondary_locations = rng.choice(combinations)
+        postings.append({'id': f'job-{index}', 'title': f'Software Engineer {index}', 'locationName': location_name,
+                         'secondaryLocations': secondary_locations})
+    return postings
+
+
+def _timed(plan, projections: list, memo: DecisionMemo | None) -> tuple:
+    started = time.perf_counter()
+    decisions = [plan.evaluate(projection, company, memo) for company in COMPANIES for projection in projections]
+    return time.perf_counter() - started, decisions
+
+
+def main() -> None:
+    plan = compile_rules(COMPANY_RULES)
+    projections = list(iter_dicts_to_projections(_postings()))
+    baseline, expected = _timed(plan, projections, None)
+
+    cold_memo = DecisionMemo()
+    cold, cold_decisions = _timed(plan, projections, cold_memo)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'filter_decisions.json')
+        cold_memo.save(path)
+        warm_memo = DecisionMemo()
+        warm_memo.load(path)
+    warm, warm_decisions = _timed(plan, projections, warm_memo)
+
+    print(f'{"cenário":>12} | {"tempo":>8} | {"speedup":>7} | {"acertos":>7} | entradas | idêntico?')
+    print(f'{"sem memo":>12} | {baseline:>6.3f} s | {1:>6.1f}x | {"-":>7} | {"-":>8} | True')
+    for label, elapsed, memo, decisions in (('memo frio', cold, cold_memo, cold_decisions), ('memo quente', warm, warm_memo, warm_decisions)):
+        stats = memo.get_stats()
+        print(f'{label:>12} | {elapsed:>6.3f} s | {baseline / elapsed:>6.1f}x | {stats["hitRatio"]:>7.1%} | {stats["entries"]:>8} | '
+              f'{decisions == expected}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Compara os backends de JSON (stdlib, orjson, msgspec) na decodificação de boards sintéticos, no
+fingerprint das vagas e na codificação dos payloads enviados para a API.
+
+Uso: python -m benchmarks.bench_json_codec
+"""
+import json
+import time
+
+from benchmarks.bench_app_data_parser import build_page
+from src.parsers.app_data_parser import extract_app_data
+from src.parsers.job_postings_parser import JobPostings
+from src.serialization.json_codec import BACKEND_PRIORITY, create_codec
+
+PAGE_SIZES_MB = (1, 5, 20)
+ROUNDS = 5
+
+
+def _normalized_job(posting: dict) -> dict:
+    return {
+        'id': posting['id'],
+        'title': posting['title'],
+        'seniority': 'senior',
+        'field': 'software engineering',
+        'company': 'bench',
+        'url': f'https://jobs.ashbyhq.com/bench/{posting["id"]}',
+        'locationName': posting['locationName'],
+        'description': posting['descriptionPlain'],
+    }
+
+
+def _best_of(function) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started_at = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def _available_codecs() -> list:
+    codecs = []
+    for name in BACKEND_PRIORITY:
+        codec = create_codec(name)
+        if codec.name == name:
+            codecs.append(codec)
+        else:
+            print(f'{name} não instalado, ignorando')
+    return codecs
+
+
+def main() -> None:
+    codecs = _available_codecs()
+    print(f'{"size":>6} | {"backend":>8} | {"decode board":>12} | {"fingerprint":>11} | {"encode jobs":>11}')
+    for size_mb in PAGE_SIZES_MB:
+        app_data = extract_app_data(build_page(size_mb, False).encode('utf-8'))
+        postings = json.loads(bytes(JobPostings.from_app_data(app_data).raw()))
+        jobs = [_normalized_job(posting) for posting in postings]
+
+        for codec in codecs:
+            decode_board = _best_of(lambda: codec.loads(app_data))
+            fingerprint = _best_of(lambda: [codec.dumps(posting, sort_keys=True) for posting in postings])
+            encode_jobs = _best_of(lambda: [codec.dumps(job) for job in jobs])
+            print(f'{size_mb:>4}MB | {codec.name:>8} | {decode_board * 1000:>10.1f}ms | {fingerprint * 1000:>9.1f}ms | '
+                  f'{encode_jobs * 1000:>9.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
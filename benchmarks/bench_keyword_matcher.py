@@ -0,0 +1,91 @@
+"""Compara, em 100 mil títulos sintéticos, o filtro por empresa seguido da normalização de senioridade/área
+com as checagens de substring diretas (KEYWORD_INDEX=false, padrão) e com o índice de palavras-chave
+compartilhado (KEYWORD_INDEX=true: autômato Aho–Corasick construído uma vez com as palavras-chave dos dois
+serviços, que devolve todas as ocorrências numa única passada e guarda o resultado por texto). Mede um board
+com todos os títulos distintos e outro em que os títulos se repetem, com o backend nativo (pyahocorasick)
+quando instalado e com o autômato em Python puro.
+
+Uso: python -m benchmarks.bench_keyword_matcher
+"""
+import random
+import sys
+import time
+from unittest.mock import patch
+
+from src.filters.rule_engine import compile_rules
+from src.matching.keyword_matcher import KeywordIndex
+from src.services import normalize_jobs_service
+from src.services.filter_jobs_service import COMPANY_RULES
+from src.services.normalize_jobs_service import _normalize_field, _normalize_seniority
+
+TITLES = 100_000
+DISTINCT_TITLES = 2_000
+COMPANIES = ('eightsleep', 'supabase', 'deel', 'resend')
+
+_SENIORITIES = ('', 'Senior ', 'Sr. ', 'Staff ', 'Junior ', 'Associate ', 'Lead ', 'Head of ', 'Director, ', 'Intern - ')
+_ROLES = ('Software Engineer', 'Data Scientist', 'Machine Learning Engineer', 'Product Designer', 'UX Researcher',
+          'IT Support Specialist', 'QA Analyst', 'Growth Engineer', 'Account Executive', 'Engineering Manager',
+          'Tech Lead, Platform', 'Solutions Architect', 'Customer Success Manager', 'Technical Writer')
+_SUFFIXES = ('', ' (Remote)', ' - Americas', ' - LATAM', ' - Brazil', ' (US Time Zones)', ', Infrastructure')
+_LOCATIONS = ('Remote', 'San Francisco', 'Remote - Brazil', 'New York', 'Anywhere (LATAM)', 'Americas', 'London')
+
+
+class _Posting:
+    __slots__ = ('title', 'locationName', 'secondaryLocations', 'seniority_level', 'field')
+
+    def __init__(self, title: str, location_name: str):
+        self.title = title
+        self.locationName = location_name
+        self.secondaryLocations = [{'locationName': location_name}]
+
+
+def _title(rng: random.Random, index: int) -> str:
+    return f'{rng.choice(_SENIORITIES)}{rng.choice(_ROLES)}{rng.choice(_SUFFIXES)} #{index}'
+
+
+def _boards() -> dict:
+    rng = random.Random(42)
+    unique = [_title(rng, index) for index in range(TITLES)]
+    distinct = [_title(rng, index) for index in range(DISTINCT_TITLES)]
+    repeated = [rng.choice(distinct) for _ in range(TITLES)]
+    return {'títulos únicos': unique, f'{DISTINCT_TITLES} títulos repetidos': repeated}
+
+
+def _run(postings: list, index: KeywordIndex | None) -> tuple:
+    plan = compile_rules(COMPANY_RULES, index)
+    with patch.object(normalize_jobs_service, 'keyword_index', index), \
+            patch.object(normalize_jobs_service, '_use_keyword_index', index is not None):
+        if index is not None:
+            index.register(normalize_jobs_service.KEYWORD_GROUP,
+                           normalize_jobs_service.SENIORITY_KEYWORDS + normalize_jobs_service.FIELD_KEYWORDS)
+
+        started = time.perf_counter()
+        results = []
+        for company in COMPANIES:
+            for posting in postings:
+                decision = plan.evaluate(posting, company)
+                _normalize_seniority(posting)
+                _normalize_field(posting)
+                results.append((decision, posting.seniority_level, posting.field))
+        return time.perf_counter() - started, results
+
+
+def main() -> None:
+    print(f'{"board":>22} | {"backend":>11} | {"substring":>9} | {"índice":>9} | {"speedup":>7} | cache | idêntico?')
+    for label, titles in _boards().items():
+        postings = [_Posting(title, _LOCATIONS[index % len(_LOCATIONS)]) for index, title in enumerate(titles)]
+        direct_time, direct = _run(postings, None)
+
+        for blocked in ({}, {'ahocorasick': None}):
+            with patch.dict(sys.modules, blocked):
+                index = KeywordIndex()
+                indexed_time, indexed = _run(postings, index)
+
+            stats = index.matcher.get_stats()
+            hit_rate = stats['hits'] / (stats['hits'] + stats['misses'])
+            print(f'{label:>22} | {stats["backend"]:>11} | {direct_time:>7.3f} s | {indexed_time:>7.3f} s | '
+                  f'{direct_time / indexed_time:>6.2f}x | {hit_rate:>5.0%} | {direct == indexed}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Compara o mapeamento completo de cada vaga (Job com 22 campos limpos antes do filtro) com a projeção
+preguiçosa (só title/locationName/secondaryLocations até a vaga passar no filtro) em boards sintéticos.
+
+Uso: python -m benchmarks.bench_lazy_projection
+"""
+import logging
+import time
+
+from benchmarks.bench_model_memory import _posting
+from src.mappers.job_mapper import dicts_to_jobs, iter_dicts_to_projections
+from src.services.filter_jobs_service import filter_brazilian_friendly_jobs
+
+BOARD_SIZES = (1_000, 10_000, 50_000)
+COMPANIES = ('deel', 'other')
+ROUNDS = 5
+
+
+def _best_of(function) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started_at = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def main() -> None:
+    logging.disable(logging.INFO)
+    print(f'{"vagas":>7} | {"empresa":>7} | {"aprovadas":>9} | {"completo":>14} | {"projeção":>14} | ganho | mesmo resultado?')
+    for size in BOARD_SIZES:
+        postings = [_posting(index) for index in range(size)]
+        for company in COMPANIES:
+            full = filter_brazilian_friendly_jobs(dicts_to_jobs(postings), company)
+            lazy = filter_brazilian_friendly_jobs(iter_dicts_to_projections(postings), company)
+            same = [job.to_dict() for job in full] == [job.to_dict() for job in lazy]
+
+            full_seconds = _best_of(lambda: filter_brazilian_friendly_jobs(dicts_to_jobs(postings), company))
+            lazy_seconds = _best_of(lambda: filter_brazilian_friendly_jobs(iter_dicts_to_projections(postings), company))
+            print(f'{size:>7} | {company:>7} | {len(full):>9} | {size / full_seconds:>9,.0f} v/s | {size / lazy_seconds:>9,.0f} v/s | '
+                  f'{full_seconds / lazy_seconds:>4.1f}x | {same}')
+
+
+if __name__ == '__main__':
+    main()
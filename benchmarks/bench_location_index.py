@@ -0,0 +1,60 @@
+"""Mede o índice de localizações secundárias por locationId no board sintético de 50 mil vagas do memo de decisões:
+a checagem de secondaryLocations sozinha (laço com lower() por posting contra o índice) e a avaliação completa das
+regras das empresas com e sem o índice, sem memo de decisões para isolar o custo das regras.
+
+Uso: python -m benchmarks.bench_location_index
+"""
+import time
+
+from benchmarks.bench_decision_memo import COMPANIES, _postings
+from src.filters.location_index import LocationIndex
+from src.filters.rule_engine import compile_rules
+from src.mappers.job_mapper import iter_dicts_to_projections
+from src.services.filter_jobs_service import COMPANY_RULES
+
+ROUNDS = 3
+
+
+def _lower(value) -> str:
+    return (str(value) if value is not None else '').strip().lower()
+
+
+def _loop_check(projection) -> bool:
+    for location in projection.secondaryLocations or []:
+        if 'brazil' in _lower(location.get('locationName')):
+            return True
+    return False
+
+
+def _best(run) -> tuple:
+    timings, result = [], None
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        result = run()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main() -> None:
+    projections = list(iter_dicts_to_projections(_postings()))
+    index = LocationIndex()
+    indexed_check = index.matcher(('contains', 'brazil'), lambda name: 'brazil' in name)
+    direct_plan, indexed_plan = compile_rules(COMPANY_RULES), compile_rules(COMPANY_RULES, locations=LocationIndex())
+
+    scenarios = (
+        ('checagem secundária', lambda: [_loop_check(projection) for projection in projections],
+         lambda: [indexed_check(projection.secondaryLocations) for projection in projections]),
+        ('regras das empresas', lambda: [direct_plan.evaluate(projection, company) for company in COMPANIES for projection in projections],
+         lambda: [indexed_plan.evaluate(projection, company) for company in COMPANIES for projection in projections]),
+    )
+
+    print(f'{"cenário":>20} | {"laço":>8} | {"índice":>8} | {"speedup":>7} | idêntico?')
+    for label, direct, indexed in scenarios:
+        direct_time, expected = _best(direct)
+        indexed_time, result = _best(indexed)
+        print(f'{label:>20} | {direct_time:>6.3f} s | {indexed_time:>6.3f} s | {direct_time / indexed_time:>6.1f}x | {result == expected}')
+    print(f'índice: {index.get_stats()}')
+
+
+if __name__ == '__main__':
+    main()
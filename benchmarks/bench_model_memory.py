@@ -0,0 +1,104 @@
+"""Mede com tracemalloc a memória retida por Job, FriendlyJob e NormalizedJob em boards sintéticos de
+50 mil vagas, comparando os modelos com __slots__ (FriendlyJob como view sobre o Job) às versões antigas
+baseadas em __dict__, em que o FriendlyJob copiava os 22 campos.
+
+Uso: python -m benchmarks.bench_model_memory
+"""
+import gc
+import json
+import tracemalloc
+
+from src.models.friendly_job import FriendlyJob
+from src.models.job import Job
+from src.models.normalized_job import NormalizedJob
+
+BOARD_SIZES = (10_000, 50_000)
+
+
+class _DictJob:
+    __init__ = Job.__init__
+
+
+class _DictFriendlyJob(_DictJob):
+    def __init__(self, job, is_brazilian_friendly):
+        _DictJob.__init__(self, **{name: getattr(job, name, None) for name in Job.__slots__})
+        self.is_brazilian_friendly = is_brazilian_friendly
+
+    to_dict = FriendlyJob.to_dict
+
+
+class _DictNormalizedJob:
+    __init__ = NormalizedJob.__init__
+    to_dict = NormalizedJob.to_dict
+
+
+def _posting(index: int) -> dict:
+    return {
+        'id': f'job-{index}',
+        'title': f'Senior Software Engineer {index}',
+        'updatedAt': '2024-05-01T12:00:00.000Z',
+        'suppressDescriptionOpening': False,
+        'suppressDescriptionClosing': False,
+        'departmentId': f'dept-{index % 12}',
+        'departmentName': 'Engineering',
+        'locationId': f'loc-{index % 40}',
+        'locationName': 'Remote - Brazil' if index % 20 == 0 else 'San Francisco',
+        'workplaceType': 'Remote',
+        'employmentType': 'FullTime',
+        'isListed': True,
+        'jobId': f'req-{index}',
+        'jobRequisitionId': f'REQ-{index}',
+        'teamId': f'team-{index % 30}',
+        'teamName': 'Platform',
+        'publishedDate': '2024-04-01',
+        'applicationDeadline': None,
+        'shouldDisplayCompensationOnJobBoard': True,
+        'secondaryLocations': [{'locationId': f'loc-{index % 7}', 'locationName': 'Anywhere (LATAM)'}],
+        'compensationTierSummary': '$120K – $180K • Offers Equity',
+        'userRoles': [],
+    }
+
+
+def _normalized_kwargs(job) -> dict:
+    return {
+        'id': job.id, 'title': job.title, 'updated_at': job.updatedAt, 'employment_type': job.employmentType,
+        'published_date': job.publishedDate, 'application_deadline': job.applicationDeadline,
+        'compensation_tier_summary': job.compensationTierSummary, 'workplace_type': job.workplaceType, 'office_location': None,
+        'is_brazilian_friendly': job.is_brazilian_friendly, 'company': 'bench', 'url': f'https://jobs.ashbyhq.com/bench/{job.id}',
+        'seniority_level': 'Senior', 'field': 'Engineering',
+    }
+
+
+def _build(postings: list, job_class, friendly_class, normalized_class) -> tuple:
+    jobs = [job_class(**posting) for posting in postings]
+    friendly_jobs = [friendly_class(job, {'isFriendly': True, 'reason': 'global_filter'}) for job in jobs]
+    normalized_jobs = [normalized_class(**_normalized_kwargs(job)) for job in friendly_jobs]
+    return jobs, friendly_jobs, normalized_jobs
+
+
+def _retained_bytes(postings: list, job_class, friendly_class, normalized_class) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    models = _build(postings, job_class, friendly_class, normalized_class)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return models, retained, peak
+
+
+def main() -> None:
+    print(f'{"vagas":>7} | {"modelos":>9} | {"retido":>10} | {"pico":>10} | {"bytes/vaga":>10} | to_dict idêntico?')
+    for size in BOARD_SIZES:
+        postings = [_posting(index) for index in range(size)]
+        legacy, legacy_retained, legacy_peak = _retained_bytes(postings, _DictJob, _DictFriendlyJob, _DictNormalizedJob)
+        slotted, slotted_retained, slotted_peak = _retained_bytes(postings, Job, FriendlyJob, NormalizedJob)
+
+        identical = all(json.dumps(old.to_dict()) == json.dumps(new.to_dict())
+                        for stage in (1, 2) for old, new in zip(legacy[stage], slotted[stage]))
+
+        for label, retained, peak in (('__dict__', legacy_retained, legacy_peak), ('__slots__', slotted_retained, slotted_peak)):
+            print(f'{size:>7} | {label:>9} | {retained / 2 ** 20:>7.1f} MB | {peak / 2 ** 20:>7.1f} MB | {retained / size:>10.0f} | {identical}')
+        print(f'{"":>7} | economia: {1 - slotted_retained / legacy_retained:.0%}')
+
+
+if __name__ == '__main__':
+    main()
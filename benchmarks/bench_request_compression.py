@@ -0,0 +1,72 @@
+"""Compara custo de CPU e bytes economizados ao comprimir os payloads enviados para a API CRUD
+(vagas normalizadas em lotes de 1, 50 e 200), com gzip e, se instalado, zstd.
+
+Uso: python -m benchmarks.bench_request_compression
+"""
+import gzip
+import time
+
+from src.models.normalized_job import NormalizedJob
+from src.serialization import json_codec
+
+BATCH_SIZES = (1, 50, 200)
+GZIP_LEVELS = (1, 6, 9)
+ZSTD_LEVELS = (1, 3, 9)
+ROUNDS = 20
+
+
+def _normalized_job(index: int) -> dict:
+    return NormalizedJob(
+        id=f'5f1c2a4e-{index:04d}-4d2b-9c3e-1a2b3c4d5e6f',
+        title=f'Senior Software Engineer, Platform {index}',
+        updated_at='2025-06-01T12:00:00.000Z',
+        employment_type='FullTime',
+        published_date='2025-05-20',
+        application_deadline=None,
+        compensation_tier_summary='$120K – $180K • Offers Equity',
+        workplace_type='Remote',
+        office_location='Remote - LATAM' if index % 2 else 'São Paulo, Brazil',
+        is_brazilian_friendly={'isFriendly': True, 'reason': 'Location explicitly mentions Brazil'},
+        company='deel',
+        url=f'https://jobs.ashbyhq.com/deel/5f1c2a4e-{index:04d}-4d2b-9c3e-1a2b3c4d5e6f',
+        seniority_level='senior',
+        field='software engineering'
+    ).to_dict()
+
+
+def _compressors() -> list:
+    compressors = [(f'gzip-{level}', lambda body, level=level: gzip.compress(body, compresslevel=level, mtime=0)) for level in GZIP_LEVELS]
+    try:
+        import zstandard
+    except ImportError:
+        print('zstandard não instalado, ignorando zstd')
+        return compressors
+
+    for level in ZSTD_LEVELS:
+        compressors.append((f'zstd-{level}', zstandard.ZstdCompressor(level=level).compress))
+    return compressors
+
+
+def _best_of(function, body) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started_at = time.perf_counter()
+        function(body)
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def main() -> None:
+    compressors = _compressors()
+    print(f'{"batch":>5} | {"raw bytes":>9} | {"codec":>7} | {"compressed":>10} | {"saved":>6} | {"cpu":>8} | {"MB/s":>7}')
+    for batch_size in BATCH_SIZES:
+        body = json_codec.dumps([_normalized_job(index) for index in range(batch_size)])
+        for name, compress in compressors:
+            compressed = compress(body)
+            elapsed = _best_of(compress, body)
+            print(f'{batch_size:>5} | {len(body):>9} | {name:>7} | {len(compressed):>10} | {1 - len(compressed) / len(body):>6.0%} | '
+                  f'{elapsed * 1000:>6.3f}ms | {len(body) / elapsed / 1e6:>7.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Mede o custo de recarregar o arquivo de regras de filtro com 500 empresas sintéticas: a carga inicial
+(compila todos os conjuntos), um reload em que só uma empresa mudou e um reload em que as regras globais
+mudaram (todos os planos por empresa precisam ser refeitos, mas os conjuntos de regras não são recompilados).
+
+Uso: python -m benchmarks.bench_rule_reload
+"""
+import json
+import os
+import tempfile
+import time
+
+from src.filters.rule_store import RuleStore
+from src.services.filter_jobs_service import COMPANY_RULES
+
+COMPANIES = 500
+RELOADS = 20
+
+
+def _company_rules(index: int, pattern: str = 'latam') -> dict:
+    return {'default_reason': f'company_{index}_filter', 'rules': [
+        {'field': 'locationName', 'operator': 'contains', 'pattern': pattern, 'reason': f'[company_{index}_filter] LATAM'},
+        {'field': 'title', 'operator': 'regex', 'pattern': rf'\b(americas|us time zones?) {index}\b', 'reason': f'[company_{index}_filter] Americas'},
+        {'all': [{'field': 'title', 'operator': 'not_contains', 'pattern': '('},
+                 {'field': 'locationName', 'operator': 'equals', 'pattern': 'remote'}], 'reason': f'[company_{index}_filter] Remote'},
+    ]}
+
+
+def _write(path: str, spec: dict, version: int) -> None:
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(spec, file)
+    os.utime(path, ns=(version, version))
+
+
+def _timed_reloads(store: RuleStore, path: str, spec: dict, change) -> float:
+    elapsed = 0.0
+    for version in range(RELOADS):
+        _write(path, change(spec, version), version + 2)
+        started = time.perf_counter()
+        store.current()
+        elapsed += time.perf_counter() - started
+    return elapsed / RELOADS
+
+
+def main() -> None:
+    spec = {**COMPANY_RULES, **{f'company-{index}': _company_rules(index) for index in range(COMPANIES)}}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'filter_rules.json')
+        _write(path, spec, 1)
+        store = RuleStore({}, path)
+
+        started = time.perf_counter()
+        store.current()
+        initial = time.perf_counter() - started
+
+        one_company = _timed_reloads(store, path, spec, lambda spec, version: {**spec, 'company-7': _company_rules(7, f'latam {version}')})
+        compiled = store.recompiled_rule_sets
+
+        global_rules = _timed_reloads(store, path, spec, lambda spec, version: {
+            **spec, 'global': {**spec['global'], 'default_reason': f'global_filter_{version}'}})
+
+    print(f'{"cenário":>28} | {"tempo":>9} | conjuntos recompilados')
+    print(f'{"carga inicial":>28} | {initial * 1000:>6.1f} ms | {len(spec)}')
+    print(f'{"reload (1 empresa mudou)":>28} | {one_company * 1000:>6.1f} ms | {(compiled - len(spec)) / RELOADS:.0f} por reload')
+    print(f'{"reload (regras globais)":>28} | {global_rules * 1000:>6.1f} ms | {(store.recompiled_rule_sets - compiled) / RELOADS:.0f} por reload')
+
+
+if __name__ == '__main__':
+    main()
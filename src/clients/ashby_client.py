@@ -1,29 +1,149 @@
 import requests
 import os
 import logging
+import threading
 from dotenv import load_dotenv
 
 from requests import RequestException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.clients.rate_limiter import TokenBucketRateLimiter, parse_retry_after
+from src.models.board_page import BoardPage
+from src.parsers.app_data_parser import AppDataScanner
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
-def fetch_listings(company: str) -> str | None:
+RETRY_AFTER_STATUS_CODES = (429, 503)
+DEFAULT_RETRY_AFTER_SECONDS = 5.0
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    pool_size = int(os.getenv('ASHBY_POOL_SIZE', os.getenv('MAX_WORKERS', '4')))
+
+    # 429/503 are left to fetch_board_page, which pauses the shared rate limiter for the Retry-After time
+    retry_strategy = Retry(
+        total=3,
+        connect=3,
+        read=2,
+        status=0,
+        backoff_factor=1,
+        allowed_methods=["GET"],
+        respect_retry_after_header=False
+    )
+
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True, max_retries=retry_strategy)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    session.headers.update({
+        'Connection': 'keep-alive',
+        'User-Agent': 'ashby-job-extractor/1.0'
+    })
+
+    return session
+
+
+_rate_limiter = TokenBucketRateLimiter(float(os.getenv('ASHBY_RATE_LIMIT', '1')), int(os.getenv('ASHBY_BURST', '3')))
+_session = _create_session()
+_stream_stats_lock = threading.Lock()
+_stream_stats = {'streamedPages': 0, 'earlyTerminations': 0, 'bytesRead': 0, 'contentLength': 0}
+
+
+def get_rate_limiter_stats() -> dict:
+    return _rate_limiter.get_stats()
+
+
+def get_connection_stats() -> dict:
+    adapter = _session.get_adapter('https://')
+    pools = adapter.poolmanager.pools
+    connection_pools = [pools[key] for key in pools.keys()]
+
+    requests_sent = sum(pool.num_requests for pool in connection_pools)
+    new_connections = sum(pool.num_connections for pool in connection_pools)
+    return {
+        'requests': requests_sent,
+        'newConnections': new_connections,
+        'reusedConnections': max(0, requests_sent - new_connections)
+    }
+
+
+def get_stream_stats() -> dict:
+    with _stream_stats_lock:
+        return dict(_stream_stats)
+
+
+def _record_stream(bytes_read: int, content_length: int | None, terminated_early: bool) -> None:
+    with _stream_stats_lock:
+        _stream_stats['streamedPages'] += 1
+        _stream_stats['earlyTerminations'] += int(terminated_early)
+        _stream_stats['bytesRead'] += bytes_read
+        _stream_stats['contentLength'] += content_length or bytes_read
+
+
+def _stream_app_data(company: str, response: requests.Response) -> memoryview | None:
+    scanner = AppDataScanner()
+    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+        if scanner.feed(chunk):
+            break
+
+    bytes_read = response.raw.tell()
+    content_length = response.headers.get('Content-Length')
+    content_length = int(content_length) if content_length and content_length.isdigit() else None
+    terminated_early = scanner.complete and (content_length is None or bytes_read < content_length)
+    _record_stream(bytes_read, content_length, terminated_early)
+
+    logger.info(f'Streamed page for company: {company} | Bytes read: {bytes_read} | Content length: {content_length or "unknown"} | '
+                f'App data found: {scanner.complete}')
+    return scanner.result()
+
+
+def fetch_board_page(company: str, etag: str | None = None, last_modified: str | None = None) -> BoardPage | None:
     timeout = float(os.getenv('ASHBY_TIMEOUT'))
+    max_attempts = 1 + int(os.getenv('ASHBY_RETRY_AFTER_ATTEMPTS', '2'))
+    stream = os.getenv('ASHBY_STREAMING', 'false').lower() == 'true'
+
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
 
     try:
         logger.info(f'Fetching jobs from ashby for company: {company}')
-        response = requests.get(os.getenv('DEFAULT_URL') + company, timeout=timeout)
-
-        if response.ok:
-            logger.info(f'Jobs successfully fetched for company: {company}')
-            return response.text
-        else:
-            logger.info(f'Error getting jobs from ashby for company: {company} | Status code: {response.status_code}')
-            return None
+        for attempt in range(1, max_attempts + 1):
+            _rate_limiter.acquire()
+            response = _session.get(os.getenv('DEFAULT_URL') + company, headers=headers, timeout=timeout, stream=stream)
+
+            if response.status_code not in RETRY_AFTER_STATUS_CODES or attempt == max_attempts:
+                break
+
+            response.close()
+            retry_after = parse_retry_after(response.headers.get('Retry-After'), DEFAULT_RETRY_AFTER_SECONDS)
+            logger.warning(f'Ashby throttled request for company: {company} | Status code: {response.status_code} | Retrying in {retry_after:.1f}s')
+            _rate_limiter.pause(retry_after)
+
+        with response:
+            if response.status_code == 304:
+                logger.info(f'Jobs not modified since last run for company: {company}')
+                return BoardPage(None, etag, last_modified, not_modified=True)
+            elif response.ok and stream:
+                app_data = _stream_app_data(company, response)
+                logger.info(f'Jobs successfully fetched for company: {company}')
+                return BoardPage(None, response.headers.get('ETag'), response.headers.get('Last-Modified'), app_data=app_data)
+            elif response.ok:
+                logger.info(f'Jobs successfully fetched for company: {company}')
+                return BoardPage(response.text, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            else:
+                logger.info(f'Error getting jobs from ashby for company: {company} | Status code: {response.status_code}')
+                return None
     except RequestException as e:
         logger.error(f'[RequestException] Error getting jobs from ashby for company: {company} | Error {e}')
         return None
     except Exception as e:
         logger.exception(f'[UnexpectedException] Error getting jobs from ashby for company: {company} | Error {e}')
         return None
+
@@ -0,0 +1,128 @@
+import math
+import threading
+import time
+from typing import Callable, List
+
+
+def _percentile(samples: List[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(math.ceil(percentile * len(ordered))) - 1)]
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(self, max_limit: int, initial_limit: int = 1, min_limit: int = 1, backoff_ratio: float = 0.5,
+                 window_size: int = 20, latency_tolerance: float = 2.0, error_rate_threshold: float = 0.1,
+                 clock: Callable[[], float] = time.monotonic):
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError('Concurrency limits must satisfy 1 <= min_limit <= max_limit')
+        if not 0 < backoff_ratio < 1:
+            raise ValueError('Backoff ratio must be between zero and one')
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.window_size = window_size
+        self.latency_tolerance = latency_tolerance
+        self.error_rate_threshold = error_rate_threshold
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._limit = min(max(initial_limit, min_limit), max_limit)
+        self._in_flight = 0
+        self._successes_since_increase = 0
+        self._last_decrease_at = -math.inf
+        self._window_latencies = []
+        self._window_errors = 0
+        self._baseline_p95 = None
+        self._last_p95 = None
+        self.peak_limit = self._limit
+        self.total_requests = 0
+        self.throttled_requests = 0
+        self.rejected_requests = 0
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def acquire(self, timeout: float | None = None) -> float | None:
+        with self._condition:
+            if self._in_flight >= self._limit:
+                self.throttled_requests += 1
+                if not self._condition.wait_for(lambda: self._in_flight < self._limit, timeout):
+                    self.rejected_requests += 1
+                    return None
+
+            self._in_flight += 1
+            self.total_requests += 1
+            return self._clock()
+
+    def release(self, started_at: float, overloaded: bool = False, failed: bool = False) -> None:
+        latency = self._clock() - started_at
+
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded:
+                self._decrease(started_at)
+            else:
+                self._record(started_at, latency, failed)
+            self._condition.notify_all()
+
+    def backoff(self, started_at: float) -> None:
+        # For requests sent outside the slots, such as long uploads whose duration says nothing about the API's latency
+        with self._condition:
+            self._decrease(started_at)
+
+    def now(self) -> float:
+        return self._clock()
+
+    def _record(self, started_at: float, latency: float, failed: bool) -> None:
+        self._window_latencies.append(latency)
+        self._window_errors += int(failed)
+
+        if len(self._window_latencies) >= self.window_size:
+            p95 = _percentile(self._window_latencies, 0.95)
+            error_rate = self._window_errors / len(self._window_latencies)
+            self._window_latencies, self._window_errors = [], 0
+            self._last_p95 = p95
+
+            if self._baseline_p95 is None:
+                self._baseline_p95 = p95
+            elif error_rate > self.error_rate_threshold or p95 > self._baseline_p95 * self.latency_tolerance:
+                self._decrease(started_at)
+                return
+            else:
+                self._baseline_p95 = 0.8 * self._baseline_p95 + 0.2 * p95
+
+        if failed:
+            return
+
+        self._successes_since_increase += 1
+        if self._successes_since_increase >= self._limit and self._limit < self.max_limit:
+            self._limit += 1
+            self._successes_since_increase = 0
+            self.increases += 1
+            self.peak_limit = max(self.peak_limit, self._limit)
+
+    def _decrease(self, started_at: float) -> None:
+        if started_at <= self._last_decrease_at:
+            return
+
+        self._limit = max(self.min_limit, int(self._limit * self.backoff_ratio))
+        self._last_decrease_at = self._clock()
+        self._successes_since_increase = 0
+        self.decreases += 1
+
+    def get_stats(self) -> dict:
+        with self._condition:
+            return {
+                'limit': self._limit,
+                'peakLimit': self.peak_limit,
+                'inFlight': self._in_flight,
+                'totalRequests': self.total_requests,
+                'throttledRequests': self.throttled_requests,
+                'rejectedRequests': self.rejected_requests,
+                'increases': self.increases,
+                'decreases': self.decreases,
+                'p95Seconds': round(self._last_p95, 3) if self._last_p95 is not None else None
+            }
@@ -1,6 +1,10 @@
 import os
 import logging
-from typing import Optional
+import queue
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
 
 import requests
 from requests import Response
@@ -8,29 +12,57 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+from src.clients.concurrency_limiter import AdaptiveConcurrencyLimiter
+from src.clients.rate_limiter import parse_retry_after
+from src.models.enums.insert_status_enum import InsertStatusEnum
+from src.models.insert_result import InsertResult
+from src.serialization import json_codec
+from src.serialization.compression import BodyCompressor
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+BATCH_ENDPOINT = 'jobs/batch'
+BATCH_UNSUPPORTED_STATUS_CODES = (404, 405, 501)
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_DELETE_BATCH_SIZE = 25
+OVERLOAD_STATUS_CODES = (429, 503)
+OVERLOAD_BACKOFF_SECONDS = 1.0
+STREAM_ENDPOINT = 'jobs/stream'
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+DEFAULT_STREAM_BUFFER_RECORDS = 64
+
 class DatabaseClient:
     def __init__(self):
         self.api_url = os.getenv('API_URL')
         self.timeout = int(os.getenv('API_TIMEOUT', '30'))
+        self.pool_size = max(1, int(os.getenv('API_POOL_SIZE', '4')))
+        self.overload_retries = max(0, int(os.getenv('API_OVERLOAD_RETRIES', '3')))
+        self.compressor = BodyCompressor(os.getenv('API_COMPRESSION', 'none'), int(os.getenv('API_COMPRESSION_MIN_BYTES', '1024')))
+        self.limiter = AdaptiveConcurrencyLimiter(max_limit=self.pool_size,
+                                                  initial_limit=int(os.getenv('API_INITIAL_CONCURRENCY', '1')))
         self.session = self._create_session()
+        self.stream_session = self._create_session(retries=False)
+        self.batch_supported = True
+        self.delete_batch_supported = True
+        self.stream_supported = True
 
         if not self.api_url:
             raise ValueError("API_URL environment variable is required but not set")
 
-    def _create_session(self) -> requests.Session:
+    def _create_session(self, retries: bool = True) -> requests.Session:
         session = requests.Session()
 
+        # 429/503 go straight back to _make_request, so the AIMD limiter sees every overload before it is retried
         retry_strategy = Retry(
             total=3,
             backoff_factor=2,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"]
-        )
+            status_forcelist=[500, 502, 504],
+            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"],
+            respect_retry_after_header=False
+        ) if retries else Retry(total=0, raise_on_status=False)
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, pool_block=True, max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -41,20 +73,60 @@ class DatabaseClient:
 
         return session
 
-    def _make_request(self, method: str, endpoint: str, data: Optional[dict] = None) -> Response:
-        url = f'{self.api_url}/{endpoint.lstrip("/")}'
+    def _send(self, method: str, url: str, body: bytes | Iterator[bytes] | None, headers: dict,
+              session: requests.Session | None = None) -> Response:
+        started_at = self.limiter.acquire(timeout=self.timeout)
+        if started_at is None:
+            raise Exception(f'Timed out waiting for an API write slot after {self.timeout} seconds')
 
+        overloaded, failed = False, True
         try:
-            logger.debug(f'Making {method} request to {url}')
-            response = self.session.request(
+            response = (session or self.session).request(
                 method=method,
                 url=url,
-                json=data,
+                data=body,
+                headers=headers,
                 timeout=self.timeout
             )
-
-            logger.debug(f'Response status: {response.status_code}')
+            overloaded = response.status_code in OVERLOAD_STATUS_CODES
+            failed = response.status_code >= 500 and not overloaded
             return response
+        finally:
+            self.limiter.release(started_at, overloaded=overloaded, failed=failed)
+
+    def _send_unlimited(self, method: str, url: str, body: bytes | Iterator[bytes] | None, headers: dict,
+                        session: requests.Session | None = None) -> Response:
+        # Streaming uploads last as long as their producer, so they neither hold a write slot nor feed the latency window;
+        # an overload still halves the limit for the requests that go through the slots
+        started_at = self.limiter.now()
+        response = (session or self.session).request(method=method, url=url, data=body, headers=headers, timeout=self.timeout)
+        if response.status_code in OVERLOAD_STATUS_CODES:
+            self.limiter.backoff(started_at)
+        return response
+
+    def _overload_delay(self, response: Response, attempt: int) -> float:
+        retry_after = parse_retry_after(response.headers.get('Retry-After'), 0.0)
+        return retry_after + random.uniform(0, OVERLOAD_BACKOFF_SECONDS * 2 ** (attempt - 1))
+
+    def _make_request(self, method: str, endpoint: str, data: Optional[dict | list] = None) -> Response:
+        url = f'{self.api_url}/{endpoint.lstrip("/")}'
+        body, content_encoding = self.compressor.compress(json_codec.dumps(data) if data is not None else None)
+        headers = {'Content-Encoding': content_encoding} if content_encoding else {}
+
+        try:
+            for attempt in range(1, self.overload_retries + 2):
+                logger.debug(f'Making {method} request to {url}')
+                response = self._send(method, url, body, headers)
+                logger.debug(f'Response status: {response.status_code}')
+
+                if response.status_code not in OVERLOAD_STATUS_CODES or attempt > self.overload_retries:
+                    return response
+
+                delay = self._overload_delay(response, attempt)
+                logger.warning(f'API overloaded | Status code: {response.status_code} | Concurrency limit: {self.limiter.limit} | '
+                               f'Retrying {method} {url} in {delay:.2f}s')
+                response.close()
+                time.sleep(delay)
 
         except requests.exceptions.Timeout:
             logger.error(f'API timeout after {self.timeout} seconds: {url}')
@@ -66,17 +138,212 @@ class DatabaseClient:
             logger.error(f'Request failed: {url}: {e}')
             raise Exception(f'Request failed: {e}')
 
+    def _stream_request(self, endpoint: str, chunks: Iterator[bytes]) -> Response:
+        # A chunked body can only be consumed once, so it goes through a session without urllib3 retries
+        url = f'{self.api_url}/{endpoint.lstrip("/")}'
+        logger.debug(f'Streaming POST request to {url}')
+
+        try:
+            return self._send_unlimited('POST', url, chunks, {'Content-Type': NDJSON_CONTENT_TYPE}, session=self.stream_session)
+        except requests.exceptions.RequestException as e:
+            logger.error(f'Streaming upload failed: {url}: {e}')
+            raise Exception(f'Streaming upload failed: {e}')
+
 _client = DatabaseClient()
+_write_executor = ThreadPoolExecutor(max_workers=_client.pool_size, thread_name_prefix='db-write')
+
+def get_write_concurrency_stats() -> dict:
+    return _client.limiter.get_stats()
+
+def get_compression_stats() -> dict:
+    return _client.compressor.get_stats()
 
-def insert_job(job):
+def insert_job(job) -> InsertResult:
     response = _client._make_request('POST', 'jobs', job)
 
     if response.status_code == 304:
         logger.info(f'Job already exists in database: {job.get("title", "Unknown")}')
-        return
+        return InsertResult(job.get('id'), InsertStatusEnum.ALREADY_EXISTS)
     elif response.status_code == 201:
         logger.info(f'Job successfully inserted in database: {job.get("title", "Unknown")}')
-        return
+        return InsertResult(job.get('id'), InsertStatusEnum.INSERTED)
     elif not response.ok:
         logger.error(f'Error inserting job: {response.status_code} - {response.text}')
         raise Exception(f'Error inserting job: {response.status_code}')
+
+    return InsertResult(job.get('id'), InsertStatusEnum.INSERTED)
+
+def _batch_item_result(job_id: str, item: dict) -> InsertResult:
+    status_code = item.get('status')
+
+    if status_code == 201:
+        return InsertResult(job_id, InsertStatusEnum.INSERTED)
+    elif status_code == 304:
+        return InsertResult(job_id, InsertStatusEnum.ALREADY_EXISTS)
+
+    error = item.get('error') or f'Unexpected status: {status_code}'
+    logger.error(f'Error inserting job in batch: {job_id} | Error: {error}')
+    return InsertResult(job_id, InsertStatusEnum.FAILED, error=error)
+
+def _item_results(response: Response, job_ids: List[str]) -> List[InsertResult]:
+    body = json_codec.loads(response.content)
+    items = body.get('results') if isinstance(body, dict) else body
+    if not isinstance(items, list) or len(items) != len(job_ids):
+        raise Exception(f'Unexpected batch response: expected {len(job_ids)} results')
+
+    return [_batch_item_result(job_id, item) for job_id, item in zip(job_ids, items)]
+
+def _insert_batch(jobs: List[dict]) -> Optional[List[InsertResult]]:
+    response = _client._make_request('POST', BATCH_ENDPOINT, jobs)
+
+    if response.status_code in BATCH_UNSUPPORTED_STATUS_CODES:
+        logger.warning(f'Batch endpoint not supported by API, falling back to single inserts | Status code: {response.status_code}')
+        _client.batch_supported = False
+        return None
+    elif not response.ok:
+        logger.error(f'Error inserting jobs batch: {response.status_code} - {response.text}')
+        raise Exception(f'Error inserting jobs batch: {response.status_code}')
+
+    return _item_results(response, [job.get('id') for job in jobs])
+
+def _insert_safely(job: dict) -> InsertResult:
+    try:
+        return insert_job(job)
+    except Exception as e:
+        return InsertResult(job.get('id'), InsertStatusEnum.FAILED, error=str(e))
+
+def insert_jobs_concurrently(jobs: List[dict]) -> List[InsertResult]:
+    return list(_write_executor.map(_insert_safely, jobs))
+
+def insert_jobs_bulk(jobs: List[dict], batch_size: int | None = None) -> List[InsertResult]:
+    batch_size = max(1, batch_size or int(os.getenv('API_BATCH_SIZE', str(DEFAULT_BATCH_SIZE))))
+    results = []
+
+    for start in range(0, len(jobs), batch_size):
+        batch = jobs[start:start + batch_size]
+        batch_results = _insert_batch(batch) if _client.batch_supported else None
+        results.extend(batch_results if batch_results is not None else insert_jobs_concurrently(batch))
+
+    inserted = sum(1 for result in results if result.status == InsertStatusEnum.INSERTED)
+    existing = sum(1 for result in results if result.status == InsertStatusEnum.ALREADY_EXISTS)
+    logger.info(f'Bulk insert finished | Jobs: {len(results)} | Inserted: {inserted} | Already existed: {existing} | '
+                f'Failed: {len(results) - inserted - existing}')
+    return results
+
+_END_OF_STREAM = object()
+_ABORT_STREAM = object()
+
+class NdjsonUploadSink:
+    def __init__(self, buffer_records: int | None = None):
+        buffer_records = buffer_records or int(os.getenv('API_STREAM_BUFFER_RECORDS', str(DEFAULT_STREAM_BUFFER_RECORDS)))
+        self._chunks = queue.Queue(maxsize=max(1, buffer_records))
+        self._executor = None
+        self._upload = None
+        self.job_ids = []
+        self.results = None
+        self.upload_failed = False
+
+    def _body(self) -> Iterator[bytes]:
+        while (chunk := self._chunks.get()) is not _END_OF_STREAM:
+            if chunk is _ABORT_STREAM:
+                raise IOError('Streaming upload aborted by producer')
+            yield chunk
+
+    def _put(self, chunk) -> None:
+        while True:
+            try:
+                self._chunks.put(chunk, timeout=0.1)
+                return
+            except queue.Full:
+                if self._upload.done():
+                    _stream_results(self._upload.result(), self.job_ids)
+                    raise Exception('Streaming upload finished before all jobs were written')
+
+    def __enter__(self) -> 'NdjsonUploadSink':
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-stream')
+        self._upload = self._executor.submit(_client._stream_request, STREAM_ENDPOINT, self._body())
+        return self
+
+    def write(self, job: dict) -> None:
+        self._put(json_codec.dumps(job) + b'\n')
+        self.job_ids.append(job.get('id'))
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        try:
+            if exc_type is not None:
+                # An upload that already ended made the write fail; otherwise the producer failed and the upload is aborted
+                self.upload_failed = self._upload.done()
+                try:
+                    self._put(_ABORT_STREAM)
+                except Exception:
+                    pass
+                self._upload.exception()
+                return
+
+            try:
+                self._put(_END_OF_STREAM)
+                self.results = _stream_results(self._upload.result(), self.job_ids)
+            except Exception:
+                self.upload_failed = True
+                raise
+        finally:
+            self._executor.shutdown(wait=False)
+
+def _stream_results(response: Response, job_ids: List[str]) -> List[InsertResult]:
+    if response.status_code in BATCH_UNSUPPORTED_STATUS_CODES:
+        logger.warning(f'Streaming endpoint not supported by API, disabling streaming uploads | Status code: {response.status_code}')
+        _client.stream_supported = False
+        raise Exception(f'Streaming endpoint not supported by API: {response.status_code}')
+    elif not response.ok:
+        logger.error(f'Error streaming jobs: {response.status_code} - {response.text}')
+        raise Exception(f'Error streaming jobs: {response.status_code}')
+
+    results = _item_results(response, job_ids)
+    inserted = sum(1 for result in results if result.status == InsertStatusEnum.INSERTED)
+    existing = sum(1 for result in results if result.status == InsertStatusEnum.ALREADY_EXISTS)
+    logger.info(f'Streaming upload finished | Jobs: {len(results)} | Inserted: {inserted} | Already existed: {existing} | '
+                f'Failed: {len(results) - inserted - existing}')
+    return results
+
+def stream_upload_enabled() -> bool:
+    return os.getenv('API_STREAM_UPLOAD', 'false').lower() == 'true' and _client.stream_supported
+
+def _delete_batch(job_ids: List[str]) -> Optional[List[str]]:
+    response = _client._make_request('DELETE', BATCH_ENDPOINT, job_ids)
+
+    if response.status_code in BATCH_UNSUPPORTED_STATUS_CODES:
+        logger.warning(f'Batch delete not supported by API, falling back to single deletes | Status code: {response.status_code}')
+        _client.delete_batch_supported = False
+        return None
+    elif not response.ok:
+        logger.error(f'Error removing jobs batch: {response.status_code} - {response.text}')
+        return []
+
+    return job_ids
+
+def _delete_safely(job_id: str) -> bool:
+    try:
+        response = _client._make_request('DELETE', f'jobs/{job_id}')
+    except Exception as e:
+        logger.error(f'Error removing job: {job_id} | Error: {e}')
+        return False
+
+    if response.ok or response.status_code == 404:
+        return True
+
+    logger.error(f'Error removing job: {job_id} | Status code: {response.status_code}')
+    return False
+
+def delete_jobs(job_ids: List[str], batch_size: int | None = None) -> List[str]:
+    batch_size = max(1, batch_size or int(os.getenv('API_DELETE_BATCH_SIZE', str(DEFAULT_DELETE_BATCH_SIZE))))
+    removed = []
+
+    for start in range(0, len(job_ids), batch_size):
+        batch = job_ids[start:start + batch_size]
+        confirmed = _delete_batch(batch) if _client.delete_batch_supported else None
+        if confirmed is None:
+            confirmed = [job_id for job_id, deleted in zip(batch, _write_executor.map(_delete_safely, batch)) if deleted]
+        removed.extend(confirmed)
+
+    logger.info(f'Removed closed jobs from database | Requested: {len(job_ids)} | Removed: {len(removed)}')
+    return removed
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Callable
+
+
+class TokenBucketRateLimiter:
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        if rate <= 0:
+            raise ValueError('Rate limit must be greater than zero')
+        if burst < 1:
+            raise ValueError('Burst size must be at least one')
+
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+        self.total_requests = 0
+        self.throttled_requests = 0
+        self.throttled_seconds = 0.0
+        self.retry_after_pauses = 0
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+
+            wait = max(-self._tokens / self.rate, self._blocked_until - now, 0.0)
+            self.total_requests += 1
+            if wait > 0:
+                self.throttled_requests += 1
+                self.throttled_seconds += wait
+            return wait
+
+    def acquire(self) -> float:
+        wait = self._reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+            self.retry_after_pauses += 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                'totalRequests': self.total_requests,
+                'throttledRequests': self.throttled_requests,
+                'throttledSeconds': round(self.throttled_seconds, 3),
+                'retryAfterPauses': self.retry_after_pauses
+            }
+
+
+def parse_retry_after(value: str | None, default: float) -> float:
+    if not value:
+        return default
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,11 @@
+from typing import Any
+
+
+def lower_value(value: Any) -> str:
+    return (str(value) if value is not None else '').strip().lower()
+
+
+def attr_or_key(obj: Any, name: str) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
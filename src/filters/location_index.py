@@ -0,0 +1,86 @@
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, Set
+from dotenv import load_dotenv
+
+from src.filters.field_values import attr_or_key, lower_value
+
+load_dotenv()
+
+LOCATION_LIST_FIELD = 'secondaryLocations'
+LOCATION_NAME_FIELD = 'secondaryLocations.locationName'
+LOCATION_ID_KEY = 'locationId'
+LOCATION_NAME_KEY = 'locationName'
+
+
+class LocationIndex:
+    def __init__(self):
+        # Ashby location ids are unique across boards, so concurrent boards share one index and only ever add the same
+        # values; the match sets are keyed by normalized name, so companies listing the same location names reuse them
+        self._names: Dict[Hashable, str] = {}
+        self._decisions: Dict[Hashable, Dict[Hashable, bool]] = {}
+        self._matches: Dict[Hashable, Set[str]] = {}
+        self._misses: Dict[Hashable, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        # Ids are resolved again on every run, so a location renamed in Ashby is picked up by the next one
+        with self._lock:
+            self._names.clear()
+            for decisions in self._decisions.values():
+                decisions.clear()
+
+    def name(self, location: Any) -> str:
+        location_id = attr_or_key(location, LOCATION_ID_KEY)
+        name = self._names.get(location_id) if location_id is not None else None
+        if name is None:
+            name = lower_value(attr_or_key(location, LOCATION_NAME_KEY))
+            if location_id is not None:
+                self._names[location_id] = name
+        return name
+
+    def _decide(self, key: Hashable, test: Callable[[str], bool], location: Any) -> bool:
+        name = self.name(location)
+        matches, misses = self._matches[key], self._misses[key]
+        if name in matches:
+            return True
+        if name in misses:
+            return False
+        matched = bool(test(name))
+        (matches if matched else misses).add(name)
+        return matched
+
+    def matcher(self, key: Hashable, test: Callable[[str], bool]) -> Callable[[Iterable[Any] | None], bool]:
+        with self._lock:
+            decisions = self._decisions.setdefault(key, {})
+            self._matches.setdefault(key, set())
+            self._misses.setdefault(key, set())
+        decide = self._decide
+
+        def match(locations: Iterable[Any] | None) -> bool:
+            for location in locations or ():
+                location_id = location.get(LOCATION_ID_KEY) if type(location) is dict else getattr(location, LOCATION_ID_KEY, None)
+                matched = decisions.get(location_id)
+                if matched is None:
+                    matched = decide(key, test, location)
+                    if location_id is not None:
+                        decisions[location_id] = matched
+                if matched:
+                    return True
+            return False
+
+        return match
+
+    def get_stats(self) -> dict:
+        return {
+            'locations': len(self._names),
+            'names': len(set(self._names.values())),
+            'conditions': len(self._decisions)
+        }
+
+
+def location_index_enabled() -> bool:
+    return os.getenv('LOCATION_INDEX', 'true').lower() == 'true'
+
+
+location_index = LocationIndex()
@@ -0,0 +1,272 @@
+import hashlib
+import re
+from typing import Any, Callable, Dict, Iterable, Mapping, Tuple
+
+from src.filters.decision_memo import DecisionMemo
+from src.filters.field_values import attr_or_key, lower_value
+from src.filters.location_index import LOCATION_LIST_FIELD, LOCATION_NAME_FIELD, LocationIndex
+from src.matching.keyword_matcher import KeywordIndex
+
+GLOBAL_RULE_SET = 'global'
+LIST_FIELD_SEPARATOR = '.'
+KEYWORD_GROUP = 'rules'
+# Close to unique per posting, so rules reading them are evaluated directly instead of filling the decision memo
+DIRECT_FIELDS = frozenset(('title',))
+
+_MISSING = object()
+_KEYWORDS = 'keywords'
+_LOCATIONS = 'locations'
+
+_OPERATORS: Dict[str, Tuple[int, Callable[[str], Callable[[str], bool]]]] = {
+    'equals': (0, lambda pattern: pattern.__eq__),
+    'contains': (1, lambda pattern: lambda value: pattern in value),
+    'not_contains': (1, lambda pattern: lambda value: pattern not in value),
+    'regex': (2, lambda pattern: re.compile(pattern).search),
+}
+_LIST_OPERATORS = ('equals', 'contains', 'regex')
+_RULE_KEYS = frozenset(('field', 'operator', 'pattern', 'reason'))
+_ALL_RULE_KEYS = frozenset(('all', 'reason'))
+_RULE_SET_KEYS = frozenset(('default_reason', 'rules'))
+_KEYWORD_OPERATORS = ('contains', 'not_contains')
+
+
+def _check_keys(spec: Any, allowed: frozenset, what: str) -> None:
+    if not isinstance(spec, Mapping):
+        raise ValueError(f'{what} must be a mapping: {spec!r}')
+    unknown = set(spec) - allowed
+    if unknown:
+        raise ValueError(f'Unknown keys in {what}: {", ".join(sorted(map(str, unknown)))}')
+
+
+def _field_reader(field: str) -> Callable[[Any], Any]:
+    if LIST_FIELD_SEPARATOR not in field:
+        return lambda job: lower_value(getattr(job, field, None))
+
+    list_name, item_field = field.split(LIST_FIELD_SEPARATOR, 1)
+    return lambda job: tuple(lower_value(attr_or_key(item, item_field)) for item in getattr(job, list_name, None) or [])
+
+
+def _raw_reader(field: str) -> Callable[[Any], Any]:
+    if LIST_FIELD_SEPARATOR not in field:
+        return lambda job: getattr(job, field, None)
+
+    list_name, item_field = field.split(LIST_FIELD_SEPARATOR, 1)
+    return lambda job: tuple([item.get(item_field) if type(item) is dict else getattr(item, item_field, None)
+                              for item in getattr(job, list_name, None) or ()])
+
+
+def _key_reader(fields: Tuple[str, ...]) -> Callable[[Any], tuple]:
+    readers = tuple(_raw_reader(field) for field in fields)
+    if len(readers) == 1:
+        read = readers[0]
+        return lambda job: (read(job),)
+    if len(readers) == 2:
+        first, second = readers
+        return lambda job: (first(job), second(job))
+    return lambda job: tuple([read(job) for read in readers])
+
+
+def _keywords_reader(field: str, index: KeywordIndex) -> Callable[[Any, dict], Any]:
+    read_field = _field_reader(field)
+
+    def read(job: Any, lowered: dict) -> Any:
+        value = lowered.get(field, _MISSING)
+        if value is _MISSING:
+            value = lowered[field] = read_field(job)
+        if LIST_FIELD_SEPARATOR in field:
+            return frozenset().union(*map(index.find, value))
+        return index.find(value)
+
+    return read
+
+
+class _Condition:
+    __slots__ = ('field', 'operator', 'pattern', 'cost', 'test', 'item_test')
+
+    def __init__(self, spec: Mapping[str, Any]):
+        _check_keys(spec, _RULE_KEYS, 'rule condition')
+        field, operator, pattern = spec.get('field'), spec.get('operator'), spec.get('pattern')
+        if not isinstance(field, str) or not field:
+            raise ValueError(f'Rule condition needs a field: {dict(spec)}')
+        if operator not in _OPERATORS:
+            raise ValueError(f'Unknown rule operator: {operator}')
+        if not isinstance(pattern, str):
+            raise ValueError(f'Rule pattern must be a string: {dict(spec)}')
+
+        pattern = pattern if operator == 'regex' else pattern.lower()
+        cost, build = _OPERATORS[operator]
+        test = item_test = build(pattern)
+
+        if LIST_FIELD_SEPARATOR in field:
+            if operator not in _LIST_OPERATORS:
+                raise ValueError(f'Operator {operator} is not supported on list field: {field}')
+            cost += len(_OPERATORS)
+            test = lambda values: any(item_test(value) for value in values)
+
+        self.field = field
+        self.operator = operator
+        self.pattern = pattern
+        self.cost = cost
+        self.test = test
+        self.item_test = item_test
+
+    def keyword_test(self) -> Callable[[frozenset], bool]:
+        pattern = self.pattern
+        if self.operator == 'contains':
+            return lambda keywords: pattern in keywords
+        return lambda keywords: pattern not in keywords
+
+
+def _compile_rule(spec: Mapping[str, Any]) -> Tuple[Tuple[_Condition, ...], str]:
+    _check_keys(spec, _ALL_RULE_KEYS if 'all' in spec else _RULE_KEYS, 'rule')
+    reason = spec.get('reason')
+    if not isinstance(reason, str) or not reason:
+        raise ValueError(f'Rule needs a reason: {dict(spec)}')
+
+    if 'all' not in spec:
+        return (_Condition(spec),), reason
+
+    condition_specs = spec['all']
+    if not isinstance(condition_specs, list) or not condition_specs:
+        raise ValueError(f'Rule needs at least one condition: {reason}')
+
+    conditions = sorted((_Condition(condition) for condition in condition_specs), key=lambda condition: condition.cost)
+    return tuple(conditions), reason
+
+
+class CompiledRuleSet:
+    __slots__ = ('name', 'default_reason', 'rules', 'fields', 'keywords', 'memo_fields', 'memo_key', 'signature', '_readers', '_plan',
+                 '_all', '_memoized', '_direct', '_read_key')
+
+    def __init__(self, name: str, default_reason: str, rules: Iterable[Tuple[Tuple[_Condition, ...], str]],
+                 index: KeywordIndex | None = None, locations: LocationIndex | None = None):
+        self.name = name
+        self.default_reason = default_reason
+        self.rules = tuple(rules)
+        self.fields = tuple(dict.fromkeys(condition.field for conditions, _ in self.rules for condition in conditions))
+        self.keywords = frozenset(condition.pattern for conditions, _ in self.rules for condition in conditions
+                                  if condition.operator in _KEYWORD_OPERATORS)
+
+        self._readers = {field: (lambda job, lowered, read=_field_reader(field): read(job)) for field in self.fields}
+        if index is not None:
+            self._readers.update({(field, _KEYWORDS): _keywords_reader(field, index) for field in self.fields})
+        if locations is not None:
+            self._readers[(LOCATION_NAME_FIELD, _LOCATIONS)] = lambda job, lowered: getattr(job, LOCATION_LIST_FIELD, None)
+        self._plan = tuple((tuple(self._step(condition, index, locations) for condition in conditions), reason)
+                           for conditions, reason in self.rules)
+
+        # Each rule declares its inputs through its fields; rules that skip the direct fields can be memoized on them
+        self._all = tuple(range(len(self.rules)))
+        self._memoized = tuple(position for position, (conditions, _) in enumerate(self.rules)
+                               if not any(condition.field in DIRECT_FIELDS for condition in conditions))
+        self._direct = tuple(position for position in self._all if position not in self._memoized)
+        self.memo_fields = tuple(dict.fromkeys(condition.field for position in self._memoized for condition in self.rules[position][0]))
+        self._read_key = _key_reader(self.memo_fields)
+        # The memo stores the ordinal within the memoized rules, so the key only has to pin down those rules and their order
+        signature = repr([(ordinal, [(condition.field, condition.operator, condition.pattern) for condition in self.rules[position][0]],
+                           self.rules[position][1]) for ordinal, position in enumerate(self._memoized)])
+        self.memo_key = hashlib.sha256(signature.encode('utf-8')).hexdigest()[:16]
+        # The full signature changes with any rule or reason, so results computed under other rules can be told apart
+        signature = repr((self.default_reason, [([(condition.field, condition.operator, condition.pattern) for condition in conditions], reason)
+                                                for conditions, reason in self.rules]))
+        self.signature = hashlib.sha256(signature.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def _step(condition: _Condition, index: KeywordIndex | None, locations: LocationIndex | None) -> Tuple[Any, Callable[[Any], bool]]:
+        # Secondary locations are resolved by locationId and each condition remembers which location names it matched
+        if locations is not None and condition.field == LOCATION_NAME_FIELD:
+            matcher = locations.matcher((condition.operator, condition.pattern), condition.item_test)
+            return (condition.field, _LOCATIONS), matcher
+        # With a shared index each field is scanned once for every keyword, and the hits are cached per text for the other services
+        if index is not None and condition.operator in _KEYWORD_OPERATORS and condition.pattern:
+            return (condition.field, _KEYWORDS), condition.keyword_test()
+        return condition.field, condition.test
+
+    def _first_match(self, job: Any, positions: Tuple[int, ...], lowered: dict, limit: int = -1) -> int:
+        for position in positions:
+            if 0 <= limit < position:
+                break
+            for key, test in self._plan[position][0]:
+                value = lowered.get(key, _MISSING)
+                if value is _MISSING:
+                    value = lowered[key] = self._readers[key](job, lowered)
+                if not test(value):
+                    break
+            else:
+                return position
+        return -1
+
+    def evaluate(self, job: Any, memo: DecisionMemo | None = None) -> Tuple[bool, str]:
+        lowered = {}
+        if memo is None or not self._memoized:
+            position = self._first_match(job, self._all, lowered)
+        else:
+            # The memo holds the first matching memoized rule; direct rules only need checking up to its position
+            key = (self.memo_key, self._read_key(job))
+            ordinal = memo.get(key)
+            if ordinal is None:
+                memoized = self._first_match(job, self._memoized, lowered)
+                memo.put(key, self._memoized.index(memoized) if memoized >= 0 else -1)
+            else:
+                memoized = self._memoized[ordinal] if ordinal >= 0 else -1
+            position = self._first_match(job, self._direct, lowered, memoized)
+            if position < 0:
+                position = memoized
+
+        if position < 0:
+            return False, self.default_reason
+        return True, self._plan[position][1]
+
+
+def compile_rule_set(name: str, spec: Mapping[str, Any]) -> CompiledRuleSet:
+    _check_keys(spec, _RULE_SET_KEYS, f'rule set {name}')
+    default_reason = spec.get('default_reason')
+    if not isinstance(default_reason, str) or not default_reason:
+        raise ValueError(f'Rule set needs a default_reason: {name}')
+
+    rules = spec.get('rules')
+    if not isinstance(rules, list):
+        raise ValueError(f'Rule set rules must be a list: {name}')
+
+    return CompiledRuleSet(name, default_reason, [_compile_rule(rule) for rule in rules])
+
+
+class RulePlan:
+    def __init__(self, rule_sets: Dict[str, CompiledRuleSet], index: KeywordIndex | None = None, previous: 'RulePlan | None' = None,
+                 locations: LocationIndex | None = None):
+        if GLOBAL_RULE_SET not in rule_sets:
+            raise ValueError(f'Rule configuration needs a {GLOBAL_RULE_SET} rule set')
+
+        self.rule_sets = rule_sets
+        self.index = index
+        self.locations = locations
+        global_rules = rule_sets[GLOBAL_RULE_SET]
+        if index is not None:
+            index.register(KEYWORD_GROUP, frozenset().union(*(rule_set.keywords for rule_set in rule_sets.values())))
+
+        # Company plans embed the global rules, so they can only be reused while the global rule set is the same object
+        reusable = (previous is not None and previous.index is index and previous.locations is locations
+                    and previous.rule_sets[GLOBAL_RULE_SET] is global_rules)
+        self._global_plan = (previous._global_plan if reusable
+                             else CompiledRuleSet(GLOBAL_RULE_SET, global_rules.default_reason, global_rules.rules, index, locations))
+        self._company_plans = {}
+        for name, rule_set in rule_sets.items():
+            if name == GLOBAL_RULE_SET:
+                continue
+            if reusable and previous.rule_sets.get(name) is rule_set:
+                self._company_plans[name] = previous._company_plans[name]
+            else:
+                self._company_plans[name] = CompiledRuleSet(name, rule_set.default_reason, global_rules.rules + rule_set.rules, index, locations)
+
+    def for_company(self, company: str) -> CompiledRuleSet:
+        return self._company_plans.get(company) or self._global_plan
+
+    def evaluate(self, job: Any, company: str, memo: DecisionMemo | None = None) -> Tuple[bool, str]:
+        return self.for_company(company).evaluate(job, memo)
+
+
+def compile_rules(spec: Mapping[str, Mapping[str, Any]], index: KeywordIndex | None = None,
+                  locations: LocationIndex | None = None) -> RulePlan:
+    if not isinstance(spec, Mapping):
+        raise ValueError(f'Rule configuration must be a mapping of rule sets: {spec!r}')
+    return RulePlan({name: compile_rule_set(name, rule_set) for name, rule_set in spec.items()}, index, locations=locations)
@@ -0,0 +1,99 @@
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Mapping, Tuple
+
+from src.filters.rule_engine import CompiledRuleSet, RulePlan, compile_rule_set
+from src.filters.location_index import LocationIndex
+from src.matching.keyword_matcher import KeywordIndex
+
+logger = logging.getLogger(__name__)
+
+YAML_SUFFIXES = ('.yaml', '.yml')
+
+
+def load_rule_config(path: str) -> Any:
+    with open(path, 'rb') as file:
+        content = file.read()
+
+    if not path.lower().endswith(YAML_SUFFIXES):
+        return json.loads(content)
+
+    try:
+        import yaml
+    except ImportError as e:
+        raise ValueError(f'YAML rule files need the PyYAML package: {path}') from e
+    try:
+        return yaml.safe_load(content)
+    except yaml.YAMLError as e:
+        raise ValueError(f'Invalid YAML rule file: {path} | Error: {e}') from e
+
+
+class RuleStore:
+    def __init__(self, default_spec: Mapping[str, Mapping[str, Any]], path: str | None = None, index: KeywordIndex | None = None,
+                 locations: LocationIndex | None = None):
+        self.default_spec = default_spec
+        self.path = path
+        self.index = index
+        self.locations = locations
+        self.plan: RulePlan | None = None
+        self.reloads = 0
+        self.recompiled_rule_sets = 0
+        self._specs: Dict[str, Any] = {}
+        self._signature: Tuple[int, int] | None = None
+        self._lock = threading.Lock()
+
+    def _file_signature(self) -> Tuple[int, int] | None:
+        if not self.path:
+            return None
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return self._signature
+        return stat.st_mtime_ns, stat.st_size
+
+    def current(self) -> RulePlan:
+        # Callers keep the plan they got for the whole board, so a reload only affects the boards filtered after it
+        signature = self._file_signature()
+        if self.plan is None or signature != self._signature:
+            with self._lock:
+                if self.plan is None or signature != self._signature:
+                    self._reload(signature)
+        return self.plan
+
+    def _reload(self, signature: Tuple[int, int] | None) -> None:
+        try:
+            spec = load_rule_config(self.path) if self.path else self.default_spec
+            plan, changed = self._compile(spec)
+        except (OSError, ValueError) as e:
+            if self.plan is None:
+                raise
+            logger.error(f'Keeping previous filter rules, reload failed: {self.path} | Error: {e}')
+            self._signature = signature
+            return
+
+        if self.plan is not None:
+            self.reloads += 1
+            logger.info(f'Reloaded filter rules: {self.path} | Recompiled rule sets: {", ".join(changed) or "none"}')
+        self.recompiled_rule_sets += len(changed)
+        self._specs = {name: spec[name] for name in plan.rule_sets}
+        self._signature = signature
+        self.plan = plan
+
+    def _compile(self, spec: Any) -> Tuple[RulePlan, list]:
+        if not isinstance(spec, Mapping):
+            raise ValueError(f'Rule configuration must be a mapping of rule sets: {spec!r}')
+
+        rule_sets: Dict[str, CompiledRuleSet] = {}
+        changed = []
+        for name, rule_set_spec in spec.items():
+            if not isinstance(name, str) or not name:
+                raise ValueError(f'Rule set names must be non-empty strings: {name!r}')
+            if self.plan is not None and self._specs.get(name) == rule_set_spec:
+                rule_sets[name] = self.plan.rule_sets[name]
+            else:
+                rule_sets[name] = compile_rule_set(name, rule_set_spec)
+                changed.append(name)
+
+        return RulePlan(rule_sets, self.index, previous=self.plan, locations=self.locations), changed
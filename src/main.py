@@ -1,33 +1,162 @@
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 from dotenv import load_dotenv
 
-from src.services.jobs_service import get_jobs
+from src.clients import ashby_client, database_client
+from src.models.company_result import CompanyResult
+from src.models.enums.run_status_enum import RunStatusEnum
+from src.services.filter_jobs_service import get_decision_memo_stats, reset_location_index, save_decision_memo
+from src.services.jobs_service import get_jobs, replay_outbox
 
 load_dotenv()
 logging.basicConfig(format='%(asctime)s - %(levelname)s - %(message)s', level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def run() -> None:
-    companies = os.getenv('COMPANIES').split(',')
-    logger.info('Starting job extraction process')
+def _parse_companies() -> List[str]:
+    return [company.strip() for company in os.getenv('COMPANIES').split(',') if company.strip()]
 
-    for company in companies:
-        company = company.strip()
-        logger.info(f'Processing company: {company}')
-        get_jobs(company)
-        time.sleep(3)
-    
-    logger.info('Job extraction process completed successfully')
 
+def _process_company(company: str) -> CompanyResult:
+    logger.info(f'Processing company: {company}')
+    started_at = time.perf_counter()
 
-def main() -> None:
     try:
-        run()
+        result = get_jobs(company)
     except Exception as e:
-        logger.exception(f'Error during job extraction: {e}')
+        logger.exception(f'Error processing company: {company} | Error: {e}')
+        result = CompanyResult(company, RunStatusEnum.ERROR, error=str(e))
+
+    result.elapsed_seconds = time.perf_counter() - started_at
+    return result
+
+
+# Client and filter counters live as long as the process, so with RUN_INTERVAL_SECONDS each run logs what it added to them
+_RUN_COUNTERS = {
+    'throttling': ('totalRequests', 'throttledRequests', 'throttledSeconds', 'retryAfterPauses'),
+    'connections': ('requests', 'newConnections', 'reusedConnections'),
+    'writes': ('totalRequests', 'throttledRequests', 'rejectedRequests', 'increases', 'decreases'),
+    'compression': ('compressedBodies', 'rawBytes', 'compressedBytes'),
+    'memo': ('hits', 'misses', 'evictions'),
+    'streaming': ('streamedPages', 'earlyTerminations', 'bytesRead', 'contentLength'),
+}
+
+
+def _collect_stats() -> Dict[str, dict | None]:
+    return {
+        'throttling': ashby_client.get_rate_limiter_stats(),
+        'connections': ashby_client.get_connection_stats(),
+        'writes': database_client.get_write_concurrency_stats(),
+        'compression': database_client.get_compression_stats(),
+        'memo': get_decision_memo_stats(),
+        'streaming': ashby_client.get_stream_stats(),
+    }
+
+
+def _since(current: dict, baseline: dict, counters: Tuple[str, ...]) -> dict:
+    return {**current, **{key: round(current[key] - baseline[key], 3) for key in counters}}
+
+
+def _run_stats(baseline: Dict[str, dict | None] | None) -> Dict[str, dict | None]:
+    stats = _collect_stats()
+    if baseline is None:
+        return stats
+
+    stats = {name: _since(current, baseline[name], _RUN_COUNTERS[name]) if current and baseline[name] else current
+             for name, current in stats.items()}
+    if stats['memo'] is not None:
+        lookups = stats['memo']['hits'] + stats['memo']['misses']
+        stats['memo']['hitRatio'] = stats['memo']['hits'] / lookups if lookups else 0.0
+    return stats
+
+
+def _log_summary(results: List[CompanyResult], baseline: Dict[str, dict | None] | None = None) -> None:
+    logger.info('Job extraction summary:')
+    for result in results:
+        logger.info(f'  {result.company}: {result.status.value} | Listings: {result.total_jobs} | Friendly: {result.friendly_jobs} | '
+                    f'Saved: {result.saved_jobs} | Elapsed: {result.elapsed_seconds:.2f}s')
+
+    failed = sum(1 for result in results if result.status in (RunStatusEnum.ERROR, RunStatusEnum.PARTIAL_FAILURE))
+    saved = sum(result.saved_jobs for result in results)
+    skipped = sum(result.skipped_jobs for result in results)
+    spooled = sum(result.spooled_jobs for result in results)
+    failed_jobs = sum(result.failed_jobs for result in results)
+    removed = sum(result.removed_jobs for result in results)
+    logger.info(f'Companies processed: {len(results)} | Failed: {failed} | Jobs saved: {saved} | Jobs skipped (unchanged): {skipped} | '
+                f'Jobs spooled to outbox: {spooled} | Jobs failed to save: {failed_jobs} | Jobs removed: {removed}')
+
+    not_modified = sum(1 for result in results if result.status == RunStatusEnum.NOT_MODIFIED)
+    unchanged = sum(1 for result in results if result.status == RunStatusEnum.UNCHANGED)
+    cache_hit_ratio = not_modified / len(results) if results else 0.0
+    logger.info(f'Board cache | Not modified: {not_modified}/{len(results)} | Hit ratio: {cache_hit_ratio:.0%} | '
+                f'Unchanged content: {unchanged}')
+
+    stats = _run_stats(baseline)
+    throttling = stats['throttling']
+    logger.info(f'Ashby rate limiter | Requests: {throttling["totalRequests"]} | Throttled: {throttling["throttledRequests"]} | '
+                f'Time throttled: {throttling["throttledSeconds"]:.2f}s | Retry-After pauses: {throttling["retryAfterPauses"]}')
+
+    connections = stats['connections']
+    logger.info(f'Ashby connections | Requests: {connections["requests"]} | New: {connections["newConnections"]} | '
+                f'Reused: {connections["reusedConnections"]}')
+
+    writes = stats['writes']
+    logger.info(f'CRUD API concurrency | Limit: {writes["limit"]} (peak {writes["peakLimit"]}) | Requests: {writes["totalRequests"]} | '
+                f'Throttled: {writes["throttledRequests"]} | Rejected: {writes["rejectedRequests"]} | '
+                f'Increases: {writes["increases"]} | Decreases: {writes["decreases"]} | p95: {writes["p95Seconds"]}s')
+
+    compression = stats['compression']
+    if compression['compressedBodies']:
+        saved_ratio = 1 - compression['compressedBytes'] / compression['rawBytes']
+        logger.info(f'CRUD API compression | Encoding: {compression["encoding"]} | Bodies: {compression["compressedBodies"]} | '
+                    f'Bytes: {compression["rawBytes"]} -> {compression["compressedBytes"]} ({saved_ratio:.0%} saved)')
+
+    memo = stats['memo']
+    if memo is not None:
+        logger.info(f'Filter decision memo | Hits: {memo["hits"]} | Misses: {memo["misses"]} | Hit ratio: {memo["hitRatio"]:.0%} | '
+                    f'Entries: {memo["entries"]}/{memo["maxEntries"]} | Evictions: {memo["evictions"]}')
+
+    streaming = stats['streaming']
+    if streaming['streamedPages']:
+        logger.info(f'Ashby streaming | Pages: {streaming["streamedPages"]} | Early terminations: {streaming["earlyTerminations"]} | '
+                    f'Bytes read: {streaming["bytesRead"]} of {streaming["contentLength"]}')
+
+
+def run() -> List[CompanyResult]:
+    companies = _parse_companies()
+    max_workers = max(1, int(os.getenv('MAX_WORKERS', '4')))
+    logger.info(f'Starting job extraction process | Companies: {len(companies)} | Workers: {max_workers}')
+
+    baseline = _collect_stats()
+    reset_location_index()
+    replayed = replay_outbox()
+    if replayed:
+        logger.info(f'Delivered jobs from previous runs outbox: {replayed}')
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='company') as executor:
+        results = list(executor.map(_process_company, companies))
+
+    save_decision_memo()
+    _log_summary(results, baseline)
+    logger.info('Job extraction process completed successfully')
+    return results
+
+
+def main() -> None:
+    interval = float(os.getenv('RUN_INTERVAL_SECONDS', '0'))
+    while True:
+        try:
+            run()
+        except Exception as e:
+            logger.exception(f'Error during job extraction: {e}')
+
+        if interval <= 0:
+            return
+        logger.info(f'Next job extraction in {interval:.0f}s')
+        time.sleep(interval)
 
 
 if __name__ == '__main__':
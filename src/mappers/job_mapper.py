@@ -1,6 +1,7 @@
-from typing import Any, Iterable, List, Mapping, Union
+from typing import Any, Iterable, Iterator, List, Mapping, Union
 from src.models.job import Job
 from src.models.friendly_job import FriendlyJob
+from src.models.job_projection import JobProjection
 from src.models.normalized_job import NormalizedJob
 
 
@@ -47,6 +48,24 @@ def dicts_to_jobs(items: Iterable[Mapping[str, Any]]) -> List[Job]:
     return [_dict_to_job(item) for item in items]
 
 
+def _dict_to_projection(data: Mapping[str, Any]) -> JobProjection:
+    return JobProjection(
+        posting=data,
+        title=data.get('title'),
+        locationName=data.get('locationName'),
+        secondaryLocations=data.get('secondaryLocations') or [],
+    )
+
+
+def iter_dicts_to_projections(items: Iterable[Mapping[str, Any]]) -> Iterator[JobProjection]:
+    for item in items:
+        yield _dict_to_projection(item)
+
+
+def projection_to_friendly_job(projection: JobProjection) -> FriendlyJob:
+    return FriendlyJob(_dict_to_job(projection.posting), projection.is_brazilian_friendly)
+
+
 def dicts_to_friendly_jobs(items: Iterable[Mapping[str, Any]]) -> List[FriendlyJob]:
     return [_dict_to_friendly_job(item) for item in items]
 
@@ -0,0 +1,119 @@
+import logging
+import os
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, Tuple
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 8192
+
+
+def _build_automaton(keywords: Iterable[str]) -> Tuple[List[Callable[[str, int], int]], List[FrozenSet[str]]]:
+    goto, outputs = [{}], [set()]
+    for keyword in keywords:
+        state = 0
+        for char in keyword:
+            if char not in goto[state]:
+                goto[state][char] = len(goto)
+                goto.append({})
+                outputs.append(set())
+            state = goto[state][char]
+        outputs[state].add(keyword)
+
+    failure = [0] * len(goto)
+    order = []
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        order.append(state)
+        for char, next_state in goto[state].items():
+            queue.append(next_state)
+            fallback = failure[state]
+            while fallback and char not in goto[fallback]:
+                fallback = failure[fallback]
+            failure[next_state] = goto[fallback].get(char, 0) if state else 0
+            outputs[next_state] |= outputs[failure[next_state]]
+
+    # Folding the failure links into a full transition table keeps the scan at one dict lookup per character
+    alphabet = {char for transitions in goto for char in transitions}
+    table = [dict(goto[0])] + [{} for _ in order]
+    for state in order:
+        fallback = table[failure[state]]
+        for char in alphabet:
+            next_state = goto[state].get(char) or fallback.get(char, 0)
+            if next_state:
+                table[state][char] = next_state
+
+    return [transitions.get for transitions in table], [frozenset(output) for output in outputs]
+
+
+def _python_scanner(keywords: Iterable[str]) -> Callable[[str], FrozenSet[str]]:
+    transitions, outputs = _build_automaton(keywords)
+
+    def scan(text: str) -> FrozenSet[str]:
+        state, hits = 0, set()
+        for char in text:
+            state = transitions[state](char, 0)
+            if outputs[state]:
+                hits |= outputs[state]
+        return frozenset(hits)
+
+    return scan
+
+
+def _native_scanner(keywords: Iterable[str]) -> Callable[[str], FrozenSet[str]]:
+    import ahocorasick
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    if not len(automaton):
+        return lambda text: frozenset()
+    automaton.make_automaton()
+
+    return lambda text: frozenset([keyword for _, keyword in automaton.iter(text)])
+
+
+class KeywordMatcher:
+    def __init__(self, keywords: Iterable[str], cache_size: int = DEFAULT_CACHE_SIZE):
+        self.keywords = frozenset(keyword for keyword in keywords if keyword)
+        try:
+            self.backend, self.scan = 'ahocorasick', _native_scanner(sorted(self.keywords))
+        except ImportError:
+            self.backend, self.scan = 'python', _python_scanner(sorted(self.keywords))
+        self.find = lru_cache(maxsize=cache_size)(self.scan)
+
+    def get_stats(self) -> dict:
+        info = self.find.cache_info()
+        return {'backend': self.backend, 'keywords': len(self.keywords), 'hits': info.hits, 'misses': info.misses,
+                'cachedTexts': info.currsize}
+
+
+class KeywordIndex:
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._groups: Dict[str, FrozenSet[str]] = {}
+        self._lock = threading.Lock()
+        self.matcher = KeywordMatcher((), cache_size)
+
+    def register(self, group: str, keywords: Iterable[str]) -> None:
+        with self._lock:
+            self._groups[group] = frozenset(keywords)
+            keywords = frozenset().union(*self._groups.values())
+            if keywords != self.matcher.keywords:
+                self.matcher = KeywordMatcher(keywords, self.cache_size)
+                logger.info(f'Keyword index rebuilt with {len(keywords)} keywords from groups: {", ".join(sorted(self._groups))}')
+
+    def find(self, text: str) -> FrozenSet[str]:
+        return self.matcher.find(text)
+
+
+def keyword_index_enabled() -> bool:
+    return os.getenv('KEYWORD_INDEX', 'false').lower() == 'true'
+
+
+keyword_index = KeywordIndex(int(os.getenv('KEYWORD_INDEX_CACHE_SIZE', str(DEFAULT_CACHE_SIZE))))
@@ -0,0 +1,8 @@
+class BoardPage:
+    def __init__(self, text: str | None, etag: str | None = None, last_modified: str | None = None, not_modified: bool = False,
+                 app_data: memoryview | None = None):
+        self.text = text
+        self.etag = etag
+        self.last_modified = last_modified
+        self.not_modified = not_modified
+        self.app_data = app_data
@@ -0,0 +1,14 @@
+from typing import Iterable
+
+
+class BoardSnapshot:
+    def __init__(self, company: str, job_postings: Iterable[dict] | None, etag: str | None = None, last_modified: str | None = None,
+                 not_modified: bool = False, fingerprint: str | None = None, unchanged: bool = False, rules: str | None = None):
+        self.company = company
+        self.job_postings = job_postings
+        self.etag = etag
+        self.last_modified = last_modified
+        self.not_modified = not_modified
+        self.fingerprint = fingerprint
+        self.unchanged = unchanged
+        self.rules = rules
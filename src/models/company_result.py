@@ -0,0 +1,37 @@
+from src.models.enums.run_status_enum import RunStatusEnum
+
+
+class CompanyResult:
+    def __init__(self, company: str, status: RunStatusEnum, total_jobs: int = 0, friendly_jobs: int = 0, saved_jobs: int = 0,
+                 inserted_jobs: int = 0, existing_jobs: int = 0, skipped_jobs: int = 0, spooled_jobs: int = 0,
+                 failed_jobs: int = 0, removed_jobs: int = 0, elapsed_seconds: float = 0.0, error: str | None = None):
+        self.company = company
+        self.status = status
+        self.total_jobs = total_jobs
+        self.friendly_jobs = friendly_jobs
+        self.saved_jobs = saved_jobs
+        self.inserted_jobs = inserted_jobs
+        self.existing_jobs = existing_jobs
+        self.skipped_jobs = skipped_jobs
+        self.spooled_jobs = spooled_jobs
+        self.failed_jobs = failed_jobs
+        self.removed_jobs = removed_jobs
+        self.elapsed_seconds = elapsed_seconds
+        self.error = error
+
+    def to_dict(self) -> dict:
+        return {
+            'company': self.company,
+            'status': self.status.value,
+            'totalJobs': self.total_jobs,
+            'friendlyJobs': self.friendly_jobs,
+            'savedJobs': self.saved_jobs,
+            'insertedJobs': self.inserted_jobs,
+            'existingJobs': self.existing_jobs,
+            'skippedJobs': self.skipped_jobs,
+            'spooledJobs': self.spooled_jobs,
+            'failedJobs': self.failed_jobs,
+            'removedJobs': self.removed_jobs,
+            'elapsedSeconds': round(self.elapsed_seconds, 2),
+            'error': self.error
+        }
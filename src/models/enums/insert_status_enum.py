@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class InsertStatusEnum(Enum):
+    INSERTED = 'Inserted'
+    ALREADY_EXISTS = 'Already Exists'
+    SKIPPED = 'Skipped'
+    SPOOLED = 'Spooled'
+    FAILED = 'Failed'
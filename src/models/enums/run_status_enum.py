@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class RunStatusEnum(Enum):
+    SUCCESS = 'Success'
+    NOT_MODIFIED = 'Not Modified'
+    UNCHANGED = 'Unchanged'
+    NO_LISTINGS = 'No Listings'
+    NO_FRIENDLY_JOBS = 'No Friendly Jobs'
+    PARTIAL_FAILURE = 'Partial Failure'
+    ERROR = 'Error'
@@ -1,35 +1,40 @@
 from src.models.job import Job
 
 
-class FriendlyJob(Job):
+def _job_field(name: str) -> property:
+    return property(lambda self: getattr(self.job, name, None))
+
+
+class FriendlyJob:
+    __slots__ = ('job', 'is_brazilian_friendly')
+
+    id = _job_field('id')
+    title = _job_field('title')
+    updatedAt = _job_field('updatedAt')
+    suppressDescriptionOpening = _job_field('suppressDescriptionOpening')
+    suppressDescriptionClosing = _job_field('suppressDescriptionClosing')
+    departmentId = _job_field('departmentId')
+    departmentName = _job_field('departmentName')
+    locationId = _job_field('locationId')
+    locationName = _job_field('locationName')
+    workplaceType = _job_field('workplaceType')
+    employmentType = _job_field('employmentType')
+    isListed = _job_field('isListed')
+    jobId = _job_field('jobId')
+    jobRequisitionId = _job_field('jobRequisitionId')
+    teamId = _job_field('teamId')
+    teamName = _job_field('teamName')
+    publishedDate = _job_field('publishedDate')
+    applicationDeadline = _job_field('applicationDeadline')
+    shouldDisplayCompensationOnJobBoard = _job_field('shouldDisplayCompensationOnJobBoard')
+    secondaryLocations = _job_field('secondaryLocations')
+    compensationTierSummary = _job_field('compensationTierSummary')
+    userRoles = _job_field('userRoles')
+
     def __init__(self, job: Job, is_brazilian_friendly: dict | None):
-        super().__init__(
-            id=getattr(job, 'id', None),
-            title=getattr(job, 'title', None),
-            updatedAt=getattr(job, 'updatedAt', None),
-            suppressDescriptionOpening=getattr(job, 'suppressDescriptionOpening', None),
-            suppressDescriptionClosing=getattr(job, 'suppressDescriptionClosing', None),
-            departmentId=getattr(job, 'departmentId', None),
-            departmentName=getattr(job, 'departmentName', None),
-            locationId=getattr(job, 'locationId', None),
-            locationName=getattr(job, 'locationName', None),
-            workplaceType=getattr(job, 'workplaceType', None),
-            employmentType=getattr(job, 'employmentType', None),
-            isListed=getattr(job, 'isListed', None),
-            jobId=getattr(job, 'jobId', None),
-            jobRequisitionId=getattr(job, 'jobRequisitionId', None),
-            teamId=getattr(job, 'teamId', None),
-            teamName=getattr(job, 'teamName', None),
-            publishedDate=getattr(job, 'publishedDate', None),
-            applicationDeadline=getattr(job, 'applicationDeadline', None),
-            shouldDisplayCompensationOnJobBoard=getattr(job, 'shouldDisplayCompensationOnJobBoard', None),
-            secondaryLocations=getattr(job, 'secondaryLocations', None),
-            compensationTierSummary=getattr(job, 'compensationTierSummary', None),
-            userRoles=getattr(job, 'userRoles', None),
-        )
+        self.job = job
         self.is_brazilian_friendly = is_brazilian_friendly
 
-
     def to_dict(self) -> dict:
         return {
             'id': self.id,
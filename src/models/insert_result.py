@@ -0,0 +1,15 @@
+from src.models.enums.insert_status_enum import InsertStatusEnum
+
+
+class InsertResult:
+    def __init__(self, job_id: str | None, status: InsertStatusEnum, error: str | None = None):
+        self.job_id = job_id
+        self.status = status
+        self.error = error
+
+    def to_dict(self) -> dict:
+        return {
+            'jobId': self.job_id,
+            'status': self.status.value,
+            'error': self.error
+        }
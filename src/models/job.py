@@ -1,4 +1,8 @@
 class Job:
+    __slots__ = ('id', 'title', 'updatedAt', 'suppressDescriptionOpening', 'suppressDescriptionClosing', 'departmentId', 'departmentName',
+                 'locationId', 'locationName', 'workplaceType', 'employmentType', 'isListed', 'jobId', 'jobRequisitionId', 'teamId', 'teamName',
+                 'publishedDate', 'applicationDeadline', 'shouldDisplayCompensationOnJobBoard', 'secondaryLocations', 'compensationTierSummary', 'userRoles')
+
     def __init__(self, id: str, title: str, updatedAt: str, suppressDescriptionOpening: bool, suppressDescriptionClosing: bool, departmentId: str, departmentName: str,
                  locationId: str, locationName: str, workplaceType: str, employmentType: str, isListed: bool, jobId: str, jobRequisitionId: str, teamId: str, teamName: str,
                  publishedDate: str, applicationDeadline: str, shouldDisplayCompensationOnJobBoard: str, secondaryLocations: list, compensationTierSummary: str, userRoles: list):
@@ -0,0 +1,12 @@
+from typing import Any, Mapping
+
+
+class JobProjection:
+    __slots__ = ('posting', 'title', 'locationName', 'secondaryLocations', 'is_brazilian_friendly')
+
+    def __init__(self, posting: Mapping[str, Any], title: str | None, locationName: str | None, secondaryLocations: list):
+        self.posting = posting
+        self.title = title
+        self.locationName = locationName
+        self.secondaryLocations = secondaryLocations
+        self.is_brazilian_friendly = None
@@ -1,4 +1,7 @@
 class NormalizedJob:
+    __slots__ = ('id', 'title', 'updated_at', 'employment_type', 'published_date', 'deadline', 'compensation', 'workplace_type', 'office_location',
+                 'is_brazilian_friendly', 'company', 'url', 'seniority_level', 'field')
+
     def __init__(self, id: str, title: str, updated_at: str | None, employment_type: str | None, published_date: str | None, application_deadline: str | None,
                  compensation_tier_summary: str | None, workplace_type: str | None, office_location: str | None, is_brazilian_friendly: dict,
                  company: str, url: str, seniority_level: str | None, field: str | None):
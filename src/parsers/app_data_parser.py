@@ -0,0 +1,92 @@
+import re
+from typing import Tuple
+
+APP_DATA_ASSIGNMENT = r'window\.__appData\s*=\s*'
+JSON_BRACE = r'(?:[^"{}]++|"(?:[^"\\]++|\\.)*+")*+[{}]'
+
+_ASSIGNMENT_REGEX = re.compile(APP_DATA_ASSIGNMENT)
+_ASSIGNMENT_REGEX_BYTES = re.compile(APP_DATA_ASSIGNMENT.encode())
+_BRACE_REGEX = re.compile(JSON_BRACE, re.DOTALL)
+_BRACE_REGEX_BYTES = re.compile(JSON_BRACE.encode(), re.DOTALL)
+
+_OPEN_BRACE = ('{', ord('{'))
+_ASSIGNMENT_TAIL_BYTES = 64
+
+
+def _scan_braces(page, position: int, depth: int, brace_regex: re.Pattern) -> Tuple[int, int, bool]:
+    while brace := brace_regex.match(page, position):
+        position = brace.end()
+        if page[position - 1] in _OPEN_BRACE:
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return position, depth, True
+
+    return position, depth, False
+
+
+def find_app_data_span(page: str | bytes | bytearray | memoryview) -> Tuple[int, int] | None:
+    is_text = isinstance(page, str)
+    assignment_regex = _ASSIGNMENT_REGEX if is_text else _ASSIGNMENT_REGEX_BYTES
+    brace_regex = _BRACE_REGEX if is_text else _BRACE_REGEX_BYTES
+
+    # Like the scanner, skip assignments that are not followed by an object and use the next one
+    for assignment in assignment_regex.finditer(page):
+        start = assignment.end()
+        if start < len(page) and page[start] in _OPEN_BRACE:
+            end, _, complete = _scan_braces(page, start, 0, brace_regex)
+            return (start, end) if complete else None
+
+    return None
+
+
+def extract_app_data(page: str | bytes | bytearray | memoryview) -> str | memoryview | None:
+    span = find_app_data_span(page)
+    if span is None:
+        return None
+
+    start, end = span
+    if isinstance(page, str):
+        return page[start:end]
+    return memoryview(page)[start:end]
+
+
+class AppDataScanner:
+    def __init__(self):
+        self._buffer = bytearray()
+        self._found = False
+        self._position = 0
+        self._depth = 0
+        self.complete = False
+
+    def _find_assignment(self) -> bool:
+        while assignment := _ASSIGNMENT_REGEX_BYTES.search(self._buffer):
+            start = assignment.end()
+            if start >= len(self._buffer):
+                return False
+
+            del self._buffer[:start]
+            if self._buffer[0] in _OPEN_BRACE:
+                return True
+
+        del self._buffer[:-_ASSIGNMENT_TAIL_BYTES]
+        return False
+
+    def feed(self, chunk: bytes) -> bool:
+        if self.complete:
+            return True
+
+        self._buffer += chunk
+        if not self._found:
+            self._found = self._find_assignment()
+            if not self._found:
+                return False
+
+        self._position, self._depth, self.complete = _scan_braces(self._buffer, self._position, self._depth, _BRACE_REGEX_BYTES)
+        return self.complete
+
+    def result(self) -> memoryview | None:
+        if not self.complete:
+            return None
+        return memoryview(self._buffer)[:self._position]
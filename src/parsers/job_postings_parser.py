@@ -0,0 +1,152 @@
+import json
+import re
+from typing import Iterator
+
+from src.serialization import json_codec
+
+JOB_BOARD_KEY = 'jobBoard'
+JOB_POSTINGS_KEY = 'jobPostings'
+
+_WHITESPACE = r'[ \t\n\r]*+'
+_STRING = r'"(?:[^"\\]++|\\.)*+"'
+_SCALAR = r'[^,\]}\s]++'
+_CONTAINER = r'(?:[^"{}\[\]]++|"(?:[^"\\]++|\\.)*+")*+[{}\[\]]'
+
+
+class _Syntax:
+    def __init__(self, encode):
+        self.encode = encode
+        self.whitespace = re.compile(encode(_WHITESPACE))
+        self.string = re.compile(encode(_STRING), re.DOTALL)
+        self.scalar = re.compile(encode(_SCALAR))
+        self.container = re.compile(encode(_CONTAINER), re.DOTALL)
+        self.object_open, self.object_close = encode('{'), encode('}')
+        self.array_open, self.array_close = encode('['), encode(']')
+        self.quote, self.colon, self.comma, self.empty = encode('"'), encode(':'), encode(','), encode('')
+        self.openers = (self.object_open, self.array_open)
+
+
+_TEXT_SYNTAX = _Syntax(lambda value: value)
+_BYTES_SYNTAX = _Syntax(lambda value: value.encode())
+_DECODER = json.JSONDecoder()
+
+
+def _syntax_for(source) -> _Syntax:
+    return _TEXT_SYNTAX if isinstance(source, str) else _BYTES_SYNTAX
+
+
+def _char(source, position: int):
+    return source[position:position + 1]
+
+
+def _skip_whitespace(source, position: int, syntax: _Syntax) -> int:
+    return syntax.whitespace.match(source, position).end()
+
+
+def _expect(source, position: int, token, syntax: _Syntax) -> int:
+    position = _skip_whitespace(source, position, syntax)
+    if _char(source, position) != token:
+        raise ValueError(f'Expecting {token!r} at position {position}')
+    return position + 1
+
+
+def _skip_value(source, position: int, syntax: _Syntax) -> int:
+    char = _char(source, position)
+
+    if char == syntax.quote:
+        match = syntax.string.match(source, position)
+    elif char in syntax.openers:
+        depth = 0
+        while match := syntax.container.match(source, position):
+            position = match.end()
+            depth += 1 if _char(source, position - 1) in syntax.openers else -1
+            if depth == 0:
+                return position
+        raise ValueError('Unterminated JSON container')
+    else:
+        match = syntax.scalar.match(source, position)
+
+    if not match:
+        raise ValueError(f'Expecting value at position {position}')
+    return match.end()
+
+
+def _find_member(source, position: int, key: str, syntax: _Syntax) -> int:
+    position = _expect(source, position, syntax.object_open, syntax)
+    quoted_key = syntax.encode(f'"{key}"')
+
+    while True:
+        position = _skip_whitespace(source, position, syntax)
+        if _char(source, position) == syntax.object_close:
+            raise KeyError(key)
+
+        name = syntax.string.match(source, position)
+        if not name:
+            raise ValueError(f'Expecting property name enclosed in double quotes at position {position}')
+
+        position = _expect(source, name.end(), syntax.colon, syntax)
+        position = _skip_whitespace(source, position, syntax)
+        if source[name.start():name.end()] == quoted_key:
+            return position
+
+        position = _skip_whitespace(source, _skip_value(source, position, syntax), syntax)
+        if _char(source, position) == syntax.comma:
+            position += 1
+        elif _char(source, position) != syntax.object_close:
+            raise ValueError(f'Expecting \',\' delimiter at position {position}')
+
+
+class JobPostings:
+    def __init__(self, source: str | bytes | memoryview, start: int):
+        self._source = source
+        self._start = start
+        self._end = None
+
+    @classmethod
+    def from_app_data(cls, app_data: str | bytes | memoryview) -> 'JobPostings':
+        syntax = _syntax_for(app_data)
+
+        job_board = _find_member(app_data, 0, JOB_BOARD_KEY, syntax)
+        if _char(app_data, job_board) != syntax.object_open:
+            raise TypeError(f'{JOB_BOARD_KEY} is not an object')
+
+        job_postings = _find_member(app_data, job_board, JOB_POSTINGS_KEY, syntax)
+        if _char(app_data, job_postings) != syntax.array_open:
+            raise TypeError(f'{JOB_POSTINGS_KEY} is not an array')
+
+        return cls(app_data, job_postings)
+
+    @classmethod
+    def from_json(cls, payload: str | bytes | memoryview) -> 'JobPostings':
+        syntax = _syntax_for(payload)
+        start = _skip_whitespace(payload, 0, syntax)
+        if _char(payload, start) != syntax.array_open:
+            raise TypeError('Job postings payload is not an array')
+        return cls(payload, start)
+
+    def raw(self) -> str | bytes | memoryview:
+        if self._end is None:
+            self._end = _skip_value(self._source, self._start, _syntax_for(self._source))
+        return self._source[self._start:self._end]
+
+    def __iter__(self) -> Iterator[dict]:
+        source = self._source
+        syntax = _syntax_for(source)
+        position = self._start + 1
+
+        while True:
+            position = _skip_whitespace(source, position, syntax)
+            if _char(source, position) in (syntax.array_close, syntax.empty):
+                return
+
+            if syntax is _TEXT_SYNTAX:
+                posting, position = _DECODER.raw_decode(source, position)
+            else:
+                item_end = _skip_value(source, position, syntax)
+                posting = json_codec.loads(source[position:item_end])
+                position = item_end
+            yield posting
+
+            position = _skip_whitespace(source, position, syntax)
+            if _char(source, position) == syntax.comma:
+                position += 1
@@ -0,0 +1,75 @@
+import gzip
+import logging
+import threading
+from typing import Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+NO_COMPRESSION = 'none'
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def _gzip_compressor() -> Callable[[bytes], bytes]:
+    return lambda body: gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _zstd_compressor() -> Callable[[bytes], bytes]:
+    import zstandard
+
+    compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    lock = threading.Lock()
+
+    def compress(body: bytes) -> bytes:
+        with lock:
+            return compressor.compress(body)
+
+    return compress
+
+
+_COMPRESSOR_FACTORIES = {
+    'gzip': _gzip_compressor,
+    'zstd': _zstd_compressor,
+}
+
+
+class BodyCompressor:
+    def __init__(self, encoding: str = NO_COMPRESSION, min_bytes: int = 1024):
+        encoding = encoding.strip().lower()
+        if encoding != NO_COMPRESSION and encoding not in _COMPRESSOR_FACTORIES:
+            raise ValueError(f'Unknown request compression: {encoding}')
+
+        self._compress = None
+        if encoding != NO_COMPRESSION:
+            try:
+                self._compress = _COMPRESSOR_FACTORIES[encoding]()
+            except ImportError:
+                logger.warning(f'Compression backend not installed, falling back to gzip: {encoding}')
+                encoding, self._compress = 'gzip', _gzip_compressor()
+
+        self.encoding = encoding
+        self.min_bytes = min_bytes
+        self._lock = threading.Lock()
+        self.compressed_bodies = 0
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+
+    def compress(self, body: bytes | None) -> Tuple[bytes | None, str | None]:
+        if self._compress is None or body is None or len(body) < self.min_bytes:
+            return body, None
+
+        compressed = self._compress(body)
+        with self._lock:
+            self.compressed_bodies += 1
+            self.raw_bytes += len(body)
+            self.compressed_bytes += len(compressed)
+        return compressed, self.encoding
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                'encoding': self.encoding,
+                'compressedBodies': self.compressed_bodies,
+                'rawBytes': self.raw_bytes,
+                'compressedBytes': self.compressed_bytes
+            }
@@ -0,0 +1,95 @@
+import json
+import logging
+import os
+from typing import Any, Callable, Tuple
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+AUTO_BACKEND = 'auto'
+BACKEND_PRIORITY = ('orjson', 'msgspec', 'json')
+
+
+class JsonCodec:
+    def __init__(self, name: str, loads: Callable[[Any], Any], dumps: Callable[..., bytes]):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+
+def _stdlib_codec() -> JsonCodec:
+    def loads(data: Any) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), sort_keys=sort_keys).encode('utf-8')
+
+    return JsonCodec('json', loads, dumps)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+
+    return JsonCodec('orjson', orjson.loads, dumps)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+    sorted_encoder = msgspec.json.Encoder(order='sorted')
+
+    def loads(data: Any) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        return (sorted_encoder if sort_keys else encoder).encode(obj)
+
+    return JsonCodec('msgspec', loads, dumps)
+
+
+_CODEC_FACTORIES = {
+    'orjson': _orjson_codec,
+    'msgspec': _msgspec_codec,
+    'json': _stdlib_codec,
+}
+
+
+def create_codec(backend: str = AUTO_BACKEND) -> JsonCodec:
+    backend = backend.strip().lower()
+    if backend != AUTO_BACKEND and backend not in _CODEC_FACTORIES:
+        raise ValueError(f'Unknown JSON backend: {backend}')
+
+    candidates: Tuple[str, ...] = BACKEND_PRIORITY if backend == AUTO_BACKEND else (backend,)
+    for name in candidates:
+        try:
+            return _CODEC_FACTORIES[name]()
+        except ImportError:
+            logger.info(f'JSON backend not installed, trying next: {name}')
+
+    return _stdlib_codec()
+
+
+_codec = create_codec(os.getenv('JSON_BACKEND', AUTO_BACKEND))
+
+
+def backend_name() -> str:
+    return _codec.name
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    return _codec.loads(data)
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    return _codec.dumps(obj, sort_keys=sort_keys)
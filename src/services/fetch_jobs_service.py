@@ -1,39 +1,89 @@
-import re
-import json
+import os
+import hashlib
 import logging
-from typing import List, Optional
+from typing import Iterable, Mapping, Optional
+from dotenv import load_dotenv
 
-from src.mappers.job_mapper import dicts_to_jobs
 from src.clients import ashby_client
-from src.models.job import Job
+from src.models.board_page import BoardPage
+from src.models.board_snapshot import BoardSnapshot
+from src.parsers.app_data_parser import extract_app_data
+from src.parsers.job_postings_parser import JobPostings
+from src.serialization import json_codec
+from src.storage.board_cache import BoardCache
 
+load_dotenv()
 logger = logging.getLogger(__name__)
 
-APP_DATA_REGEX = re.compile(r'window\.__appData\s*=\s*({.*?});', re.DOTALL)
+_board_cache = BoardCache(os.path.join(os.getenv('STATE_DIR'), 'boards')) if os.getenv('STATE_DIR') else None
 
-def fetch_jobs(company: str) -> Optional[List[Job]]:
-    response = ashby_client.fetch_listings(company)
-    if not response:
+
+def _extract_job_postings(company: str, page: BoardPage) -> Optional[JobPostings]:
+    json_string = page.app_data if page.app_data is not None else extract_app_data(page.text)
+    if json_string is None:
+        logger.warning(f'App data not found in page for company: {company}')
+        return None
+
+    try:
+        return JobPostings.from_app_data(json_string)
+    except (KeyError, TypeError) as e:
+        logger.error(f'Unexpected app data structure for company: {company} | Error: {e}')
+        return None
+    except ValueError as e:
+        logger.error(f'Failed to parse app data JSON for company: {company} | Error: {e}')
+        return None
+
+
+def _fingerprint_job_postings(job_postings: Iterable[Mapping], rules: str | None = None) -> str:
+    digest = hashlib.sha256()
+    if rules is not None:
+        digest.update(rules.encode('utf-8'))
+        digest.update(b'\n')
+    for posting in job_postings:
+        digest.update(json_codec.dumps(posting, sort_keys=True))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def fetch_board(company: str, rules: str | None = None) -> Optional[BoardSnapshot]:
+    cached = _board_cache.get(company) if _board_cache else None
+    # A board filtered under other rules has to be processed again, so its validators are not sent
+    if cached and cached.get('rules') != rules:
+        logger.info(f'Filter rules changed since last run for company: {company}')
+        cached = None
+    etag = cached.get('etag') if cached else None
+    last_modified = cached.get('lastModified') if cached else None
+
+    page = ashby_client.fetch_board_page(company, etag, last_modified)
+    if page and page.not_modified:
+        return BoardSnapshot(company, None, etag, last_modified, not_modified=True, rules=rules)
+
+    if not page or (not page.text and page.app_data is None):
         logger.warning(f'No response content to extract for company: {company}')
         return None
 
-    match = APP_DATA_REGEX.search(response)
-    if not match:
-        logger.warning(f'App data not found in page for company: {company}')
+    job_postings = _extract_job_postings(company, page)
+    if job_postings is None:
         return None
 
-    json_string = match.group(1)
+    if not _board_cache:
+        return BoardSnapshot(company, job_postings, page.etag, page.last_modified, rules=rules)
 
+    # Postings are decoded lazily, so a malformed one only surfaces while they are fingerprinted
     try:
-        app_data = json.loads(json_string)
-        job_postings = app_data['jobBoard']['jobPostings']
-    except json.JSONDecodeError as e:
+        fingerprint = _fingerprint_job_postings(job_postings, rules)
+    except ValueError as e:
         logger.error(f'Failed to parse app data JSON for company: {company} | Error: {e}')
         return None
-    except (KeyError, TypeError) as e:
-        logger.error(f'Unexpected app data structure for company: {company} | Error: {e}')
-        return None
+    unchanged = cached is not None and cached.get('fingerprint') == fingerprint
+    return BoardSnapshot(company, job_postings, page.etag, page.last_modified, fingerprint=fingerprint, unchanged=unchanged, rules=rules)
+
+
+def save_board(board: BoardSnapshot) -> None:
+    if not _board_cache or board.not_modified:
+        return
+
+    job_postings = board.job_postings
+    _board_cache.put_payload(board.company, job_postings.raw() if isinstance(job_postings, JobPostings) else json_codec.dumps(job_postings))
+    _board_cache.update(board.company, etag=board.etag, lastModified=board.last_modified, fingerprint=board.fingerprint, rules=board.rules)
 
-    jobs: List[Job] = dicts_to_jobs(job_postings)
-    logger.info(f'Jobs successfully extracted for company: {company} | Total jobs: {len(jobs)}')
-    return jobs
\ No newline at end of file
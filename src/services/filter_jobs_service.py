@@ -1,10 +1,19 @@
 import logging
-from typing import Any, Iterable, List
+import os
+from typing import Iterable, List, Tuple
+from dotenv import load_dotenv
 
 from src.models.job import Job
 from src.models.friendly_job import FriendlyJob
-from src.mappers.job_mapper import job_to_friendly_job
-
+from src.models.job_projection import JobProjection
+from src.mappers.job_mapper import job_to_friendly_job, projection_to_friendly_job
+from src.filters.decision_memo import DecisionMemo
+from src.filters.location_index import location_index, location_index_enabled
+from src.filters.rule_engine import GLOBAL_RULE_SET, RulePlan
+from src.filters.rule_store import RuleStore
+from src.matching.keyword_matcher import keyword_index, keyword_index_enabled
+
+load_dotenv()
 logger = logging.getLogger(__name__)
 
 IS_BRAZILIAN_FRIENDLY_KEY = 'is_brazilian_friendly'
@@ -25,112 +34,119 @@ REASON_DEEL_DEFAULT = 'deel_filter'
 REASON_RESEND_MATCH = '[resend_filter] Americas in location'
 REASON_RESEND_DEFAULT = 'resend_filter'
 
-
-def _lower(value: Any) -> str:
-    return (str(value) if value is not None else '').strip().lower()
-
-
-def _attr_or_key(obj: Any, name: str, default: Any = None) -> Any:
-    if isinstance(obj, dict):
-        return obj.get(name, default)
-    return getattr(obj, name, default)
+COMPANY_RULES = {
+    GLOBAL_RULE_SET: {
+        'default_reason': REASON_GLOBAL_DEFAULT,
+        'rules': [
+            {'field': 'title', 'operator': 'contains', 'pattern': 'brazil', 'reason': REASON_GLOBAL_TITLE_OR_LOCATION},
+            {'field': 'locationName', 'operator': 'contains', 'pattern': 'brazil', 'reason': REASON_GLOBAL_TITLE_OR_LOCATION},
+            {'field': 'secondaryLocations.locationName', 'operator': 'contains', 'pattern': 'brazil', 'reason': REASON_GLOBAL_SECONDARY_LOCATION},
+        ],
+    },
+    'eightsleep': {
+        'default_reason': REASON_EIGHTSLEEP_DEFAULT,
+        'rules': [
+            {'field': 'locationName', 'operator': 'contains', 'pattern': 'latam', 'reason': REASON_EIGHTSLEEP_MATCH},
+        ],
+    },
+    'supabase': {
+        'default_reason': REASON_SUPABASE_DEFAULT,
+        'rules': [
+            {'field': 'title', 'operator': 'contains', 'pattern': 'americas', 'reason': REASON_SUPABASE_MATCH},
+            {'field': 'title', 'operator': 'contains', 'pattern': 'us time zones', 'reason': REASON_SUPABASE_MATCH},
+            {'all': [{'field': 'title', 'operator': 'not_contains', 'pattern': '('},
+                     {'field': 'locationName', 'operator': 'equals', 'pattern': 'remote'}],
+             'reason': REASON_SUPABASE_MATCH},
+        ],
+    },
+    'deel': {
+        'default_reason': REASON_DEEL_DEFAULT,
+        'rules': [
+            {'field': 'locationName', 'operator': 'contains', 'pattern': 'anywhere (latam)', 'reason': REASON_DEEL_MATCH},
+        ],
+    },
+    'resend': {
+        'default_reason': REASON_RESEND_DEFAULT,
+        'rules': [
+            {'field': 'locationName', 'operator': 'contains', 'pattern': 'americas', 'reason': REASON_RESEND_MATCH},
+        ],
+    },
+}
+
+
+def _create_rule_store() -> RuleStore:
+    return RuleStore(COMPANY_RULES, os.getenv('FILTER_RULES_FILE') or None, keyword_index if keyword_index_enabled() else None,
+                     location_index if location_index_enabled() else None)
+
+
+_rule_store = _create_rule_store()
+
+
+def _create_decision_memo() -> Tuple[DecisionMemo | None, str | None]:
+    max_entries = int(os.getenv('FILTER_MEMO_SIZE', '4096'))
+    if max_entries <= 0:
+        return None, None
+
+    memo = DecisionMemo(max_entries)
+    if not os.getenv('STATE_DIR') or os.getenv('FILTER_MEMO_PERSIST', 'false').lower() != 'true':
+        return memo, None
+
+    os.makedirs(os.getenv('STATE_DIR'), exist_ok=True)
+    path = os.path.join(os.getenv('STATE_DIR'), 'filter_decisions.json')
+    loaded = memo.load(path)
+    if loaded:
+        logger.info(f'Loaded filter decisions from previous runs: {loaded}')
+    return memo, path
+
+
+_decision_memo, _memo_path = _create_decision_memo()
 
 
 def _mark_brazilian_friendly(job_listing: FriendlyJob, is_friendly: bool, reason: str) -> None:
     setattr(job_listing, IS_BRAZILIAN_FRIENDLY_KEY, {'isFriendly': is_friendly, 'reason': reason})
 
 
-def _has_brazil_in_secondary_locations(job_listing: FriendlyJob) -> bool:
-    secondary_locations = getattr(job_listing, 'secondaryLocations', None) or []
-    for location in secondary_locations:
-        if 'brazil' in _lower(_attr_or_key(location, 'locationName')):
-            return True
-    return False
-
-
-def _global_filter(job_listing: FriendlyJob) -> bool:
-    title_lower = _lower(getattr(job_listing, 'title', None))
-    location_lower = _lower(getattr(job_listing, 'locationName', None))
-
-    if 'brazil' in title_lower or 'brazil' in location_lower:
-        _mark_brazilian_friendly(job_listing, True, REASON_GLOBAL_TITLE_OR_LOCATION)
-        return True
-
-    if _has_brazil_in_secondary_locations(job_listing):
-        _mark_brazilian_friendly(job_listing, True, REASON_GLOBAL_SECONDARY_LOCATION)
-        return True
-
-    _mark_brazilian_friendly(job_listing, False, REASON_GLOBAL_DEFAULT)
-    return False
-
-
-def _eightsleep_filter(job_listing: FriendlyJob) -> bool:
-    location_lower = _lower(getattr(job_listing, 'locationName', None))
-
-    if 'latam' in location_lower:
-        _mark_brazilian_friendly(job_listing, True, REASON_EIGHTSLEEP_MATCH)
-        return True
-
-    _mark_brazilian_friendly(job_listing, False, REASON_EIGHTSLEEP_DEFAULT)
-    return False
-
+def _filter_by_company(job_listing: FriendlyJob, company: str, rule_plan: RulePlan | None = None) -> bool:
+    is_friendly, reason = (rule_plan or _rule_store.current()).evaluate(job_listing, company, _decision_memo)
+    _mark_brazilian_friendly(job_listing, is_friendly, reason)
+    return is_friendly
 
-def _supabase_filter(job_listing: FriendlyJob) -> bool:
-    title_lower = _lower(getattr(job_listing, 'title', None))
-    location_lower = _lower(getattr(job_listing, 'locationName', None))
 
-    is_americas = 'americas' in title_lower or 'us time zones' in title_lower
-    is_global_remote = ('(' not in title_lower) and (location_lower == 'remote')
-
-    if is_americas or is_global_remote:
-        _mark_brazilian_friendly(job_listing, True, REASON_SUPABASE_MATCH)
-        return True
-
-    _mark_brazilian_friendly(job_listing, False, REASON_SUPABASE_DEFAULT)
-    return False
-
-
-def _deel_filter(job_listing: FriendlyJob) -> bool:
-    if 'anywhere (latam)' in _lower(getattr(job_listing, 'locationName', None)):
-        _mark_brazilian_friendly(job_listing, True, REASON_DEEL_MATCH)
-        return True
+def filter_brazilian_friendly_jobs(jobs: Iterable[Job | JobProjection], company: str) -> List[FriendlyJob]:
+    logger.info(f'Filtering brazilian friendly jobs for company: {company}')
 
-    _mark_brazilian_friendly(job_listing, False, REASON_DEEL_DEFAULT)
-    return False
+    brazilian_friendly_jobs: List[FriendlyJob] = []
+    rule_plan = _rule_store.current()
 
-def _resend_filter(job_listing: FriendlyJob) -> bool:
-    if 'americas' in _lower(getattr(job_listing, 'locationName', None)):
-        _mark_brazilian_friendly(job_listing, True, REASON_RESEND_MATCH)
-        return True
+    for job in jobs:
+        if isinstance(job, JobProjection):
+            if _filter_by_company(job, company, rule_plan):
+                brazilian_friendly_jobs.append(projection_to_friendly_job(job))
+            continue
 
-    _mark_brazilian_friendly(job_listing, False, REASON_RESEND_DEFAULT)
-    return False
+        mapped_job = job_to_friendly_job(job)
+        if _filter_by_company(mapped_job, company, rule_plan):
+            brazilian_friendly_jobs.append(mapped_job)
 
+    return brazilian_friendly_jobs
 
-def _filter_by_company(job_listing: FriendlyJob, company: str) -> bool:
-    if _global_filter(job_listing):
-        return True
 
-    if company == 'eightsleep':
-        return _eightsleep_filter(job_listing)
-    elif company == 'supabase':
-        return _supabase_filter(job_listing)
-    elif company == 'deel':
-        return _deel_filter(job_listing)
-    elif company == 'resend':
-        return _resend_filter(job_listing)
+def get_rule_signature(company: str) -> str:
+    return _rule_store.current().for_company(company).signature
 
-    return False
 
+def get_decision_memo_stats() -> dict | None:
+    return _decision_memo.get_stats() if _decision_memo is not None else None
 
-def filter_brazilian_friendly_jobs(jobs: Iterable[Job], company: str) -> List[FriendlyJob]:
-    logger.info(f'Filtering brazilian friendly jobs for company: {company}')
 
-    brazilian_friendly_jobs: List[FriendlyJob] = []
+def reset_location_index() -> None:
+    location_index.reset()
 
-    for job in jobs:
-        mapped_job = job_to_friendly_job(job)
-        if _filter_by_company(mapped_job, company):
-            brazilian_friendly_jobs.append(mapped_job)
 
-    return brazilian_friendly_jobs
\ No newline at end of file
+def save_decision_memo() -> None:
+    if _memo_path is None:
+        return
+    try:
+        _decision_memo.save(_memo_path)
+    except OSError as e:
+        logger.warning(f'Could not persist filter decision memo: {_memo_path} | Error: {e}')
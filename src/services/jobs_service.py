@@ -1,40 +1,316 @@
 import logging
+import os
+from collections import Counter, defaultdict
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+from dotenv import load_dotenv
 
-from src.clients.database_client import insert_job
-from src.services.fetch_jobs_service import fetch_jobs
-from src.services.filter_jobs_service import filter_brazilian_friendly_jobs
-from src.services.normalize_jobs_service import normalize_jobs
+from src.clients.database_client import (NdjsonUploadSink, delete_jobs, insert_jobs_bulk, insert_jobs_concurrently,
+                                         stream_upload_enabled)
+from src.mappers.job_mapper import iter_dicts_to_projections
+from src.models.company_result import CompanyResult
+from src.models.enums.insert_status_enum import InsertStatusEnum
+from src.models.enums.run_status_enum import RunStatusEnum
+from src.models.insert_result import InsertResult
+from src.models.friendly_job import FriendlyJob
+from src.models.job_projection import JobProjection
+from src.models.normalized_job import NormalizedJob
+from src.services.fetch_jobs_service import fetch_board, save_board
+from src.services.filter_jobs_service import filter_brazilian_friendly_jobs, get_rule_signature
+from src.services.normalize_jobs_service import iter_normalized_jobs, normalize_jobs
+from src.storage.job_fingerprint_store import JobFingerprintStore, fingerprint_job
+from src.storage.outbox import Outbox
 
+load_dotenv()
 logger = logging.getLogger(__name__)
 
-def _save_to_db(jobs) -> None:
+_fingerprint_store = JobFingerprintStore(os.path.join(os.getenv('STATE_DIR'), 'jobs.sqlite3')) if os.getenv('STATE_DIR') else None
+_outbox = Outbox(os.path.join(os.getenv('STATE_DIR'), 'outbox')) if os.getenv('STATE_DIR') else None
+
+_DELIVERED_STATUSES = (InsertStatusEnum.INSERTED, InsertStatusEnum.ALREADY_EXISTS)
+
+class _CountingIterator:
+    def __init__(self, items: Iterable[JobProjection]):
+        self._items = iter(items)
+        self.count = 0
+
+    def __iter__(self) -> Iterator[JobProjection]:
+        return self
+
+    def __next__(self) -> JobProjection:
+        item = next(self._items)
+        self.count += 1
+        return item
+
+
+def _iter_changed(jobs: Iterable[dict], known_fingerprints: Dict[str, str], fingerprints: Dict[str, str],
+                  skipped: List[InsertResult]) -> Iterator[dict]:
     for job in jobs:
-        insert_job(job.to_dict())
+        fingerprint = fingerprint_job(job)
+        if known_fingerprints.get(job['id']) == fingerprint:
+            skipped.append(InsertResult(job['id'], InsertStatusEnum.SKIPPED))
+        else:
+            fingerprints[job['id']] = fingerprint
+            yield job
+
+
+def _skip_unchanged(company: str, jobs: List[dict]) -> Tuple[List[dict], Dict[str, str], List[InsertResult]]:
+    known_fingerprints = _fingerprint_store.get(company)
+    fingerprints, skipped = {}, []
+    pending = list(_iter_changed(jobs, known_fingerprints, fingerprints, skipped))
+
+    changed = sum(1 for job_id in fingerprints if job_id in known_fingerprints)
+    logger.info(f'Job delta for company: {company} | Added: {len(pending) - changed} | Changed: {changed} | Unchanged: {len(skipped)}')
+    return pending, fingerprints, skipped
+
+
+def _record_saved(company: str, results: List[InsertResult], fingerprints: Dict[str, str]) -> None:
+    _fingerprint_store.put(company, {result.job_id: fingerprints[result.job_id] for result in results
+                                     if result.status in _DELIVERED_STATUSES and result.job_id in fingerprints})
+
+
+def _insert(jobs: List[dict]) -> List[InsertResult]:
+    if not jobs:
+        return []
+    if os.getenv('API_BULK_INSERT', 'false').lower() == 'true':
+        return insert_jobs_bulk(jobs)
+    return insert_jobs_concurrently(jobs)
+
+
+def _insert_or_spool(company: str, jobs: List[dict]) -> List[InsertResult]:
+    try:
+        results = _insert(jobs)
+    except Exception as e:
+        if _outbox is None:
+            raise
+        logger.error(f'Error saving jobs to database for company: {company} | Spooling {len(jobs)} jobs to outbox | Error: {e}')
+        results = [InsertResult(job['id'], InsertStatusEnum.FAILED, error=str(e)) for job in jobs]
+
+    return _spool_failed(company, jobs, results)
+
+
+def _spool_failed(company: str, jobs: List[dict], results: List[InsertResult]) -> List[InsertResult]:
+    if _outbox is None:
+        return results
+
+    failed_jobs = [job for job, result in zip(jobs, results) if result.status == InsertStatusEnum.FAILED]
+    if failed_jobs:
+        _outbox.append(company, failed_jobs)
+        logger.warning(f'Spooled failed jobs to outbox for company: {company} | Jobs: {len(failed_jobs)}')
+
+    return [InsertResult(result.job_id, InsertStatusEnum.SPOOLED, error=result.error) if result.status == InsertStatusEnum.FAILED else result
+            for result in results]
+
+
+def _save_to_db(jobs, company: str | None = None) -> List[InsertResult]:
+    job_dicts = [job.to_dict() for job in jobs]
+
+    if _fingerprint_store is None or company is None:
+        return _insert(job_dicts)
+
+    pending, fingerprints, skipped = _skip_unchanged(company, job_dicts)
+    results = _insert_or_spool(company, pending)
+    _record_saved(company, results, fingerprints)
+    return skipped + results
+
+
+def _stream_normalized(jobs: Iterable[NormalizedJob], company: str) -> List[InsertResult]:
+    fingerprints, skipped = {}, []
+    pending = (job.to_dict() for job in jobs)
+    if _fingerprint_store is not None:
+        pending = _iter_changed(pending, _fingerprint_store.get(company), fingerprints, skipped)
+    first_job = next(pending, None)
+
+    if first_job is None:
+        return skipped
+
+    # The outbox needs the records themselves, so they are only kept while it is enabled
+    sent, sink = [], NdjsonUploadSink()
+    try:
+        with sink:
+            for job in chain([first_job], pending):
+                if _outbox is not None:
+                    sent.append(job)
+                sink.write(job)
+        results = sink.results
+    except Exception as e:
+        # Producer errors and an endpoint the API lacks are raised; a failed upload is spooled like a failed in-memory save
+        if _outbox is None or not sink.upload_failed or not stream_upload_enabled():
+            raise
+        sent.extend(pending)
+        logger.error(f'Error streaming jobs to database for company: {company} | Spooling {len(sent)} jobs to outbox | Error: {e}')
+        results = [InsertResult(job['id'], InsertStatusEnum.FAILED, error=str(e)) for job in sent]
 
-def get_jobs(company: str) -> None:
-    all_job_listings = fetch_jobs(company)
+    results = _spool_failed(company, sent, results)
+    if _fingerprint_store is not None:
+        _record_saved(company, results, fingerprints)
+    return skipped + results
 
-    if not all_job_listings:
+
+def _stream_to_db(friendly_jobs: List[FriendlyJob], company: str) -> List[InsertResult]:
+    try:
+        return _stream_normalized(iter_normalized_jobs(friendly_jobs, company), company)
+    except Exception as e:
+        if stream_upload_enabled():
+            raise
+        logger.warning(f'Streaming upload unavailable, saving jobs in memory for company: {company} | Error: {e}')
+        return _save_to_db(normalize_jobs(friendly_jobs, company), company)
+
+
+def replay_outbox() -> int:
+    if _outbox is None:
+        return 0
+
+    pending = _outbox.pending()
+    if not pending:
+        return 0
+
+    batch_size = max(1, int(os.getenv('API_BATCH_SIZE', '50')))
+    logger.info(f'Replaying outbox before fresh work | Jobs: {len(pending)}')
+    delivered = 0
+
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        try:
+            results = _insert([job for _, job in batch])
+        except Exception as e:
+            logger.error(f'Error replaying outbox, keeping remaining jobs for next run | Error: {e}')
+            break
+
+        acknowledged = defaultdict(dict)
+        for (company, job), result in zip(batch, results):
+            if result.status in _DELIVERED_STATUSES:
+                acknowledged[company][job['id']] = fingerprint_job(job)
+
+        for company, fingerprints in acknowledged.items():
+            _outbox.ack(company, fingerprints)
+            _fingerprint_store.put(company, fingerprints)
+
+        batch_delivered = sum(len(fingerprints) for fingerprints in acknowledged.values())
+        delivered += batch_delivered
+        if not batch_delivered:
+            logger.error('Outbox replay batch failed entirely, keeping remaining jobs for next run')
+            break
+
+    _outbox.compact()
+    logger.info(f'Outbox replay finished | Delivered: {delivered} | Still pending: {len(pending) - delivered}')
+    return delivered
+
+def _sync_removals(company: str, current_job_ids: Set[str]) -> int:
+    if _fingerprint_store is None:
+        return 0
+
+    known_job_ids = _fingerprint_store.get(company)
+    closed_job_ids = [job_id for job_id in known_job_ids if job_id not in current_job_ids]
+    if not closed_job_ids:
+        return 0
+
+    if os.getenv('API_SYNC_REMOVALS', 'false').lower() != 'true':
+        logger.info(f'Closed jobs detected for company: {company} | Closed: {len(closed_job_ids)} | Removal sync disabled')
+        return 0
+
+    # Only Brazil friendly jobs are tracked, so for a company with a handful of them any closing looks like a mass removal;
+    # the guards below only apply from API_REMOVAL_GUARD_MIN_JOBS sent jobs on
+    guarded = len(known_job_ids) >= int(os.getenv('API_REMOVAL_GUARD_MIN_JOBS', '10'))
+
+    # An empty board or a filter change that matches nothing looks like every job closed at once, so mass removals wait for review
+    if guarded and not current_job_ids:
+        logger.warning(f'Skipping removals for company: {company} | Closed: {len(closed_job_ids)} | No current jobs left to keep')
+        return 0
+
+    max_share = float(os.getenv('API_MAX_REMOVAL_SHARE', '0.5'))
+    if guarded and len(closed_job_ids) > max_share * len(known_job_ids):
+        logger.warning(f'Skipping removals for company: {company} | Closed: {len(closed_job_ids)} of {len(known_job_ids)} | '
+                       f'Above API_MAX_REMOVAL_SHARE: {max_share:.0%}')
+        return 0
+
+    logger.info(f'Removing closed jobs for company: {company} | Removed: {len(closed_job_ids)}')
+    removed = delete_jobs(closed_job_ids)
+    _fingerprint_store.delete(company, removed)
+    return len(removed)
+
+def get_jobs(company: str) -> CompanyResult:
+    board = fetch_board(company, get_rule_signature(company))
+
+    if board is None:
+        logger.info(f'No listings returned for company: {company}')
+        return CompanyResult(company, RunStatusEnum.NO_LISTINGS)
+
+    if board.not_modified:
+        logger.info(f'Board not modified since last run, skipping company: {company}')
+        return CompanyResult(company, RunStatusEnum.NOT_MODIFIED)
+
+    if board.unchanged:
+        logger.info(f'Board content unchanged since last run, skipping company: {company}')
+        save_board(board)
+        return CompanyResult(company, RunStatusEnum.UNCHANGED)
+
+    all_job_listings = _CountingIterator(iter_dicts_to_projections(board.job_postings))
+    # Postings are decoded while they are filtered, so a malformed one fails the board here without touching stored jobs
+    try:
+        first_job = next(all_job_listings, None)
+        brazilian_friendly_jobs = (filter_brazilian_friendly_jobs(chain([first_job], all_job_listings), company)
+                                   if first_job is not None else None)
+    except ValueError as e:
+        logger.error(f'Failed to parse app data JSON for company: {company} | Error: {e}')
+        return CompanyResult(company, RunStatusEnum.NO_LISTINGS)
+
+    if first_job is None:
         logger.info(f'No listings returned for company: {company}')
-        return
+        removed = _sync_removals(company, set())
+        save_board(board)
+        return CompanyResult(company, RunStatusEnum.NO_LISTINGS, removed_jobs=removed)
+
+    total_jobs = all_job_listings.count
+    logger.info(f'Jobs successfully extracted for company: {company} | Total jobs: {total_jobs}')
 
-    brazilian_friendly_jobs = filter_brazilian_friendly_jobs(all_job_listings, company)
     if not brazilian_friendly_jobs:
         logger.info(f'No brazilian friendly jobs for company: {company}')
-        return
+        removed = _sync_removals(company, set())
+        save_board(board)
+        return CompanyResult(company, RunStatusEnum.NO_FRIENDLY_JOBS, total_jobs=total_jobs, removed_jobs=removed)
 
     logger.info(f'Filtered brazilian friendly jobs for company: {company} | Jobs found: {len(brazilian_friendly_jobs)}')
-    normalized_jobs = normalize_jobs(brazilian_friendly_jobs, company)
 
-    if not normalized_jobs:
-        logger.info(f'No normalized jobs for company: {company}')
-        return
+    streaming = stream_upload_enabled()
+    if streaming:
+        logger.info(f'Streaming {len(brazilian_friendly_jobs)} jobs to database for company: {company}')
+    else:
+        normalized_jobs = normalize_jobs(brazilian_friendly_jobs, company)
 
-    logger.info(f'Saving {len(normalized_jobs)} jobs to database for company: {company}')
+        if not normalized_jobs:
+            logger.info(f'No normalized jobs for company: {company}')
+            removed = _sync_removals(company, set())
+            save_board(board)
+            return CompanyResult(company, RunStatusEnum.NO_FRIENDLY_JOBS, total_jobs=total_jobs, removed_jobs=removed)
+
+        logger.info(f'Saving {len(normalized_jobs)} jobs to database for company: {company}')
 
     try:
-        _save_to_db(normalized_jobs)
-        logger.info(f'Successfully saved jobs to database for company: {company}')
+        if streaming:
+            insert_results = _stream_to_db(brazilian_friendly_jobs, company)
+        else:
+            insert_results = _save_to_db(normalized_jobs, company)
     except Exception as e:
         logger.exception(f'Error saving jobs to database for company: {company} | Error: {e}')
         raise
+
+    removed = _sync_removals(company, {insert_result.job_id for insert_result in insert_results})
+    outcomes = Counter(result.status for result in insert_results)
+    inserted, existing = outcomes[InsertStatusEnum.INSERTED], outcomes[InsertStatusEnum.ALREADY_EXISTS]
+    skipped, spooled, failed = outcomes[InsertStatusEnum.SKIPPED], outcomes[InsertStatusEnum.SPOOLED], outcomes[InsertStatusEnum.FAILED]
+    result = CompanyResult(company, RunStatusEnum.SUCCESS, total_jobs=total_jobs, friendly_jobs=len(brazilian_friendly_jobs),
+                           saved_jobs=inserted + existing, inserted_jobs=inserted, existing_jobs=existing, skipped_jobs=skipped,
+                           spooled_jobs=spooled, failed_jobs=failed, removed_jobs=removed)
+
+    if failed:
+        first_error = next(insert_result.error for insert_result in insert_results if insert_result.status == InsertStatusEnum.FAILED)
+        logger.error(f'Failed to save {failed} of {len(insert_results)} jobs for company: {company} | First error: {first_error}')
+        result.status = RunStatusEnum.PARTIAL_FAILURE
+        result.error = f'{failed} of {len(insert_results)} jobs failed to save: {first_error}'
+        return result
+
+    logger.info(f'Successfully saved jobs to database for company: {company} | Inserted: {inserted} | Already existed: {existing} | '
+                f'Skipped unchanged: {skipped} | Spooled to outbox: {spooled}')
+    save_board(board)
+    return result
@@ -1,9 +1,10 @@
 import logging
 import os
-from typing import List
+from typing import Iterable, Iterator, List
 from dotenv import load_dotenv
 
 from src.mappers.job_mapper import friendly_job_to_normalized_job
+from src.matching.keyword_matcher import keyword_index, keyword_index_enabled
 from src.models.enums.field_enum import FieldEnum
 from src.models.enums.seniority_enum import SeniorityEnum
 from src.models.friendly_job import FriendlyJob
@@ -12,6 +13,23 @@ from src.models.normalized_job import NormalizedJob
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+SENIORITY_KEYWORDS = ('staff', 'director', 'head', 'manager', 'senior', 'lead', 'tech lead', 'team lead', 'sr.', 'architect',
+                      'expert', 'junior', 'entry_level', 'associate', 'intern')
+FIELD_KEYWORDS = ('data', 's&m', 'data scientist', 'ml', 'machine learning', 'ai', 'design', 'ux', 'ui', 'product', 'support',
+                  'it ', 'qa', 'engineering', 'hardware', 'engineer', 'growth')
+
+KEYWORD_GROUP = 'normalize'
+
+
+def _register_keywords() -> bool:
+    if not keyword_index_enabled():
+        return False
+    keyword_index.register(KEYWORD_GROUP, SENIORITY_KEYWORDS + FIELD_KEYWORDS)
+    return True
+
+
+_use_keyword_index = _register_keywords()
+
 
 def _define_url(company: str, job_id: str) -> str:
     return f'{os.getenv('DEFAULT_URL')}{company.replace(' ', '%20')}/{job_id}'
@@ -22,16 +40,21 @@ def _set_seniority(job: NormalizedJob, seniority: SeniorityEnum) -> None:
 
 
 def _normalize_seniority(job: NormalizedJob) -> None:
-    title_lower = getattr(job, 'title', '').lower()
-
-    if ('staff' in title_lower or 'director' in title_lower or 'head' in title_lower  or ('manager' in title_lower and 'senior' not in title_lower) or
-            ('lead' in title_lower and not 'tech lead' in title_lower and not 'team lead' in title_lower)):
+    # For every registered keyword, `in` on the lowered text and `in` on its index hits give the same answer
+    title_keywords = getattr(job, 'title', '').lower()
+    if _use_keyword_index:
+        title_keywords = keyword_index.find(title_keywords)
+
+    if ('staff' in title_keywords or 'director' in title_keywords or 'head' in title_keywords or
+            ('manager' in title_keywords and 'senior' not in title_keywords) or
+            ('lead' in title_keywords and 'tech lead' not in title_keywords and 'team lead' not in title_keywords)):
         _set_seniority(job, SeniorityEnum.STAFF)
-    elif 'senior' in title_lower or 'sr.' in title_lower or 'lead' in title_lower or 'architect' in title_lower or 'expert' in title_lower:
+    elif ('senior' in title_keywords or 'sr.' in title_keywords or 'lead' in title_keywords or 'architect' in title_keywords or
+          'expert' in title_keywords):
         _set_seniority(job, SeniorityEnum.SENIOR)
-    elif 'junior' in title_lower or 'entry_level' in title_lower or 'associate' in title_lower:
+    elif 'junior' in title_keywords or 'entry_level' in title_keywords or 'associate' in title_keywords:
         _set_seniority(job, SeniorityEnum.JUNIOR)
-    elif 'intern' in title_lower:
+    elif 'intern' in title_keywords:
         _set_seniority(job, SeniorityEnum.INTERN)
     else:
         _set_seniority(job, SeniorityEnum.MID_LEVEL)
@@ -42,34 +65,40 @@ def _set_field(job: NormalizedJob, field: str) -> None:
 
 
 def _normalize_field(job: NormalizedJob) -> None:
-    department_lower = getattr(job, 'departmentName', '').lower()
-    title_lower = getattr(job, 'title', '').lower()
+    department_keywords = getattr(job, 'departmentName', '').lower()
+    title_keywords = getattr(job, 'title', '').lower()
+    if _use_keyword_index:
+        department_keywords, title_keywords = keyword_index.find(department_keywords), keyword_index.find(title_keywords)
 
-    if 'data' in department_lower or 's&m' in department_lower or 'data scientist' in title_lower:
+    if 'data' in department_keywords or 's&m' in department_keywords or 'data scientist' in title_keywords:
         _set_field(job, FieldEnum.DATA.value)
-    elif 'ml' in title_lower or 'machine learning' in title_lower or 'ai' in title_lower:
+    elif 'ml' in title_keywords or 'machine learning' in title_keywords or 'ai' in title_keywords:
         _set_field(job, FieldEnum.MACHINE_LEARNING.value)
-    elif 'design' in department_lower or 'ux' in title_lower or 'ui' in title_lower or 'design' in title_lower:
+    elif 'design' in department_keywords or 'ux' in title_keywords or 'ui' in title_keywords or 'design' in title_keywords:
         _set_field(job, FieldEnum.DESIGN.value)
-    elif 'product' in department_lower:
+    elif 'product' in department_keywords:
         _set_field(job, FieldEnum.PRODUCT.value)
-    elif 'support' in department_lower or 'it ' in title_lower or 'support' in title_lower:
+    elif 'support' in department_keywords or 'it ' in title_keywords or 'support' in title_keywords:
         _set_field(job, FieldEnum.SUPPORT.value)
-    elif 'qa' in title_lower:
+    elif 'qa' in title_keywords:
         _set_field(job, FieldEnum.QA.value)
-    elif ('engineering' in department_lower and not 'hardware' in department_lower) or ('engineer' in title_lower and not 'growth' in title_lower):
+    elif (('engineering' in department_keywords and 'hardware' not in department_keywords) or
+          ('engineer' in title_keywords and 'growth' not in title_keywords)):
         _set_field(job, FieldEnum.ENGINEERING.value)
     else:
         _set_field(job, FieldEnum.OTHER.value)
 
 
-def normalize_jobs(jobs: List[FriendlyJob], company: str) -> List[NormalizedJob]:
-    normalized_jobs = []
+def iter_normalized_jobs(jobs: Iterable[FriendlyJob], company: str) -> Iterator[NormalizedJob]:
     for job in jobs:
         normalized_job = friendly_job_to_normalized_job(job, company, _define_url(company, getattr(job, 'id')), None, None)
         _normalize_seniority(normalized_job)
         _normalize_field(normalized_job)
-        normalized_jobs.append(normalized_job)
+        yield normalized_job
+
+
+def normalize_jobs(jobs: Iterable[FriendlyJob], company: str) -> List[NormalizedJob]:
+    normalized_jobs = list(iter_normalized_jobs(jobs, company))
     logger.info(f'Normalized jobs for company: {company}')
 
-    return normalized_jobs
\ No newline at end of file
+    return normalized_jobs
@@ -0,0 +1,57 @@
+import json
+import logging
+import os
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+_SLUG_REGEX = re.compile(r'[^a-z0-9._-]+')
+
+
+class BoardCache:
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, company: str, suffix: str = 'json') -> str:
+        slug = _SLUG_REGEX.sub('-', company.strip().lower())
+        return os.path.join(self.directory, f'{slug}.{suffix}')
+
+    def get(self, company: str) -> dict | None:
+        try:
+            with open(self._path(company), encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable board cache entry for company: {company} | Error: {e}')
+            return None
+
+    def _write(self, path: str, content: bytes) -> None:
+        temp_path = f'{path}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(content)
+        os.replace(temp_path, path)
+
+    def put(self, company: str, entry: dict) -> None:
+        self._write(self._path(company), json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+
+    def get_payload(self, company: str) -> bytes | None:
+        try:
+            with open(self._path(company, 'postings.json'), 'rb') as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def put_payload(self, company: str, payload: str | bytes | memoryview) -> None:
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        self._write(self._path(company, 'postings.json'), bytes(payload))
+
+    def update(self, company: str, **fields) -> None:
+        with self._lock:
+            entry = self.get(company) or {}
+            entry.update(fields)
+            self.put(company, entry)
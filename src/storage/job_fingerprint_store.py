@@ -0,0 +1,64 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, Mapping
+
+from src.serialization import json_codec
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS job_fingerprints (
+        company TEXT NOT NULL,
+        job_id TEXT NOT NULL,
+        fingerprint TEXT NOT NULL,
+        PRIMARY KEY (company, job_id)
+    ) WITHOUT ROWID
+'''
+
+
+def fingerprint_job(job: Mapping) -> str:
+    return hashlib.sha256(json_codec.dumps(job, sort_keys=True)).hexdigest()
+
+
+class JobFingerprintStore:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+            self._connection.execute(_SCHEMA)
+
+    def get(self, company: str) -> Dict[str, str]:
+        with self._lock:
+            rows = self._connection.execute('SELECT job_id, fingerprint FROM job_fingerprints WHERE company = ?', (company,))
+            return dict(rows.fetchall())
+
+    def put(self, company: str, fingerprints: Mapping[str, str]) -> None:
+        if not fingerprints:
+            return
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT INTO job_fingerprints (company, job_id, fingerprint) VALUES (?, ?, ?) '
+                'ON CONFLICT (company, job_id) DO UPDATE SET fingerprint = excluded.fingerprint',
+                [(company, job_id, fingerprint) for job_id, fingerprint in fingerprints.items()]
+            )
+
+    def delete(self, company: str, job_ids: Iterable[str]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany('DELETE FROM job_fingerprints WHERE company = ? AND job_id = ?',
+                                         [(company, job_id) for job_id in job_ids])
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
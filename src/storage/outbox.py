@@ -0,0 +1,116 @@
+import logging
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+from src.serialization import json_codec
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+
+_SEGMENT_REGEX = re.compile(r'^segment-(\d{8})\.ndjson$')
+
+
+def _fsync_directory(directory: str) -> None:
+    descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+class Outbox:
+    def __init__(self, directory: str, segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _segments(self) -> List[Tuple[int, str]]:
+        segments = []
+        for name in os.listdir(self.directory):
+            match = _SEGMENT_REGEX.match(name)
+            if match:
+                segments.append((int(match.group(1)), os.path.join(self.directory, name)))
+        return sorted(segments)
+
+    def _segment_path(self, sequence: int) -> str:
+        return os.path.join(self.directory, f'segment-{sequence:08d}.ndjson')
+
+    def _writable_segment(self) -> str:
+        segments = self._segments()
+        if not segments:
+            return self._segment_path(1)
+
+        sequence, path = segments[-1]
+        if os.path.getsize(path) >= self.segment_max_bytes:
+            return self._segment_path(sequence + 1)
+        return path
+
+    def _append_records(self, records: List[dict]) -> None:
+        if not records:
+            return
+
+        content = b''.join(json_codec.dumps(record) + b'\n' for record in records)
+        with self._lock:
+            path = self._writable_segment()
+            created = not os.path.exists(path)
+            with open(path, 'ab') as file:
+                file.write(content)
+                file.flush()
+                os.fsync(file.fileno())
+            if created:
+                _fsync_directory(self.directory)
+
+    def append(self, company: str, jobs: Iterable[dict]) -> None:
+        self._append_records([{'op': 'put', 'company': company, 'job': job} for job in jobs])
+
+    def ack(self, company: str, job_ids: Iterable[str]) -> None:
+        self._append_records([{'op': 'ack', 'company': company, 'id': job_id} for job_id in job_ids])
+
+    def _read_pending(self) -> Dict[Tuple[str, str], dict]:
+        pending = {}
+        for _, path in self._segments():
+            with open(path, 'rb') as file:
+                for line_number, line in enumerate(file, start=1):
+                    try:
+                        record = json_codec.loads(line)
+                    except ValueError:
+                        logger.warning(f'Ignoring corrupted outbox record: {path}:{line_number}')
+                        continue
+
+                    if record.get('op') == 'put':
+                        key = (record['company'], record['job']['id'])
+                        pending.pop(key, None)
+                        pending[key] = record
+                    elif record.get('op') == 'ack':
+                        pending.pop((record['company'], record['id']), None)
+        return pending
+
+    def pending(self) -> List[Tuple[str, dict]]:
+        with self._lock:
+            return [(record['company'], record['job']) for record in self._read_pending().values()]
+
+    def compact(self) -> None:
+        with self._lock:
+            segments = self._segments()
+            if not segments:
+                return
+
+            pending = list(self._read_pending().values())
+            if pending:
+                path = self._segment_path(segments[-1][0] + 1)
+                temp_path = f'{path}.tmp'
+                with open(temp_path, 'wb') as file:
+                    file.write(b''.join(json_codec.dumps(record) + b'\n' for record in pending))
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temp_path, path)
+                _fsync_directory(self.directory)
+
+            for _, old_path in segments:
+                os.remove(old_path)
+            _fsync_directory(self.directory)
+            logger.info(f'Outbox compacted | Segments removed: {len(segments)} | Pending jobs: {len(pending)}')
@@ -0,0 +1,129 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class CrudStandIn:
+    """Servidor HTTP local que imita a API CRUD de vagas usada pelo DatabaseClient."""
+
+    def __init__(self, batch_supported: bool = True, failing_ids=(), stream_supported: bool = True, throttled_requests: int = 0):
+        self.batch_supported = batch_supported
+        self.throttled_requests = throttled_requests
+        self.stream_supported = stream_supported
+        self.failing_ids = set(failing_ids)
+        self.jobs = {}
+        self.requests = []
+        self.content_encodings = []
+        self.transfer_encodings = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self._server.server_address[1]}'
+
+    def __enter__(self) -> 'CrudStandIn':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _store(self, job: dict) -> dict:
+        if job.get('id') in self.failing_ids:
+            return {'id': job.get('id'), 'status': 422, 'error': 'Validation failed'}
+        with self._lock:
+            if job.get('id') in self.jobs:
+                return {'id': job.get('id'), 'status': 304}
+            self.jobs[job.get('id')] = job
+        return {'id': job.get('id'), 'status': 201}
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _reply(self, status: int, body: bytes = b'', headers: dict | None = None) -> None:
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _read_chunked(self) -> bytes:
+                body = b''
+                while (size := int(self.rfile.readline().split(b';')[0], 16)) > 0:
+                    body += self.rfile.read(size)
+                    self.rfile.readline()
+                self.rfile.readline()
+                return body
+
+            def _payload(self):
+                stand_in.transfer_encodings.append(self.headers.get('Transfer-Encoding'))
+                if self.headers.get('Transfer-Encoding') == 'chunked':
+                    body = self._read_chunked()
+                    if self.headers.get('Content-Type') == 'application/x-ndjson':
+                        return [json.loads(line) for line in body.splitlines() if line]
+                    return json.loads(body)
+
+                length = int(self.headers.get('Content-Length') or 0)
+                if not length:
+                    return None
+
+                body = self.rfile.read(length)
+                stand_in.content_encodings.append(self.headers.get('Content-Encoding'))
+                if self.headers.get('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
+                return json.loads(body)
+
+            def do_POST(self):
+                try:
+                    payload = self._payload()
+                except ValueError:
+                    self.close_connection = True
+                    return
+                stand_in.requests.append(('POST', self.path, payload))
+
+                with stand_in._lock:
+                    throttled = stand_in.throttled_requests > 0
+                    stand_in.throttled_requests -= int(throttled)
+                if throttled:
+                    self._reply(429, headers={'Retry-After': '0'})
+                elif self.path == '/jobs':
+                    result = stand_in._store(payload)
+                    self._reply(result['status'], json.dumps(result).encode() if result['status'] >= 400 else b'')
+                elif self.path == '/jobs/batch' and stand_in.batch_supported:
+                    results = [stand_in._store(job) for job in payload]
+                    self._reply(207, json.dumps({'results': results}).encode())
+                elif self.path == '/jobs/stream' and stand_in.stream_supported:
+                    results = [stand_in._store(job) for job in payload]
+                    self._reply(207, json.dumps({'results': results}).encode())
+                else:
+                    self._reply(404)
+
+            def do_DELETE(self):
+                payload = self._payload()
+                stand_in.requests.append(('DELETE', self.path, payload))
+
+                if self.path == '/jobs/batch' and stand_in.batch_supported:
+                    with stand_in._lock:
+                        for job_id in payload:
+                            stand_in.jobs.pop(job_id, None)
+                    self._reply(204)
+                elif self.path.startswith('/jobs/') and self.path != '/jobs/batch':
+                    with stand_in._lock:
+                        found = stand_in.jobs.pop(self.path[len('/jobs/'):], None) is not None
+                    self._reply(204 if found else 404)
+                else:
+                    self._reply(404)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -1,17 +1,30 @@
 import os
+import pytest
 import responses
 from unittest.mock import patch
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from requests.exceptions import RequestException, Timeout, ConnectionError
-from src.clients.ashby_client import fetch_listings
+from src.clients import ashby_client
+from src.clients.ashby_client import (
+    fetch_board_page, get_rate_limiter_stats, get_connection_stats, get_stream_stats, _create_session
+)
+from src.clients.rate_limiter import TokenBucketRateLimiter
 
 
 class TestAshbyClient:
+    @pytest.fixture(autouse=True)
+    def rate_limiter(self):
+        limiter = TokenBucketRateLimiter(1000, 1000, sleep=lambda seconds: None)
+        with patch("src.clients.ashby_client._rate_limiter", limiter):
+            yield limiter
+
     @responses.activate
     @patch.dict(os.environ, {
         "DEFAULT_URL": "https://jobs.ashbyhq.com/",
         "ASHBY_TIMEOUT": "30.0"
     })
-    def test_fetch_listings_success(self):
+    def test_fetch_board_page_success(self):
         responses.add(
             responses.GET,
             "https://jobs.ashbyhq.com/test-company",
@@ -19,23 +32,23 @@ class TestAshbyClient:
             status=200
         )
         
-        result = fetch_listings("test-company")
+        result = fetch_board_page("test-company")
         
-        assert result == "<html>job listings content</html>"
+        assert result.text == "<html>job listings content</html>"
 
     @responses.activate
     @patch.dict(os.environ, {
         "DEFAULT_URL": "https://jobs.ashbyhq.com/",
         "ASHBY_TIMEOUT": "30.0"
     })
-    def test_fetch_listings_http_error(self):
+    def test_fetch_board_page_http_error(self):
         responses.add(
             responses.GET,
             "https://jobs.ashbyhq.com/test-company",
             status=404
         )
         
-        result = fetch_listings("test-company")
+        result = fetch_board_page("test-company")
         
         assert result is None
 
@@ -43,11 +56,11 @@ class TestAshbyClient:
         "DEFAULT_URL": "https://jobs.ashbyhq.com/",
         "ASHBY_TIMEOUT": "30.0"
     })
-    @patch("requests.get")
-    def test_fetch_listings_request_exception(self, mock_get):
+    @patch("src.clients.ashby_client._session.get")
+    def test_fetch_board_page_request_exception(self, mock_get):
         mock_get.side_effect = RequestException("Network error")
         
-        result = fetch_listings("test-company")
+        result = fetch_board_page("test-company")
         
         assert result is None
 
@@ -55,11 +68,11 @@ class TestAshbyClient:
         "DEFAULT_URL": "https://jobs.ashbyhq.com/",
         "ASHBY_TIMEOUT": "30.0"
     })
-    @patch("requests.get")
-    def test_fetch_listings_timeout_exception(self, mock_get):
+    @patch("src.clients.ashby_client._session.get")
+    def test_fetch_board_page_timeout_exception(self, mock_get):
         mock_get.side_effect = Timeout("Request timeout")
         
-        result = fetch_listings("test-company")
+        result = fetch_board_page("test-company")
         
         assert result is None
 
@@ -67,11 +80,11 @@ class TestAshbyClient:
         "DEFAULT_URL": "https://jobs.ashbyhq.com/",
         "ASHBY_TIMEOUT": "30.0"
     })
-    @patch("requests.get")
-    def test_fetch_listings_connection_error(self, mock_get):
+    @patch("src.clients.ashby_client._session.get")
+    def test_fetch_board_page_connection_error(self, mock_get):
         mock_get.side_effect = ConnectionError("Connection failed")
         
-        result = fetch_listings("test-company")
+        result = fetch_board_page("test-company")
         
         assert result is None
 
@@ -79,11 +92,11 @@ class TestAshbyClient:
         "DEFAULT_URL": "https://jobs.ashbyhq.com/",
         "ASHBY_TIMEOUT": "30.0"
     })
-    @patch("requests.get")
-    def test_fetch_listings_unexpected_exception(self, mock_get):
+    @patch("src.clients.ashby_client._session.get")
+    def test_fetch_board_page_unexpected_exception(self, mock_get):
         mock_get.side_effect = ValueError("Unexpected error")
         
-        result = fetch_listings("test-company")
+        result = fetch_board_page("test-company")
         
         assert result is None
 
@@ -92,7 +105,7 @@ class TestAshbyClient:
         "DEFAULT_URL": "https://jobs.ashbyhq.com/",
         "ASHBY_TIMEOUT": "15.5"
     })
-    def test_fetch_listings_custom_timeout(self):
+    def test_fetch_board_page_custom_timeout(self):
         responses.add(
             responses.GET,
             "https://jobs.ashbyhq.com/custom-company",
@@ -100,6 +113,195 @@ class TestAshbyClient:
             status=200
         )
         
-        result = fetch_listings("custom-company")
+        result = fetch_board_page("custom-company")
+
+        assert result.text == "content"
+
+    @responses.activate
+    @patch.dict(os.environ, {
+        "DEFAULT_URL": "https://jobs.ashbyhq.com/",
+        "ASHBY_TIMEOUT": "30.0"
+    })
+    def test_fetch_board_page_honors_retry_after(self, rate_limiter):
+        responses.add(responses.GET, "https://jobs.ashbyhq.com/test-company", status=429, headers={"Retry-After": "2"})
+        responses.add(responses.GET, "https://jobs.ashbyhq.com/test-company", body="content", status=200)
+
+        result = fetch_board_page("test-company")
+
+        assert result.text == "content"
+        assert len(responses.calls) == 2
+        assert rate_limiter.get_stats()["retryAfterPauses"] == 1
+        assert rate_limiter.get_stats()["throttledSeconds"] >= 1.9
+
+    @responses.activate
+    @patch.dict(os.environ, {
+        "DEFAULT_URL": "https://jobs.ashbyhq.com/",
+        "ASHBY_TIMEOUT": "30.0",
+        "ASHBY_RETRY_AFTER_ATTEMPTS": "1"
+    })
+    def test_fetch_board_page_gives_up_after_retry_attempts(self):
+        responses.add(responses.GET, "https://jobs.ashbyhq.com/test-company", status=503)
+
+        result = fetch_board_page("test-company")
+
+        assert result is None
+        assert len(responses.calls) == 2
+
+    def test_get_rate_limiter_stats(self, rate_limiter):
+        assert get_rate_limiter_stats() == rate_limiter.get_stats()
+
+    @responses.activate
+    @patch.dict(os.environ, {
+        "DEFAULT_URL": "https://jobs.ashbyhq.com/",
+        "ASHBY_TIMEOUT": "30.0"
+    })
+    def test_fetch_board_page_returns_validators(self):
+        responses.add(
+            responses.GET,
+            "https://jobs.ashbyhq.com/test-company",
+            body="content",
+            status=200,
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        )
+
+        page = fetch_board_page("test-company")
+
+        assert page.text == "content"
+        assert page.etag == '"v1"'
+        assert page.last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert page.not_modified is False
+        assert "If-None-Match" not in responses.calls[0].request.headers
+
+    @responses.activate
+    @patch.dict(os.environ, {
+        "DEFAULT_URL": "https://jobs.ashbyhq.com/",
+        "ASHBY_TIMEOUT": "30.0"
+    })
+    def test_fetch_board_page_not_modified(self):
+        responses.add(responses.GET, "https://jobs.ashbyhq.com/test-company", status=304)
+
+        page = fetch_board_page("test-company", '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT")
+
+        assert page.not_modified is True
+        assert page.text is None
+        assert page.etag == '"v1"'
+        assert responses.calls[0].request.headers["If-None-Match"] == '"v1"'
+        assert responses.calls[0].request.headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    throttled_hits = 0
+
+    def do_GET(self):
+        if self.path.startswith("/throttled"):
+            type(self).throttled_hits += 1
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path.startswith("/large"):
+            body = b'<html><script>window.__appData = {"jobBoard": {"jobPostings": []}};</script>' + b"x" * (2 * 1024 * 1024)
+        else:
+            body = b"<html>listings</html>"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestAshbySession:
+    @pytest.fixture
+    def server(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+        server.shutdown()
+        server.server_close()
+
+    @patch.dict(os.environ, {"ASHBY_POOL_SIZE": "8"})
+    def test_create_session_pool_size(self):
+        session = _create_session()
+        adapter = session.get_adapter("https://")
+
+        assert adapter._pool_maxsize == 8
+        assert adapter.max_retries.connect == 3
+        assert session.headers["Connection"] == "keep-alive"
+
+    @patch.dict(os.environ, {"MAX_WORKERS": "6"}, clear=False)
+    def test_create_session_pool_size_defaults_to_worker_count(self):
+        os.environ.pop("ASHBY_POOL_SIZE", None)
+        session = _create_session()
+
+        assert session.get_adapter("https://")._pool_maxsize == 6
+
+    def test_connections_are_reused(self, server):
+        session = _create_session()
+        limiter = TokenBucketRateLimiter(1000, 1000)
+
+        with patch.dict(os.environ, {"DEFAULT_URL": server, "ASHBY_TIMEOUT": "5"}), \
+                patch.object(ashby_client, "_session", session), patch.object(ashby_client, "_rate_limiter", limiter):
+            for company in ["deel", "supabase", "resend"]:
+                assert fetch_board_page(company).text == "<html>listings</html>"
+
+            stats = get_connection_stats()
+
+        assert stats == {"requests": 3, "newConnections": 1, "reusedConnections": 2}
+
+    def test_throttled_requests_are_only_retried_by_fetch_board_page(self, server):
+        session = _create_session()
+        limiter = TokenBucketRateLimiter(1000, 1000, sleep=lambda seconds: None)
+        _KeepAliveHandler.throttled_hits = 0
+
+        with patch.dict(os.environ, {"DEFAULT_URL": server, "ASHBY_TIMEOUT": "5", "ASHBY_RETRY_AFTER_ATTEMPTS": "1"}), \
+                patch.object(ashby_client, "_session", session), patch.object(ashby_client, "_rate_limiter", limiter):
+            page = fetch_board_page("throttled")
+
+        assert page is None
+        assert _KeepAliveHandler.throttled_hits == 2
+        assert limiter.get_stats()["retryAfterPauses"] == 1
+
+    def test_streaming_stops_reading_after_app_data(self, server):
+        session = _create_session()
+        limiter = TokenBucketRateLimiter(1000, 1000)
+        stats = {"streamedPages": 0, "earlyTerminations": 0, "bytesRead": 0, "contentLength": 0}
+
+        with patch.dict(os.environ, {"DEFAULT_URL": server, "ASHBY_TIMEOUT": "5", "ASHBY_STREAMING": "true"}), \
+                patch.object(ashby_client, "_session", session), patch.object(ashby_client, "_rate_limiter", limiter), \
+                patch.object(ashby_client, "_stream_stats", stats):
+            page = fetch_board_page("large")
+            stream_stats = get_stream_stats()
+
+        assert page.text is None
+        assert page.etag == '"v1"'
+        assert page.app_data.tobytes() == b'{"jobBoard": {"jobPostings": []}}'
+        assert stream_stats["streamedPages"] == 1
+        assert stream_stats["earlyTerminations"] == 1
+        assert stream_stats["bytesRead"] < stream_stats["contentLength"]
+
+    @responses.activate
+    @patch.dict(os.environ, {
+        "DEFAULT_URL": "https://jobs.ashbyhq.com/",
+        "ASHBY_TIMEOUT": "30.0",
+        "ASHBY_STREAMING": "true"
+    })
+    def test_streaming_page_without_app_data(self):
+        responses.add(responses.GET, "https://jobs.ashbyhq.com/test-company", body="<html>no data</html>", status=200)
+        stats = {"streamedPages": 0, "earlyTerminations": 0, "bytesRead": 0, "contentLength": 0}
+
+        with patch.object(ashby_client, "_rate_limiter", TokenBucketRateLimiter(1000, 1000)), \
+                patch.object(ashby_client, "_stream_stats", stats):
+            page = fetch_board_page("test-company")
 
-        assert result == "content"
+        assert page.app_data is None
+        assert stats["earlyTerminations"] == 0
+        assert stats["bytesRead"] == stats["contentLength"] == len("<html>no data</html>")
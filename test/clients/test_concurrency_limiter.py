@@ -0,0 +1,136 @@
+import threading
+
+import pytest
+
+from src.clients.concurrency_limiter import AdaptiveConcurrencyLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _complete(limiter, clock, latency=0.1, count=1, failed=False):
+    for _ in range(count):
+        started_at = limiter.acquire()
+        clock.now += latency
+        limiter.release(started_at, failed=failed)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    @pytest.mark.parametrize("kwargs", [{"max_limit": 0}, {"max_limit": 2, "min_limit": 3}, {"max_limit": 2, "backoff_ratio": 1.0}])
+    def test_invalid_configuration(self, kwargs):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(**kwargs)
+
+    def test_initial_limit_is_clamped(self):
+        assert AdaptiveConcurrencyLimiter(max_limit=4, initial_limit=10).limit == 4
+        assert AdaptiveConcurrencyLimiter(max_limit=4, initial_limit=0).limit == 1
+
+    def test_additive_increase_up_to_max_limit(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(max_limit=3, window_size=1000, clock=clock)
+
+        _complete(limiter, clock)
+        assert limiter.limit == 2
+
+        _complete(limiter, clock, count=2)
+        assert limiter.limit == 3
+
+        _complete(limiter, clock, count=10)
+        assert limiter.limit == 3
+        assert limiter.get_stats()["increases"] == 2
+
+    def test_multiplicative_decrease_on_overload(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=8, clock=clock)
+        first, second = limiter.acquire(), limiter.acquire()
+        clock.now += 1
+
+        limiter.release(first, overloaded=True)
+        limiter.release(second, overloaded=True)
+
+        assert limiter.limit == 4
+        assert limiter.get_stats()["decreases"] == 1
+
+        clock.now += 1
+        limiter.release(limiter.acquire(), overloaded=True)
+        assert limiter.limit == 2
+
+    def test_backoff_outside_the_slots(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=8, clock=clock)
+        started_at = limiter.now()
+        clock.now += 1
+
+        limiter.backoff(started_at)
+        limiter.backoff(started_at)
+
+        assert limiter.limit == 4
+        assert limiter.get_stats()["decreases"] == 1
+        assert limiter.get_stats()["inFlight"] == 0
+
+    def test_decrease_never_goes_below_min_limit(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(max_limit=4, min_limit=1, clock=clock)
+
+        for _ in range(3):
+            clock.now += 1
+            limiter.release(limiter.acquire(), overloaded=True)
+
+        assert limiter.limit == 1
+
+    def test_decrease_when_p95_rises(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(max_limit=16, initial_limit=8, window_size=5, clock=clock)
+
+        _complete(limiter, clock, latency=0.1, count=5)
+        limit_before = limiter.limit
+        _complete(limiter, clock, latency=0.5, count=5)
+
+        assert limiter.limit == limit_before // 2
+        assert limiter.get_stats()["p95Seconds"] == 0.5
+
+    def test_healthy_latency_does_not_decrease(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(max_limit=16, initial_limit=2, window_size=5, clock=clock)
+
+        _complete(limiter, clock, latency=0.1, count=5)
+        _complete(limiter, clock, latency=0.15, count=5)
+
+        assert limiter.get_stats()["decreases"] == 0
+
+    def test_decrease_when_error_rate_is_high(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(max_limit=16, initial_limit=8, window_size=5, clock=clock)
+
+        _complete(limiter, clock, count=5)
+        _complete(limiter, clock, count=4)
+        _complete(limiter, clock, failed=True)
+
+        assert limiter.limit == 4
+
+    def test_acquire_times_out_and_counts_rejection(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=1)
+        limiter.acquire()
+
+        assert limiter.acquire(timeout=0.01) is None
+
+        stats = limiter.get_stats()
+        assert (stats["inFlight"], stats["throttledRequests"], stats["rejectedRequests"]) == (1, 1, 1)
+
+    def test_waiting_request_proceeds_after_release(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=1)
+        started_at = limiter.acquire()
+        acquired = []
+
+        waiter = threading.Thread(target=lambda: acquired.append(limiter.acquire(timeout=5)))
+        waiter.start()
+        limiter.release(started_at)
+        waiter.join(timeout=5)
+
+        assert acquired and acquired[0] is not None
+        assert limiter.get_stats()["totalRequests"] == 2
@@ -1,9 +1,16 @@
 import pytest
+import json
+import threading
 import os
 import responses
 from unittest.mock import patch, MagicMock
 from requests.exceptions import Timeout, ConnectionError, RequestException
-from src.clients.database_client import DatabaseClient, insert_job
+from src.clients import database_client
+from src.clients.database_client import (DatabaseClient, NdjsonUploadSink, delete_jobs, get_compression_stats, get_write_concurrency_stats, insert_job,
+                                          insert_jobs_bulk, insert_jobs_concurrently, stream_upload_enabled)
+from src.models.enums.insert_status_enum import InsertStatusEnum
+from src.models.insert_result import InsertResult
+from test.clients.crud_stand_in import CrudStandIn
 
 
 class TestDatabaseClient:
@@ -38,6 +45,29 @@ class TestDatabaseClient:
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
 
+    @responses.activate
+    @patch.dict(os.environ, {"API_URL": "https://test-api.com"})
+    def test_make_request_sends_pre_serialized_json_body(self):
+        responses.add(responses.POST, "https://test-api.com/test", status=201)
+
+        client = DatabaseClient()
+        client._make_request("POST", "test", {"title": "Engenheira São Paulo", "id": 1})
+
+        request = responses.calls[0].request
+        assert isinstance(request.body, bytes)
+        assert json.loads(request.body) == {"title": "Engenheira São Paulo", "id": 1}
+        assert request.headers["Content-Type"] == "application/json"
+
+    @responses.activate
+    @patch.dict(os.environ, {"API_URL": "https://test-api.com"})
+    def test_make_request_without_data_sends_no_body(self):
+        responses.add(responses.DELETE, "https://test-api.com/test", status=204)
+
+        client = DatabaseClient()
+        client._make_request("DELETE", "test")
+
+        assert responses.calls[0].request.body is None
+
     @patch.dict(os.environ, {"API_URL": "https://test-api.com"})
     def test_make_request_timeout(self):
         client = DatabaseClient()
@@ -79,6 +109,93 @@ class TestDatabaseClient:
         assert response.status_code == 200
 
 
+    @patch.dict(os.environ, {"API_URL": "https://test-api.com"})
+    def test_overload_statuses_are_not_retried_by_urllib3(self):
+        client = DatabaseClient()
+
+        assert client.session.get_adapter("https://").max_retries.status_forcelist == [500, 502, 504]
+
+    @patch.dict(os.environ, {"API_OVERLOAD_RETRIES": "0"})
+    def test_throttled_request_reaches_the_server_once(self):
+        with CrudStandIn(throttled_requests=4) as stand_in, patch.dict(os.environ, {"API_URL": stand_in.url}):
+            client = DatabaseClient()
+            response = client._make_request("POST", "jobs", {"id": "job-1"})
+
+        assert response.status_code == 429
+        assert len(stand_in.requests) == 1
+        assert client.limiter.get_stats()["decreases"] == 1
+
+    @responses.activate
+    @patch("src.clients.database_client.time.sleep")
+    @patch.dict(os.environ, {"API_URL": "https://test-api.com", "API_INITIAL_CONCURRENCY": "4"})
+    def test_make_request_retries_overload_and_cuts_concurrency(self, mock_sleep):
+        responses.add(responses.POST, "https://test-api.com/jobs", status=429, headers={"Retry-After": "2"})
+        responses.add(responses.POST, "https://test-api.com/jobs", status=503)
+        responses.add(responses.POST, "https://test-api.com/jobs", status=201)
+
+        client = DatabaseClient()
+        response = client._make_request("POST", "jobs", {"id": "job-1"})
+
+        assert response.status_code == 201
+        assert len(responses.calls) == 3
+        assert 2.0 <= mock_sleep.call_args_list[0].args[0] <= 3.0
+        assert 0.0 <= mock_sleep.call_args_list[1].args[0] <= 2.0
+        assert client.limiter.get_stats()["decreases"] == 2
+        assert client.limiter.get_stats()["increases"] == 1
+        assert client.limiter.limit == 2
+
+    @responses.activate
+    @patch("src.clients.database_client.time.sleep")
+    @patch.dict(os.environ, {"API_URL": "https://test-api.com", "API_OVERLOAD_RETRIES": "1"})
+    def test_make_request_returns_overload_after_retries(self, mock_sleep):
+        responses.add(responses.POST, "https://test-api.com/jobs", status=429)
+
+        client = DatabaseClient()
+        response = client._make_request("POST", "jobs", {"id": "job-1"})
+
+        assert response.status_code == 429
+        assert len(responses.calls) == 2
+        mock_sleep.assert_called_once()
+
+    @patch.dict(os.environ, {"API_URL": "https://test-api.com", "API_TIMEOUT": "0"})
+    def test_make_request_times_out_waiting_for_write_slot(self):
+        client = DatabaseClient()
+        client.limiter.acquire()
+
+        with pytest.raises(Exception, match="Timed out waiting for an API write slot"):
+            client._make_request("POST", "jobs", {"id": "job-1"})
+
+        assert client.limiter.get_stats()["rejectedRequests"] == 1
+
+    @patch.dict(os.environ, {"API_URL": "https://test-api.com"})
+    def test_failed_request_releases_write_slot(self):
+        client = DatabaseClient()
+
+        with patch.object(client.session, "request", side_effect=Timeout("Request timed out")):
+            with pytest.raises(Exception):
+                client._make_request("POST", "jobs", {"id": "job-1"})
+
+        assert client.limiter.get_stats()["inFlight"] == 0
+
+    @patch.dict(os.environ, {"API_COMPRESSION": "gzip", "API_COMPRESSION_MIN_BYTES": "200"})
+    def test_large_bodies_are_gzip_compressed(self):
+        with CrudStandIn() as stand_in, patch.dict(os.environ, {"API_URL": stand_in.url}):
+            with patch.object(database_client, "_client", DatabaseClient()):
+                insert_job({"id": "job-1", "title": "Engineer"})
+                insert_jobs_bulk(_jobs(10))
+                stats = get_compression_stats()
+
+        assert stand_in.content_encodings == [None, "gzip"]
+        assert len(stand_in.jobs) == 10
+        assert stats["compressedBodies"] == 1
+        assert stats["compressedBytes"] < stats["rawBytes"]
+
+    def test_get_write_concurrency_stats(self):
+        stats = get_write_concurrency_stats()
+
+        assert set(stats) >= {"limit", "peakLimit", "throttledRequests", "rejectedRequests", "increases", "decreases"}
+
+
 class TestInsertJob:
     @patch("src.clients.database_client._client")
     def test_insert_job_success_201(self, mock_client):
@@ -115,6 +232,15 @@ class TestInsertJob:
         with pytest.raises(Exception, match="Error inserting job: 500"):
             insert_job(job)
 
+    @patch("src.clients.database_client._client")
+    def test_insert_job_returns_result(self, mock_client):
+        mock_client._make_request.side_effect = [MagicMock(status_code=201), MagicMock(status_code=304), MagicMock(status_code=200, ok=True)]
+        job = {"id": "job-1", "title": "Test Job"}
+
+        statuses = [insert_job(job).status for _ in range(3)]
+
+        assert statuses == [InsertStatusEnum.INSERTED, InsertStatusEnum.ALREADY_EXISTS, InsertStatusEnum.INSERTED]
+
     @patch("src.clients.database_client._client")
     def test_insert_job_without_title(self, mock_client):
         mock_response = MagicMock()
@@ -125,3 +251,263 @@ class TestInsertJob:
         insert_job(job)
 
         mock_client._make_request.assert_called_once_with('POST', 'jobs', job)
+
+
+def _jobs(count: int, start: int = 0) -> list:
+    return [{"id": f"job-{index}", "title": f"Engineer {index}", "company": "Test Company"} for index in range(start, start + count)]
+
+
+class TestInsertJobsConcurrently:
+    @patch.dict(os.environ, {"API_URL": "https://test-api.com", "API_POOL_SIZE": "6"})
+    def test_pool_size_from_environment(self):
+        client = DatabaseClient()
+        adapter = client.session.get_adapter("https://")
+
+        assert client.pool_size == 6
+        assert adapter._pool_maxsize == 6
+        assert adapter._pool_block is True
+
+    def test_inserts_jobs_in_parallel(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def insert(job):
+            barrier.wait()
+            return InsertResult(job["id"], InsertStatusEnum.INSERTED)
+
+        with patch("src.clients.database_client.insert_job", side_effect=insert):
+            results = insert_jobs_concurrently(_jobs(2))
+
+        assert [result.job_id for result in results] == ["job-0", "job-1"]
+
+    def test_failed_job_does_not_abort_the_rest(self):
+        with CrudStandIn(failing_ids={"job-1"}) as stand_in, patch.dict(os.environ, {"API_URL": stand_in.url}):
+            with patch.object(database_client, "_client", DatabaseClient()):
+                insert_jobs_concurrently(_jobs(1, start=3))
+                results = insert_jobs_concurrently(_jobs(4))
+
+        assert [(result.job_id, result.status) for result in results] == [
+            ("job-0", InsertStatusEnum.INSERTED),
+            ("job-1", InsertStatusEnum.FAILED),
+            ("job-2", InsertStatusEnum.INSERTED),
+            ("job-3", InsertStatusEnum.ALREADY_EXISTS),
+        ]
+        assert sorted(stand_in.jobs) == ["job-0", "job-2", "job-3"]
+
+
+class TestInsertJobsBulk:
+    @pytest.fixture
+    def client(self):
+        def connect(stand_in):
+            with patch.dict(os.environ, {"API_URL": stand_in.url}):
+                return DatabaseClient()
+        return connect
+
+    def test_sends_configured_batch_size(self, client):
+        with CrudStandIn() as stand_in, patch.object(database_client, "_client", client(stand_in)):
+            results = insert_jobs_bulk(_jobs(5), batch_size=2)
+
+        assert [len(payload) for _, path, payload in stand_in.requests] == [2, 2, 1]
+        assert {path for _, path, _ in stand_in.requests} == {"/jobs/batch"}
+        assert [result.status for result in results] == [InsertStatusEnum.INSERTED] * 5
+        assert sorted(stand_in.jobs) == [f"job-{index}" for index in range(5)]
+
+    def test_batch_size_from_environment(self, client):
+        with CrudStandIn() as stand_in, patch.object(database_client, "_client", client(stand_in)), \
+                patch.dict(os.environ, {"API_BATCH_SIZE": "3"}):
+            insert_jobs_bulk(_jobs(7))
+
+        assert [len(payload) for _, _, payload in stand_in.requests] == [3, 3, 1]
+
+    def test_parses_per_item_results(self, client):
+        with CrudStandIn(failing_ids={"job-2"}) as stand_in, patch.object(database_client, "_client", client(stand_in)):
+            insert_jobs_bulk(_jobs(2), batch_size=10)
+            results = insert_jobs_bulk(_jobs(3), batch_size=10)
+
+        assert [(result.job_id, result.status) for result in results] == [
+            ("job-0", InsertStatusEnum.ALREADY_EXISTS),
+            ("job-1", InsertStatusEnum.ALREADY_EXISTS),
+            ("job-2", InsertStatusEnum.FAILED),
+        ]
+        assert results[2].error == "Validation failed"
+
+    def test_falls_back_to_single_inserts_when_batch_is_unsupported(self, client):
+        with CrudStandIn(batch_supported=False, failing_ids={"job-1"}) as stand_in, \
+                patch.object(database_client, "_client", client(stand_in)):
+            results = insert_jobs_bulk(_jobs(4), batch_size=2)
+
+        paths = [path for _, path, _ in stand_in.requests]
+        assert paths == ["/jobs/batch", "/jobs", "/jobs", "/jobs", "/jobs"]
+        assert [result.status for result in results] == [
+            InsertStatusEnum.INSERTED, InsertStatusEnum.FAILED, InsertStatusEnum.INSERTED, InsertStatusEnum.INSERTED
+        ]
+        assert results[1].error == "Error inserting job: 422"
+
+    @patch("src.clients.database_client._client")
+    def test_batch_error_raises(self, mock_client):
+        mock_client.batch_supported = True
+        mock_client._make_request.return_value = MagicMock(status_code=500, ok=False, text="boom")
+
+        with pytest.raises(Exception, match="Error inserting jobs batch: 500"):
+            insert_jobs_bulk(_jobs(2))
+
+    @patch("src.clients.database_client._client")
+    def test_batch_response_size_mismatch_raises(self, mock_client):
+        mock_client.batch_supported = True
+        mock_client._make_request.return_value = MagicMock(status_code=200, ok=True, content=b'[{"status": 201}]')
+
+        with pytest.raises(Exception, match="Unexpected batch response: expected 2 results"):
+            insert_jobs_bulk(_jobs(2))
+
+    @patch("src.clients.database_client._client")
+    def test_batch_item_with_unexpected_status_fails(self, mock_client):
+        mock_client.batch_supported = True
+        mock_client._make_request.return_value = MagicMock(status_code=200, ok=True, content=b'[{"status": 422}]')
+
+        results = insert_jobs_bulk(_jobs(1))
+
+        assert results[0].status == InsertStatusEnum.FAILED
+        assert results[0].error == "Unexpected status: 422"
+
+
+class TestDeleteJobs:
+    def test_removes_jobs_in_small_batches(self):
+        with CrudStandIn() as stand_in, patch.dict(os.environ, {"API_URL": stand_in.url}):
+            with patch.object(database_client, "_client", DatabaseClient()):
+                insert_jobs_bulk(_jobs(5))
+                removed = delete_jobs(["job-0", "job-1", "job-2", "job-9"], batch_size=3)
+
+        deletes = [(path, payload) for method, path, payload in stand_in.requests if method == "DELETE"]
+        assert deletes == [("/jobs/batch", ["job-0", "job-1", "job-2"]), ("/jobs/batch", ["job-9"])]
+        assert removed == ["job-0", "job-1", "job-2", "job-9"]
+        assert sorted(stand_in.jobs) == ["job-3", "job-4"]
+
+    def test_batch_size_from_environment(self):
+        with CrudStandIn() as stand_in, patch.dict(os.environ, {"API_URL": stand_in.url, "API_DELETE_BATCH_SIZE": "2"}):
+            with patch.object(database_client, "_client", DatabaseClient()):
+                delete_jobs(["job-0", "job-1", "job-2"])
+
+        assert [len(payload) for _, _, payload in stand_in.requests] == [2, 1]
+
+    def test_falls_back_to_single_deletes(self):
+        with CrudStandIn(batch_supported=False) as stand_in, patch.dict(os.environ, {"API_URL": stand_in.url}):
+            with patch.object(database_client, "_client", DatabaseClient()):
+                insert_jobs_concurrently(_jobs(2))
+                removed = delete_jobs(["job-0", "job-1", "job-7"])
+
+        paths = sorted(path for method, path, _ in stand_in.requests if method == "DELETE")
+        assert paths == ["/jobs/batch", "/jobs/job-0", "/jobs/job-1", "/jobs/job-7"]
+        assert removed == ["job-0", "job-1", "job-7"]
+        assert stand_in.jobs == {}
+
+    @patch("src.clients.database_client._client")
+    def test_failed_batch_removes_nothing(self, mock_client):
+        mock_client.delete_batch_supported = True
+        mock_client._make_request.return_value = MagicMock(status_code=500, ok=False, text="boom")
+
+        assert delete_jobs(["job-0", "job-1"]) == []
+
+    @patch("src.clients.database_client._client")
+    def test_single_delete_errors_are_not_confirmed(self, mock_client):
+        mock_client.delete_batch_supported = False
+        mock_client._make_request.side_effect = [MagicMock(status_code=500, ok=False), Exception("API timeout"), MagicMock(ok=True)]
+
+        assert delete_jobs(["job-0", "job-1", "job-2"], batch_size=1) == ["job-2"]
+
+
+class TestNdjsonUploadSink:
+    def test_streams_records_as_chunked_ndjson(self):
+        with CrudStandIn(failing_ids={"job-1"}) as stand_in, patch.dict(os.environ, {"API_URL": stand_in.url}):
+            with patch.object(database_client, "_client", DatabaseClient()):
+                with NdjsonUploadSink(buffer_records=2) as sink:
+                    for job in _jobs(5):
+                        sink.write(job)
+
+        assert stand_in.requests == [("POST", "/jobs/stream", _jobs(5))]
+        assert stand_in.transfer_encodings == ["chunked"]
+        assert [(result.job_id, result.status) for result in sink.results] == [
+            ("job-0", InsertStatusEnum.INSERTED),
+            ("job-1", InsertStatusEnum.FAILED),
+            ("job-2", InsertStatusEnum.INSERTED),
+            ("job-3", InsertStatusEnum.INSERTED),
+            ("job-4", InsertStatusEnum.INSERTED),
+        ]
+
+    def test_upload_starts_before_the_producer_finishes(self):
+        with CrudStandIn() as stand_in, patch.dict(os.environ, {"API_URL": stand_in.url}):
+            client = DatabaseClient()
+            with patch.object(database_client, "_client", client):
+                with NdjsonUploadSink(buffer_records=1) as sink:
+                    for job in _jobs(20):
+                        sink.write(job)
+
+        assert len(sink.results) == 20
+
+    @patch.dict(os.environ, {"API_TIMEOUT": "2"})
+    def test_upload_does_not_hold_a_write_slot(self):
+        with CrudStandIn() as stand_in, patch.dict(os.environ, {"API_URL": stand_in.url, "API_INITIAL_CONCURRENCY": "1"}):
+            client = DatabaseClient()
+            with patch.object(database_client, "_client", client):
+                with NdjsonUploadSink() as sink:
+                    sink.write(_jobs(1)[0])
+                    result = insert_job({"id": "other-1", "title": "Engineer"})
+                    stats = client.limiter.get_stats()
+
+        assert result.status == InsertStatusEnum.INSERTED
+        assert (stats["totalRequests"], stats["inFlight"], stats["rejectedRequests"]) == (1, 0, 0)
+        assert [result.status for result in sink.results] == [InsertStatusEnum.INSERTED]
+
+    def test_overloaded_upload_halves_the_write_limit(self):
+        with CrudStandIn(throttled_requests=1) as stand_in, \
+                patch.dict(os.environ, {"API_URL": stand_in.url, "API_POOL_SIZE": "4", "API_INITIAL_CONCURRENCY": "4"}):
+            client = DatabaseClient()
+            with patch.object(database_client, "_client", client):
+                with pytest.raises(Exception, match="Error streaming jobs: 429"):
+                    with NdjsonUploadSink() as sink:
+                        sink.write(_jobs(1)[0])
+
+        assert sink.upload_failed is True
+        assert client.limiter.limit == 2
+
+    def test_unsupported_endpoint_disables_streaming(self):
+        with CrudStandIn(stream_supported=False) as stand_in, patch.dict(os.environ, {"API_URL": stand_in.url, "API_STREAM_UPLOAD": "true"}):
+            with patch.object(database_client, "_client", DatabaseClient()):
+                assert stream_upload_enabled()
+                with pytest.raises(Exception, match="Streaming endpoint not supported by API: 404"):
+                    with NdjsonUploadSink() as sink:
+                        sink.write(_jobs(1)[0])
+
+                assert not stream_upload_enabled()
+
+    def test_producer_error_aborts_the_upload(self):
+        with CrudStandIn() as stand_in, patch.dict(os.environ, {"API_URL": stand_in.url}):
+            with patch.object(database_client, "_client", DatabaseClient()):
+                with pytest.raises(ValueError, match="normalization failed"):
+                    with NdjsonUploadSink() as sink:
+                        sink.write(_jobs(1)[0])
+                        raise ValueError("normalization failed")
+
+        assert stand_in.jobs == {}
+        assert sink.results is None
+        assert sink.upload_failed is False
+
+    @patch("src.clients.database_client._client")
+    def test_early_error_response_stops_the_producer(self, mock_client):
+        mock_client._stream_request.return_value = MagicMock(status_code=500, ok=False, text="boom")
+
+        with pytest.raises(Exception, match="Error streaming jobs: 500"):
+            with NdjsonUploadSink(buffer_records=1) as sink:
+                for job in _jobs(3):
+                    sink.write(job)
+
+    @patch("src.clients.database_client._client")
+    def test_early_success_response_is_rejected(self, mock_client):
+        mock_client._stream_request.return_value = MagicMock(status_code=207, ok=True, content=b'{"results": [{"status": 201}]}')
+
+        with pytest.raises(Exception, match="Streaming upload finished before all jobs were written"):
+            with NdjsonUploadSink(buffer_records=1) as sink:
+                for job in _jobs(3):
+                    sink.write(job)
+
+    @patch.dict(os.environ, {"API_URL": "https://test-api.com"})
+    def test_streaming_is_disabled_by_default(self):
+        assert not stream_upload_enabled()
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from src.clients.rate_limiter import TokenBucketRateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucketRateLimiter:
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError, match="Rate limit must be greater than zero"):
+            TokenBucketRateLimiter(0, 1)
+
+    def test_invalid_burst(self):
+        with pytest.raises(ValueError, match="Burst size must be at least one"):
+            TokenBucketRateLimiter(1, 0)
+
+    def test_burst_is_not_throttled(self):
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(2, 3, clock=clock, sleep=clock.sleep)
+
+        waits = [limiter.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+        assert clock.sleeps == []
+
+    def test_requests_beyond_burst_wait_for_tokens(self):
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(2, 1, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire()
+        wait = limiter.acquire()
+
+        assert wait == pytest.approx(0.5)
+        assert limiter.get_stats() == {
+            'totalRequests': 2,
+            'throttledRequests': 1,
+            'throttledSeconds': 0.5,
+            'retryAfterPauses': 0
+        }
+
+    def test_tokens_refill_over_time(self):
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(1, 1, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire()
+        clock.now += 1.0
+
+        assert limiter.acquire() == 0.0
+
+    def test_pause_blocks_following_requests(self):
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(10, 5, clock=clock, sleep=clock.sleep)
+
+        limiter.pause(3)
+        wait = limiter.acquire()
+
+        assert wait == pytest.approx(3)
+        assert limiter.get_stats()['retryAfterPauses'] == 1
+
+    def test_acquire_async(self):
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(1000, 1, clock=clock, sleep=clock.sleep)
+
+        async def acquire_twice():
+            await limiter.acquire_async()
+            return await limiter.acquire_async()
+
+        assert asyncio.run(acquire_twice()) == pytest.approx(0.001)
+
+    def test_acquire_is_thread_safe(self):
+        limiter = TokenBucketRateLimiter(1000, 1000)
+
+        threads = [threading.Thread(target=lambda: [limiter.acquire() for _ in range(50)]) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert limiter.get_stats()['totalRequests'] == 400
+
+
+class TestParseRetryAfter:
+    def test_missing_header_uses_default(self):
+        assert parse_retry_after(None, 5.0) == 5.0
+
+    def test_seconds(self):
+        assert parse_retry_after(" 7 ", 5.0) == 7.0
+
+    def test_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        assert 25 <= parse_retry_after(format_datetime(retry_at, usegmt=True), 5.0) <= 30
+
+    def test_http_date_without_timezone(self):
+        assert parse_retry_after("Mon, 01 Jan 2001 00:00:00 -0000", 5.0) == 0.0
+
+    def test_invalid_value_uses_default(self):
+        assert parse_retry_after("soon", 5.0) == 5.0
@@ -0,0 +1,64 @@
+from src.filters.decision_memo import DecisionMemo
+
+
+class TestDecisionMemo:
+    def test_evicts_the_least_recently_used_entry(self):
+        memo = DecisionMemo(max_entries=2)
+        memo.put("a", 0)
+        memo.put("b", -1)
+        assert memo.get("a") == 0
+
+        memo.put("c", 1)
+
+        assert memo.get("b") is None
+        assert (memo.get("a"), memo.get("c")) == (0, 1)
+        assert memo.get_stats() == {"entries": 2, "maxEntries": 2, "hits": 3, "misses": 1, "evictions": 1, "hitRatio": 0.75}
+
+    def test_empty_stats(self):
+        assert DecisionMemo().get_stats()["hitRatio"] == 0.0
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "filter_decisions.json")
+        key = ("rule-set", ("Remote", ("São Paulo, Brazil", None)))
+        memo = DecisionMemo()
+        memo.put(key, 2)
+        memo.put(("rule-set", (None, ())), -1)
+        memo.save(path)
+
+        restored = DecisionMemo()
+
+        assert restored.load(path) == 2
+        assert restored.get(key) == 2
+        assert restored.get(("rule-set", (None, ()))) == -1
+
+    def test_load_keeps_the_most_recent_entries_that_fit(self, tmp_path):
+        path = str(tmp_path / "filter_decisions.json")
+        memo = DecisionMemo()
+        for value in range(5):
+            memo.put(("rule-set", (f"location {value}",)), value)
+        memo.save(path)
+
+        restored = DecisionMemo(max_entries=2)
+        restored.put(("rule-set", ("current",)), 9)
+
+        assert restored.load(path) == 2
+        assert restored.get(("rule-set", ("location 4",))) == 4
+        assert restored.get(("rule-set", ("current",))) is None
+
+    def test_missing_or_unreadable_files_are_ignored(self, tmp_path, caplog):
+        path = tmp_path / "filter_decisions.json"
+        memo = DecisionMemo()
+
+        assert memo.load(str(path)) == 0
+
+        path.write_text("{not json", encoding="utf-8")
+        assert memo.load(str(path)) == 0
+        assert "Ignoring unreadable filter decision memo" in caplog.text
+
+    def test_load_skips_entries_that_are_not_rule_ordinals(self, tmp_path):
+        path = tmp_path / "filter_decisions.json"
+        path.write_text('[[["rule-set", ["Remote"]], "stale"], [["rule-set", ["Brazil"]], 1]]', encoding="utf-8")
+        memo = DecisionMemo()
+
+        assert memo.load(str(path)) == 1
+        assert memo.get(("rule-set", ("Brazil",))) == 1
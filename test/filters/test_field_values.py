@@ -0,0 +1,46 @@
+from unittest.mock import MagicMock
+
+from src.filters.field_values import attr_or_key, lower_value
+
+
+class TestLowerValue:
+    def test_with_string(self):
+        assert lower_value("HELLO") == "hello"
+        assert lower_value("  Test  ") == "test"
+
+    def test_with_none(self):
+        assert lower_value(None) == ""
+
+    def test_with_number(self):
+        assert lower_value(123) == "123"
+
+    def test_with_empty_string(self):
+        assert lower_value("") == ""
+        assert lower_value("   ") == ""
+
+
+class TestAttrOrKey:
+    def test_with_dict(self):
+        obj = {"name": "test", "value": 123}
+        assert attr_or_key(obj, "name") == "test"
+        assert attr_or_key(obj, "value") == 123
+        assert attr_or_key(obj, "missing") is None
+
+    def test_with_object(self):
+        obj = MagicMock()
+        obj.name = "test"
+        obj.value = 123
+
+        assert attr_or_key(obj, "name") == "test"
+        assert attr_or_key(obj, "value") == 123
+
+    def test_with_object_missing_attr(self):
+        obj = MagicMock()
+        del obj.missing
+
+        assert attr_or_key(obj, "missing") is None
+
+    def test_with_object_none_attribute(self):
+        obj = MagicMock()
+        obj.name = None
+        assert attr_or_key(obj, "name") is None
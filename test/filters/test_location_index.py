@@ -0,0 +1,56 @@
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.filters.location_index import LocationIndex, location_index_enabled
+
+
+class TestLocationIndex:
+    def test_normalizes_each_location_id_once(self):
+        index = LocationIndex()
+        assert index.name({"locationId": "loc-1", "locationName": " São Paulo, Brazil "}) == "são paulo, brazil"
+        assert index.name({"locationId": "loc-1", "locationName": "ignored once indexed"}) == "são paulo, brazil"
+        assert index.name(SimpleNamespace(locationId="loc-2", locationName="Remote")) == "remote"
+        assert index.get_stats() == {"locations": 2, "names": 2, "conditions": 0}
+
+    def test_reset_picks_up_renamed_locations(self):
+        index = LocationIndex()
+        match = index.matcher(("contains", "brazil"), lambda name: "brazil" in name)
+        assert match([{"locationId": "loc-1", "locationName": "Remote"}]) is False
+
+        index.reset()
+
+        assert match([{"locationId": "loc-1", "locationName": "Remote - Brazil"}]) is True
+        assert index.name({"locationId": "loc-1", "locationName": "Remote - Brazil"}) == "remote - brazil"
+
+    def test_locations_without_id_are_normalized_directly(self):
+        index = LocationIndex()
+
+        assert (index.name({"locationName": " Berlin "}), index.name({})) == ("berlin", "")
+        assert index.get_stats()["locations"] == 0
+
+    def test_matcher_tests_each_location_name_once(self):
+        index = LocationIndex()
+        test = MagicMock(side_effect=lambda name: "brazil" in name)
+        match = index.matcher(("contains", "brazil"), test)
+        berlin, brazil = {"locationId": "loc-1", "locationName": "Berlin"}, {"locationId": "loc-2", "locationName": "São Paulo, Brazil"}
+
+        assert match([berlin, brazil]) is True
+        assert match([berlin]) is False
+        assert match([{"locationId": "other-board", "locationName": "São Paulo, Brazil"}, berlin]) is True
+        assert match([{"locationId": "other-berlin", "locationName": "Berlin"}]) is False
+        assert match(None) is False
+        assert test.call_count == 2
+
+    def test_matchers_for_the_same_condition_share_results(self):
+        index = LocationIndex()
+        index.matcher(("contains", "brazil"), lambda name: "brazil" in name)([{"locationId": "loc-1", "locationName": "Brazil"}])
+
+        assert index.matcher(("contains", "brazil"), MagicMock(return_value=False))([{"locationName": "Brazil"}]) is True
+        assert index.get_stats()["conditions"] == 1
+
+    def test_enabled_by_default(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert location_index_enabled() is True
+        with patch.dict(os.environ, {"LOCATION_INDEX": "false"}):
+            assert location_index_enabled() is False
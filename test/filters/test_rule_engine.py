@@ -0,0 +1,252 @@
+import pytest
+from unittest.mock import MagicMock, PropertyMock
+from src.filters.rule_engine import GLOBAL_RULE_SET, RulePlan, compile_rule_set, compile_rules
+from src.filters.decision_memo import DecisionMemo
+from src.filters.location_index import LocationIndex
+from src.matching.keyword_matcher import KeywordIndex
+
+
+def _job(**fields):
+    job = MagicMock()
+    for name, value in fields.items():
+        setattr(job, name, value)
+    return job
+
+
+def _rule(field, operator, pattern, reason="match"):
+    return {"field": field, "operator": operator, "pattern": pattern, "reason": reason}
+
+
+class TestCompileRuleSet:
+    @pytest.mark.parametrize("operator, pattern, value, expected", [
+        ("contains", "LATAM", "  Remote (LATAM) ", True),
+        ("contains", "latam", "Remote", False),
+        ("not_contains", "(", "Engineer", True),
+        ("not_contains", "(", "Engineer (EU)", False),
+        ("equals", "Remote", " remote ", True),
+        ("equals", "remote", "remote - us", False),
+        ("regex", r"\bus time zones?\b", "Engineer, US Time Zone", True),
+        ("regex", r"^remote$", "remote - us", False),
+    ])
+    def test_operators(self, operator, pattern, value, expected):
+        rule_set = compile_rule_set("acme", {"default_reason": "default", "rules": [_rule("locationName", operator, pattern)]})
+
+        assert rule_set.evaluate(_job(locationName=value)) == ((True, "match") if expected else (False, "default"))
+
+    def test_list_field_matches_any_item(self):
+        rule_set = compile_rule_set("acme", {"default_reason": "default", "rules": [_rule("secondaryLocations.locationName", "contains", "brazil")]})
+        location = MagicMock()
+        location.locationName = "São Paulo, Brazil"
+
+        assert rule_set.evaluate(_job(secondaryLocations=[{"locationName": "Berlin"}, location])) == (True, "match")
+        assert rule_set.evaluate(_job(secondaryLocations=None)) == (False, "default")
+
+    def test_all_conditions_must_match(self):
+        rule_set = compile_rule_set("acme", {"default_reason": "default", "rules": [
+            {"all": [_rule("title", "not_contains", "("), _rule("locationName", "equals", "remote")], "reason": "global remote"}
+        ]})
+
+        assert rule_set.evaluate(_job(title="Engineer", locationName="Remote")) == (True, "global remote")
+        assert rule_set.evaluate(_job(title="Engineer (EU)", locationName="Remote")) == (False, "default")
+
+    def test_cheapest_conditions_run_first(self):
+        rule_set = compile_rule_set("acme", {"default_reason": "default", "rules": [
+            {"all": [_rule("secondaryLocations.locationName", "contains", "brazil"), _rule("title", "regex", "eng"),
+                     _rule("locationName", "equals", "remote")], "reason": "match"}
+        ]})
+
+        assert [condition.field for condition in rule_set.rules[0][0]] == ["locationName", "title", "secondaryLocations.locationName"]
+
+    def test_fields_are_read_once_and_only_when_needed(self):
+        job = MagicMock()
+        title = PropertyMock(return_value="Engineer - Brazil")
+        secondary_locations = PropertyMock(return_value=[])
+        type(job).title = title
+        type(job).secondaryLocations = secondary_locations
+        rule_set = compile_rule_set("acme", {"default_reason": "default", "rules": [
+            _rule("title", "contains", "americas"),
+            _rule("title", "contains", "brazil"),
+            _rule("secondaryLocations.locationName", "contains", "brazil"),
+        ]})
+
+        assert rule_set.evaluate(job) == (True, "match")
+        assert title.call_count == 1
+        secondary_locations.assert_not_called()
+
+    @pytest.mark.parametrize("spec, message", [
+        ({"rules": []}, "needs a default_reason"),
+        ({"default_reason": "default", "rules": {}}, "rules must be a list"),
+        ({"default_reason": "default", "rules": [{"field": "title", "operator": "contains", "pattern": "x"}]}, "needs a reason"),
+        ({"default_reason": "default", "rules": [{"all": [], "reason": "match"}]}, "at least one condition"),
+        ({"default_reason": "default", "rules": [_rule("", "contains", "x")]}, "needs a field"),
+        ({"default_reason": "default", "rules": [_rule("title", "startswith", "x")]}, "Unknown rule operator"),
+        ({"default_reason": "default", "rules": [_rule("title", "contains", 1)]}, "pattern must be a string"),
+        ({"default_reason": "default", "rules": [_rule("secondaryLocations.locationName", "not_contains", "x")]}, "not supported on list field"),
+        ({"default_reason": "default", "rules": [], "enabled": True}, "Unknown keys in rule set acme: enabled"),
+        ({"default_reason": "default", "rules": [dict(_rule("title", "contains", "x"), patern="y")]}, "Unknown keys in rule: patern"),
+        ({"default_reason": "default", "rules": [{"all": [_rule("title", "contains", "x")], "field": "title", "reason": "m"}]}, "Unknown keys in rule: field"),
+        ({"default_reason": "default", "rules": [{"all": [{"field": "title", "operator": "contains", "pattern": "x", "negate": True}],
+                                                  "reason": "m"}]}, "Unknown keys in rule condition: negate"),
+        ({"default_reason": "default", "rules": [{"all": "title", "reason": "m"}]}, "at least one condition"),
+        ({"default_reason": "default", "rules": ["title"]}, "rule must be a mapping"),
+    ])
+    def test_invalid_rule_sets_are_rejected(self, spec, message):
+        with pytest.raises(ValueError, match=message):
+            compile_rule_set("acme", spec)
+
+
+class TestCompileRules:
+    SPEC = {
+        GLOBAL_RULE_SET: {"default_reason": "global_filter", "rules": [_rule("title", "contains", "brazil", "global match")]},
+        "acme": {"default_reason": "acme_filter", "rules": [_rule("locationName", "contains", "latam", "acme match")]},
+    }
+
+    def test_global_rules_run_before_company_rules(self):
+        plan = compile_rules(self.SPEC)
+
+        assert plan.evaluate(_job(title="Brazil", locationName="LATAM"), "acme") == (True, "global match")
+        assert plan.evaluate(_job(title="Engineer", locationName="LATAM"), "acme") == (True, "acme match")
+        assert plan.evaluate(_job(title="Engineer", locationName="US"), "acme") == (False, "acme_filter")
+
+    def test_unknown_company_uses_global_rules(self):
+        plan = compile_rules(self.SPEC)
+
+        assert plan.evaluate(_job(title="Engineer", locationName="LATAM"), "other") == (False, "global_filter")
+
+    def test_configuration_must_be_a_mapping(self):
+        with pytest.raises(ValueError, match="must be a mapping of rule sets"):
+            compile_rules([self.SPEC])
+
+    def test_global_rule_set_is_required(self):
+        with pytest.raises(ValueError, match="needs a global rule set"):
+            compile_rules({"acme": self.SPEC["acme"]})
+
+    def test_keyword_index_gives_the_same_decisions(self):
+        spec = {
+            GLOBAL_RULE_SET: {"default_reason": "global_filter", "rules": [
+                _rule("title", "contains", "Brazil", "title match"),
+                _rule("secondaryLocations.locationName", "contains", "brazil", "secondary match"),
+            ]},
+            "acme": {"default_reason": "acme_filter", "rules": [
+                _rule("locationName", "contains", "latam", "acme match"),
+                {"all": [_rule("title", "contains", ""), _rule("locationName", "equals", "us")], "reason": "empty pattern match"},
+                {"all": [_rule("title", "not_contains", "("), _rule("locationName", "equals", "remote")], "reason": "remote match"},
+            ]},
+        }
+        index = KeywordIndex()
+        indexed, direct = compile_rules(spec, index), compile_rules(spec)
+        jobs = [
+            _job(title=title, locationName=location, secondaryLocations=[{"locationName": secondary}])
+            for title in ("Engineer", "Engineer (Brazil)", "Engineer (EU)")
+            for location in ("Remote", "Remote - LATAM", "US")
+            for secondary in ("Berlin", "São Paulo, Brazil")
+        ]
+
+        assert index.matcher.keywords == {"brazil", "latam", "("}
+        for company in ("acme", "other"):
+            assert [indexed.evaluate(job, company) for job in jobs] == [direct.evaluate(job, company) for job in jobs]
+
+
+class TestLocationIndex:
+    SPEC = {
+        GLOBAL_RULE_SET: {"default_reason": "global_filter", "rules": [
+            _rule("secondaryLocations.locationName", "contains", "brazil", "secondary match"),
+        ]},
+        "acme": {"default_reason": "acme_filter", "rules": [
+            _rule("secondaryLocations.locationName", "regex", r"\bamericas\b", "acme americas"),
+            _rule("secondaryLocations.locationName", "equals", "remote", "acme remote"),
+        ]},
+    }
+
+    def test_indexed_locations_give_the_same_decisions(self):
+        indexed, direct = compile_rules(self.SPEC, locations=LocationIndex()), compile_rules(self.SPEC)
+        names = ("Berlin", " São Paulo, Brazil", "Americas", "Remote ", None)
+        jobs = [_job(title="Engineer", locationName="US", secondaryLocations=[{"locationId": f"loc-{first}", "locationName": names[first]},
+                                                                              {"locationId": f"loc-{second}", "locationName": names[second]}])
+                for first in range(len(names)) for second in range(len(names))]
+        jobs.append(_job(title="Engineer", locationName="US", secondaryLocations=None))
+
+        for company in ("acme", "other"):
+            for _ in range(2):
+                assert [indexed.evaluate(job, company) for job in jobs] == [direct.evaluate(job, company) for job in jobs]
+
+    def test_company_plans_are_rebuilt_for_another_location_index(self):
+        plan = compile_rules(self.SPEC, locations=LocationIndex())
+        rule_sets = plan.rule_sets
+
+        assert RulePlan(rule_sets, previous=plan, locations=plan.locations).for_company("acme") is plan.for_company("acme")
+        assert RulePlan(rule_sets, previous=plan).for_company("acme") is not plan.for_company("acme")
+
+
+class TestDecisionMemo:
+    SPEC = {
+        GLOBAL_RULE_SET: {"default_reason": "global_filter", "rules": [
+            _rule("title", "contains", "brazil", "title match"),
+            _rule("locationName", "contains", "brazil", "location match"),
+            _rule("secondaryLocations.locationName", "contains", "brazil", "secondary match"),
+        ]},
+        "acme": {"default_reason": "acme_filter", "rules": [
+            _rule("locationName", "contains", "latam", "acme latam"),
+            {"all": [_rule("title", "not_contains", "("), _rule("locationName", "equals", "remote")], "reason": "acme remote"},
+            _rule("secondaryLocations.locationName", "regex", r"\bamericas\b", "acme americas"),
+        ]},
+    }
+
+    @staticmethod
+    def _jobs():
+        return [
+            _job(title=title, locationName=location, secondaryLocations=[{"locationName": secondary}])
+            for title in ("Engineer", "Engineer (Brazil)", "Engineer (EU)")
+            for location in ("Remote", "Brazil", "Remote - LATAM", "US")
+            for secondary in ("Berlin", "São Paulo, Brazil", "Americas")
+        ]
+
+    def test_memo_gives_the_same_decisions(self):
+        plan, memo = compile_rules(self.SPEC), DecisionMemo()
+
+        for company in ("acme", "other"):
+            for _ in range(2):
+                assert [plan.evaluate(job, company, memo) for job in self._jobs()] == [plan.evaluate(job, company) for job in self._jobs()]
+
+    def test_memo_is_keyed_by_the_inputs_the_memoized_rules_declare(self):
+        plan, memo = compile_rules(self.SPEC), DecisionMemo()
+        rule_set = plan.for_company("acme")
+
+        for title in ("Engineer", "Designer", "Manager"):
+            plan.evaluate(_job(title=title, locationName="US", secondaryLocations=[{"locationName": "Berlin"}]), "acme", memo)
+
+        assert rule_set.memo_fields == ("locationName", "secondaryLocations.locationName")
+        assert (memo.get_stats()["misses"], memo.get_stats()["hits"]) == (1, 2)
+
+    def test_rule_sets_share_a_memo_without_mixing_decisions(self):
+        plan, memo = compile_rules(self.SPEC), DecisionMemo()
+        job = _job(title="Engineer", locationName="Remote - LATAM", secondaryLocations=[])
+
+        assert plan.evaluate(job, "other", memo) == (False, "global_filter")
+        assert plan.evaluate(job, "acme", memo) == (True, "acme latam")
+        assert plan.for_company("acme").memo_key != plan.for_company("other").memo_key
+
+    @pytest.mark.parametrize("before, after", [
+        ([_rule("title", "contains", "x", "t1"), _rule("title", "contains", "y", "t2"), _rule("locationName", "contains", "brazil", "loc")],
+         [_rule("locationName", "contains", "brazil", "loc")]),
+        ([_rule("locationName", "contains", "brazil", "loc")],
+         [_rule("title", "contains", "x", "t1"), _rule("locationName", "contains", "brazil", "loc")]),
+    ])
+    def test_memo_is_shared_by_plans_with_the_memoized_rules_at_other_positions(self, before, after):
+        memo = DecisionMemo()
+        job = _job(title="Engineer", locationName="Brazil", secondaryLocations=[])
+        first = compile_rules({GLOBAL_RULE_SET: {"default_reason": "global_filter", "rules": before}})
+        second = compile_rules({GLOBAL_RULE_SET: {"default_reason": "global_filter", "rules": after}})
+
+        first.evaluate(job, "acme", memo)
+
+        assert second.for_company("acme").memo_key == first.for_company("acme").memo_key
+        assert second.evaluate(job, "acme", memo) == second.evaluate(job, "acme")
+        assert memo.get_stats()["hits"] == 1
+
+    def test_title_only_rule_sets_skip_the_memo(self):
+        rule_set = compile_rule_set("acme", {"default_reason": "default", "rules": [_rule("title", "contains", "brazil")]})
+        memo = DecisionMemo()
+
+        assert rule_set.evaluate(_job(title="Brazil"), memo) == (True, "match")
+        assert memo.get_stats()["misses"] == 0
@@ -0,0 +1,195 @@
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.filters.decision_memo import DecisionMemo
+from src.filters.rule_engine import GLOBAL_RULE_SET, compile_rules
+from src.filters.rule_store import RuleStore, load_rule_config
+
+RULES = {
+    GLOBAL_RULE_SET: {"default_reason": "global_filter", "rules": [
+        {"field": "title", "operator": "contains", "pattern": "brazil", "reason": "global match"},
+    ]},
+    "acme": {"default_reason": "acme_filter", "rules": [
+        {"field": "locationName", "operator": "contains", "pattern": "latam", "reason": "acme match"},
+    ]},
+    "initech": {"default_reason": "initech_filter", "rules": [
+        {"field": "locationName", "operator": "equals", "pattern": "remote", "reason": "initech match"},
+    ]},
+}
+
+
+def _job(title="Engineer", location_name="Remote"):
+    job = MagicMock()
+    job.title, job.locationName, job.secondaryLocations = title, location_name, []
+    return job
+
+
+def _write(path, spec):
+    previous = os.stat(path).st_mtime_ns if path.exists() else 0
+    path.write_text(json.dumps(spec), encoding="utf-8")
+    os.utime(path, ns=(previous + 1_000_000_000, previous + 1_000_000_000))
+
+
+@pytest.fixture
+def rules_file(tmp_path):
+    path = tmp_path / "filter_rules.json"
+    _write(path, RULES)
+    return path
+
+
+class TestLoadRuleConfig:
+    def test_loads_json(self, rules_file):
+        assert load_rule_config(str(rules_file)) == RULES
+
+    def test_loads_yaml(self, tmp_path):
+        yaml = pytest.importorskip("yaml")
+        path = tmp_path / "filter_rules.yaml"
+        path.write_text(yaml.safe_dump(RULES), encoding="utf-8")
+
+        assert load_rule_config(str(path)) == RULES
+
+    def test_invalid_yaml_is_a_configuration_error(self, tmp_path):
+        pytest.importorskip("yaml")
+        path = tmp_path / "filter_rules.yml"
+        path.write_text("global: [unclosed", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Invalid YAML rule file"):
+            load_rule_config(str(path))
+
+    def test_yaml_needs_pyyaml(self, tmp_path):
+        path = tmp_path / "filter_rules.yaml"
+        path.write_text("global: {}", encoding="utf-8")
+
+        with patch.dict(sys.modules, {"yaml": None}), pytest.raises(ValueError, match="need the PyYAML package"):
+            load_rule_config(str(path))
+
+
+class TestRuleStore:
+    def test_uses_default_rules_without_a_file(self):
+        store = RuleStore(RULES)
+
+        plan = store.current()
+
+        assert plan.evaluate(_job(location_name="LATAM"), "acme") == (True, "acme match")
+        assert store.current() is plan
+        assert store.recompiled_rule_sets == 3
+
+    def test_loads_rules_from_the_file(self, rules_file):
+        store = RuleStore({}, str(rules_file))
+
+        assert store.current().evaluate(_job(location_name="Remote"), "initech") == (True, "initech match")
+        assert store.reloads == 0
+
+    @pytest.mark.parametrize("spec, message", [
+        (["global"], "must be a mapping of rule sets"),
+        ({**RULES, "": RULES["acme"]}, "names must be non-empty strings"),
+        ({**RULES, "acme": {**RULES["acme"], "enabled": True}}, "Unknown keys in rule set acme: enabled"),
+        ({"acme": RULES["acme"]}, "needs a global rule set"),
+    ])
+    def test_invalid_files_fail_the_first_load(self, tmp_path, spec, message):
+        path = tmp_path / "filter_rules.json"
+        _write(path, spec)
+
+        with pytest.raises(ValueError, match=message):
+            RuleStore({}, str(path)).current()
+
+    def test_missing_file_fails_the_first_load(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            RuleStore({}, str(tmp_path / "missing.json")).current()
+
+    def test_reload_recompiles_only_changed_rule_sets(self, rules_file):
+        store = RuleStore({}, str(rules_file))
+        before = store.current()
+
+        _write(rules_file, {**RULES, "acme": {"default_reason": "acme_filter", "rules": [
+            {"field": "locationName", "operator": "contains", "pattern": "americas", "reason": "acme americas"},
+        ]}})
+        after = store.current()
+
+        assert after is not before
+        assert (store.reloads, store.recompiled_rule_sets) == (1, 4)
+        assert after.rule_sets["initech"] is before.rule_sets["initech"]
+        assert after.for_company("initech") is before.for_company("initech")
+        assert after.for_company("acme").signature != before.for_company("acme").signature
+        assert after.evaluate(_job(location_name="Americas"), "acme") == (True, "acme americas")
+        assert before.evaluate(_job(location_name="Americas"), "acme") == (False, "acme_filter")
+
+    def test_changing_global_rules_rebuilds_every_company_plan(self, rules_file):
+        store = RuleStore({}, str(rules_file))
+        before = store.current()
+
+        _write(rules_file, {**RULES, GLOBAL_RULE_SET: {"default_reason": "global_filter", "rules": []}})
+        after = store.current()
+
+        assert after.rule_sets["acme"] is before.rule_sets["acme"]
+        assert after.for_company("acme") is not before.for_company("acme")
+        assert after.evaluate(_job(title="Brazil", location_name="US"), "acme") == (False, "acme_filter")
+
+    def test_added_and_removed_rule_sets(self, rules_file):
+        store = RuleStore({}, str(rules_file))
+        store.current()
+
+        spec = {name: rule_set for name, rule_set in RULES.items() if name != "initech"}
+        spec["globex"] = {"default_reason": "globex_filter", "rules": []}
+        _write(rules_file, spec)
+        plan = store.current()
+
+        assert set(plan.rule_sets) == {GLOBAL_RULE_SET, "acme", "globex"}
+        assert plan.evaluate(_job(), "globex") == (False, "globex_filter")
+        assert plan.evaluate(_job(), "initech") == (False, "global_filter")
+
+    def test_broken_reload_keeps_the_previous_plan(self, rules_file, caplog):
+        store = RuleStore({}, str(rules_file))
+        before = store.current()
+
+        _write(rules_file, {**RULES, "acme": {"default_reason": "acme_filter", "rules": [{"field": "title", "operator": "startswith",
+                                                                                          "pattern": "x", "reason": "bad"}]}})
+        with patch("src.filters.rule_store.load_rule_config", wraps=load_rule_config) as load:
+            assert store.current() is before
+            assert store.current() is before
+
+        assert load.call_count == 1
+        assert "Keeping previous filter rules" in caplog.text
+        assert store.reloads == 0
+
+        _write(rules_file, RULES)
+        assert store.current() is not before
+        assert store.reloads == 1
+
+    def test_removed_file_keeps_the_current_plan(self, rules_file):
+        store = RuleStore({}, str(rules_file))
+        before = store.current()
+
+        rules_file.unlink()
+
+        assert store.current() is before
+
+    def test_reload_with_a_populated_decision_memo(self, rules_file):
+        store, memo = RuleStore({}, str(rules_file)), DecisionMemo()
+        jobs = [_job(title, location) for title in ("Engineer", "Brazil Engineer", "Engineer x") for location in ("Remote", "LATAM", "US")]
+        for company in ("acme", "initech", "other"):
+            for job in jobs:
+                store.current().evaluate(job, company, memo)
+
+        rules = {
+            GLOBAL_RULE_SET: {"default_reason": "global_filter", "rules": [
+                {"field": "title", "operator": "contains", "pattern": "x", "reason": "global x"},
+                {"field": "title", "operator": "contains", "pattern": "y", "reason": "global y"},
+                *RULES[GLOBAL_RULE_SET]["rules"],
+            ]},
+            "acme": RULES["acme"],
+            "initech": {"default_reason": "initech_filter", "rules": [
+                {"field": "title", "operator": "contains", "pattern": "engineer", "reason": "initech engineer"},
+                *RULES["initech"]["rules"],
+            ]},
+        }
+        _write(rules_file, rules)
+        fresh = compile_rules(rules)
+
+        for company in ("acme", "initech", "other"):
+            assert [store.current().evaluate(job, company, memo) for job in jobs] == [fresh.evaluate(job, company) for job in jobs]
+        assert memo.get_stats()["hits"] > 0
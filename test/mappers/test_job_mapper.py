@@ -3,10 +3,11 @@ from unittest.mock import MagicMock
 from src.mappers.job_mapper import (
     _dict_to_job, _dict_to_friendly_job, dicts_to_jobs,
     dicts_to_friendly_jobs, job_to_friendly_job, friendly_job_to_normalized_job,
-    _clean_string
+    _clean_string, iter_dicts_to_projections, projection_to_friendly_job
 )
 from src.models.job import Job
 from src.models.friendly_job import FriendlyJob
+from src.models.job_projection import JobProjection
 from src.models.normalized_job import NormalizedJob
 
 
@@ -266,3 +267,26 @@ class TestJobMapper:
         assert normalized_job.url == 'https://test.com/job'
         assert normalized_job.seniority_level == 'senior'
         assert normalized_job.field == 'engineering'
+
+    def test_iter_dicts_to_projections_only_reads_filter_fields(self):
+        posting = {'id': 'job-1', 'title': ' Engineer ', 'locationName': 'Brazil', 'secondaryLocations': None, 'teamName': ' Core '}
+
+        projection = next(iter_dicts_to_projections([posting]))
+
+        assert isinstance(projection, JobProjection)
+        assert projection.posting is posting
+        assert projection.title == ' Engineer '
+        assert projection.locationName == 'Brazil'
+        assert projection.secondaryLocations == []
+        assert projection.is_brazilian_friendly is None
+
+    def test_projection_to_friendly_job_maps_the_full_posting(self):
+        posting = {'id': 'job-1', 'title': ' Engineer ', 'locationName': 'Brazil', 'teamName': ' Core '}
+        projection = next(iter_dicts_to_projections([posting]))
+        projection.is_brazilian_friendly = {'isFriendly': True, 'reason': 'test'}
+
+        friendly_job = projection_to_friendly_job(projection)
+
+        assert friendly_job.to_dict() == _dict_to_friendly_job({**posting, 'is_brazilian_friendly': projection.is_brazilian_friendly}).to_dict()
+        assert friendly_job.title == 'Engineer'
+        assert friendly_job.teamName == 'Core'
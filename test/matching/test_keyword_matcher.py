@@ -0,0 +1,126 @@
+import random
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.matching.keyword_matcher import KeywordIndex, KeywordMatcher, keyword_index_enabled
+
+KEYWORDS = ("staff", "lead", "tech lead", "team lead", "ai", "it ", "data", "data scientist", "sr.", "s&m", "head", "ad", "brazil")
+
+
+def _backends():
+    backends = ["python"]
+    try:
+        __import__("ahocorasick")
+        backends.append("ahocorasick")
+    except ImportError:
+        pass
+    return backends
+
+
+class _FakeAutomaton:
+    """Stands in for pyahocorasick's Automaton so the native backend wiring is tested without the package"""
+
+    def __init__(self):
+        self.words = {}
+
+    def __len__(self):
+        return len(self.words)
+
+    def add_word(self, word, value):
+        self.words[word] = value
+
+    def make_automaton(self):
+        pass
+
+    def iter(self, text):
+        return [(start + len(word) - 1, value) for word, value in self.words.items() for start in range(len(text)) if text.startswith(word, start)]
+
+
+def _matcher(backend, keywords=KEYWORDS, **kwargs):
+    blocked = {"ahocorasick": None} if backend == "python" else {}
+    with patch.dict(sys.modules, blocked):
+        matcher = KeywordMatcher(keywords, **kwargs)
+    assert matcher.backend == backend
+    return matcher
+
+
+class TestKeywordMatcher:
+    @pytest.mark.parametrize("backend", _backends())
+    def test_returns_every_keyword_in_one_scan(self, backend):
+        matcher = _matcher(backend)
+
+        assert matcher.find("sr. data scientist, team lead (brazil)") == {"sr.", "data", "data scientist", "ad", "lead", "team lead", "brazil"}
+        assert matcher.find("head of it ") == {"head", "ad", "it "}
+        assert matcher.find("engineer") == frozenset()
+        assert matcher.find("") == frozenset()
+
+    @pytest.mark.parametrize("backend", _backends())
+    def test_matches_substring_checks_on_random_texts(self, backend):
+        matcher = _matcher(backend)
+        rng = random.Random(7)
+        alphabet = "staffleadtechmdrbzil.&s "
+
+        for _ in range(2000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            assert matcher.scan(text) == {keyword for keyword in KEYWORDS if keyword in text}, text
+
+    @pytest.mark.parametrize("backend", _backends())
+    def test_without_keywords_finds_nothing(self, backend):
+        matcher = _matcher(backend, keywords=("",))
+
+        assert matcher.keywords == frozenset()
+        assert matcher.find("anything") == frozenset()
+
+    def test_native_backend_reports_every_hit(self):
+        with patch.dict(sys.modules, {"ahocorasick": SimpleNamespace(Automaton=_FakeAutomaton)}):
+            matcher = KeywordMatcher(KEYWORDS)
+            empty = KeywordMatcher(())
+
+        assert matcher.backend == "ahocorasick"
+        assert matcher.find("team lead (brazil)") == {"lead", "ad", "team lead", "brazil"}
+        assert empty.find("team lead") == frozenset()
+
+    def test_caches_hits_per_text(self):
+        matcher = KeywordMatcher(KEYWORDS, cache_size=2)
+
+        matcher.find("staff engineer")
+        matcher.find("staff engineer")
+        matcher.find("tech lead")
+        matcher.find("data")
+
+        stats = matcher.get_stats()
+        assert (stats["hits"], stats["misses"], stats["cachedTexts"]) == (1, 3, 2)
+        assert stats["keywords"] == len(KEYWORDS)
+
+
+class TestKeywordIndex:
+    def test_rebuilds_from_every_registered_group(self):
+        index = KeywordIndex()
+        index.register("rules", ["brazil", "latam"])
+        index.register("normalize", ["staff", "brazil"])
+
+        assert index.matcher.keywords == {"brazil", "latam", "staff"}
+        assert index.find("staff engineer - latam") == {"staff", "latam"}
+
+    def test_replaces_a_group_and_keeps_the_matcher_when_unchanged(self):
+        index = KeywordIndex()
+        index.register("rules", ["brazil"])
+        matcher = index.matcher
+
+        index.register("rules", ["brazil"])
+        assert index.matcher is matcher
+
+        index.register("rules", ["latam"])
+        assert index.matcher.keywords == {"latam"}
+
+    @pytest.mark.parametrize("value, expected", [("true", True), ("TRUE", True), ("false", False), (None, False)])
+    def test_keyword_index_enabled(self, value, expected, monkeypatch):
+        if value is None:
+            monkeypatch.delenv("KEYWORD_INDEX", raising=False)
+        else:
+            monkeypatch.setenv("KEYWORD_INDEX", value)
+
+        assert keyword_index_enabled() is expected
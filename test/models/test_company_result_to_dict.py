@@ -0,0 +1,32 @@
+from src.models.company_result import CompanyResult
+from src.models.enums.run_status_enum import RunStatusEnum
+
+
+class TestCompanyResultToDict:
+    def test_company_result_to_dict(self):
+        result = CompanyResult('deel', RunStatusEnum.SUCCESS, total_jobs=100, friendly_jobs=5, saved_jobs=5, inserted_jobs=4,
+                               existing_jobs=1, skipped_jobs=3, spooled_jobs=1, failed_jobs=0,
+                               removed_jobs=2, elapsed_seconds=1.234)
+
+        assert result.to_dict() == {
+            'company': 'deel',
+            'status': 'Success',
+            'totalJobs': 100,
+            'friendlyJobs': 5,
+            'savedJobs': 5,
+            'insertedJobs': 4,
+            'existingJobs': 1,
+            'skippedJobs': 3,
+            'spooledJobs': 1,
+            'failedJobs': 0,
+            'removedJobs': 2,
+            'elapsedSeconds': 1.23,
+            'error': None
+        }
+
+    def test_company_result_defaults(self):
+        result = CompanyResult('deel', RunStatusEnum.ERROR, error='boom')
+
+        assert result.total_jobs == 0
+        assert result.saved_jobs == 0
+        assert result.to_dict()['error'] == 'boom'
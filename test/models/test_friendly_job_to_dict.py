@@ -2,37 +2,62 @@ from src.models.friendly_job import FriendlyJob
 from src.models.job import Job
 
 
+def _job() -> Job:
+    return Job(
+        id='job-123',
+        title='Software Engineer',
+        updatedAt='2023-01-01',
+        suppressDescriptionOpening=False,
+        suppressDescriptionClosing=True,
+        departmentId='dept-1',
+        departmentName='Engineering',
+        locationId='loc-1',
+        locationName='Remote',
+        workplaceType='remote',
+        employmentType='full-time',
+        isListed=True,
+        jobId='job-456',
+        jobRequisitionId='req-789',
+        teamId='team-1',
+        teamName='Backend',
+        publishedDate='2023-01-01',
+        applicationDeadline='2023-12-31',
+        shouldDisplayCompensationOnJobBoard='yes',
+        secondaryLocations=['São Paulo'],
+        compensationTierSummary='$100k-150k',
+        userRoles=['developer']
+    )
+
+
 class TestFriendlyJobToDict:
     def test_friendly_job_to_dict(self):
-        job = Job(
-            id='job-123',
-            title='Software Engineer',
-            updatedAt='2023-01-01',
-            suppressDescriptionOpening=False,
-            suppressDescriptionClosing=True,
-            departmentId='dept-1',
-            departmentName='Engineering',
-            locationId='loc-1',
-            locationName='Remote',
-            workplaceType='remote',
-            employmentType='full-time',
-            isListed=True,
-            jobId='job-456',
-            jobRequisitionId='req-789',
-            teamId='team-1',
-            teamName='Backend',
-            publishedDate='2023-01-01',
-            applicationDeadline='2023-12-31',
-            shouldDisplayCompensationOnJobBoard='yes',
-            secondaryLocations=['São Paulo'],
-            compensationTierSummary='$100k-150k',
-            userRoles=['developer']
-        )
-
-        friendly_job = FriendlyJob(job, {'reason': 'test', 'match': True})
+        friendly_job = FriendlyJob(_job(), {'reason': 'test', 'match': True})
         result = friendly_job.to_dict()
 
         assert result['id'] == 'job-123'
         assert result['title'] == 'Software Engineer'
         assert result['departmentName'] == 'Engineering'
         assert result['is_brazilian_friendly'] == {'reason': 'test', 'match': True}
+
+    def test_friendly_job_to_dict_key_order(self):
+        result = FriendlyJob(_job(), None).to_dict()
+
+        assert list(result) == ['id', 'title', 'updatedAt', 'suppressDescriptionOpening', 'suppressDescriptionClosing', 'departmentId',
+                                'departmentName', 'locationId', 'locationName', 'workplaceType', 'employmentType', 'isListed', 'jobId',
+                                'jobRequisitionId', 'teamId', 'teamName', 'publishedDate', 'applicationDeadline',
+                                'shouldDisplayCompensationOnJobBoard', 'secondaryLocations', 'compensationTierSummary', 'userRoles',
+                                'is_brazilian_friendly']
+
+    def test_jobs_are_slotted(self):
+        friendly_job = FriendlyJob(_job(), None)
+
+        assert not hasattr(_job(), '__dict__')
+        assert not hasattr(friendly_job, '__dict__')
+
+    def test_friendly_job_is_a_view_over_the_job(self):
+        job = _job()
+        friendly_job = FriendlyJob(job, None)
+
+        assert friendly_job.job is job
+        assert friendly_job.secondaryLocations is job.secondaryLocations
+        assert FriendlyJob(object(), None).title is None
@@ -0,0 +1,9 @@
+from src.models.enums.insert_status_enum import InsertStatusEnum
+from src.models.insert_result import InsertResult
+
+
+class TestInsertResultToDict:
+    def test_to_dict(self):
+        result = InsertResult("job-1", InsertStatusEnum.FAILED, error="Validation failed")
+
+        assert result.to_dict() == {"jobId": "job-1", "status": "Failed", "error": "Validation failed"}
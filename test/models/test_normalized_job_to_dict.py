@@ -40,3 +40,5 @@ class TestNormalizedJobToDict:
         }
 
         assert result == expected_dict
+        assert list(result) == list(expected_dict)
+        assert not hasattr(normalized_job, '__dict__')
@@ -0,0 +1,112 @@
+from src.parsers.app_data_parser import AppDataScanner, extract_app_data, find_app_data_span
+
+
+class TestAppDataParser:
+    def test_extract_app_data_pattern(self):
+        assert extract_app_data('window.__appData = {"test": "value"};') == '{"test": "value"}'
+        assert extract_app_data('window.__appData={"test": "value"};') == '{"test": "value"}'
+
+        html = '''window.__appData = {
+            "test": "value",
+            "nested": {"key": "value"}
+        };'''
+        assert extract_app_data(html).endswith('"nested": {"key": "value"}\n        }')
+
+        assert extract_app_data('no app data here') is None
+
+    def test_statement_terminator_inside_string(self):
+        html = '<script>window.__appData = {"title": "a };", "n": {"x": "}"}};var other = {};</script>'
+
+        assert extract_app_data(html) == '{"title": "a };", "n": {"x": "}"}}'
+
+    def test_escaped_quotes_and_braces_inside_string(self):
+        html = r'window.__appData = {"title": "say \"}\" and \\", "next": "{"};'
+
+        assert extract_app_data(html) == r'{"title": "say \"}\" and \\", "next": "{"}'
+
+    def test_assignment_without_object(self):
+        assert extract_app_data('window.__appData = null;') is None
+
+    def test_skips_assignment_without_object(self):
+        assert extract_app_data('window.__appData = null; window.__appData = {"a": 1};') == '{"a": 1}'
+        assert extract_app_data(b'window.__appData = null; window.__appData = {"a": 1};').tobytes() == b'{"a": 1}'
+
+    def test_assignment_at_end_of_page(self):
+        assert extract_app_data('window.__appData = ') is None
+
+    def test_unterminated_object(self):
+        assert extract_app_data('window.__appData = {"jobBoard": {"jobPostings": [') is None
+
+    def test_bytes_returns_zero_copy_view(self):
+        page = bytearray(b'<html>window.__appData = {"a": "};"};</html>')
+
+        view = extract_app_data(page)
+
+        assert isinstance(view, memoryview)
+        assert view.tobytes() == b'{"a": "};"}'
+        assert view.obj is page
+
+    def test_find_app_data_span(self):
+        page = 'xx window.__appData = {"a": 1}; yy'
+
+        start, end = find_app_data_span(page)
+
+        assert page[start:end] == '{"a": 1}'
+
+
+class TestAppDataScanner:
+    PAGE = (b'<html><script>var x = {"window.__appData": 1};</script>'
+            b'<script>window.__appData = {"jobBoard": {"jobPostings": [{"title": "a };\\" }"}]}};</script>'
+            + b'<div>' + b'x' * 1000 + b'</div></html>')
+    EXPECTED = b'{"jobBoard": {"jobPostings": [{"title": "a };\\" }"}]}}'
+
+    def test_every_chunk_size_finds_the_same_object(self):
+        for chunk_size in range(1, 40):
+            scanner = AppDataScanner()
+            for offset in range(0, len(self.PAGE), chunk_size):
+                if scanner.feed(self.PAGE[offset:offset + chunk_size]):
+                    break
+
+            assert scanner.result().tobytes() == self.EXPECTED, chunk_size
+
+    def test_stops_before_end_of_page(self):
+        scanner = AppDataScanner()
+        end = self.PAGE.index(b'}};</script>') + 2
+
+        assert scanner.feed(self.PAGE[:end]) is True
+        assert scanner.result().tobytes() == self.EXPECTED
+
+    def test_feed_after_complete(self):
+        scanner = AppDataScanner()
+        scanner.feed(self.PAGE)
+
+        assert scanner.feed(b'more') is True
+        assert scanner.result().tobytes() == self.EXPECTED
+
+    def test_incomplete_page(self):
+        scanner = AppDataScanner()
+
+        assert scanner.feed(self.PAGE[:120]) is False
+        assert scanner.result() is None
+
+    def test_page_without_app_data_keeps_bounded_buffer(self):
+        scanner = AppDataScanner()
+        for _ in range(100):
+            scanner.feed(b'<div>' + b'y' * 1000 + b'</div>')
+
+        assert scanner.result() is None
+        assert len(scanner._buffer) <= 64
+
+    def test_skips_assignment_without_object(self):
+        scanner = AppDataScanner()
+
+        scanner.feed(b'window.__appData = null; window.__appData = {"a": 1};')
+
+        assert scanner.result().tobytes() == b'{"a": 1}'
+
+    def test_assignment_split_before_object(self):
+        scanner = AppDataScanner()
+
+        assert scanner.feed(b'window.__appData = ') is False
+        assert scanner.feed(b'{"a": {}}') is True
+        assert scanner.result().tobytes() == b'{"a": {}}'
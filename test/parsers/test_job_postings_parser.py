@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from src.parsers.job_postings_parser import JobPostings
+
+APP_DATA = {
+    "organization": {"name": "Deel", "theme": {"colors": ["#fff", {"nested": "}]\""}]}},
+    "flags": [True, False, None, -1.5e3],
+    "jobBoard": {
+        "teams": [{"id": "t1"}],
+        "jobPostings": [
+            {"id": "1", "title": "Engineer \"}]\" Brazil", "secondaryLocations": []},
+            {"id": "2", "title": "Designer", "secondaryLocations": [{"locationName": "LATAM"}]}
+        ]
+    }
+}
+
+
+def _sources(document):
+    text = json.dumps(document, indent=2)
+    return [text, text.encode(), memoryview(text.encode())]
+
+
+class TestJobPostings:
+    @pytest.mark.parametrize("source", _sources(APP_DATA))
+    def test_iterates_postings_from_app_data(self, source):
+        postings = JobPostings.from_app_data(source)
+
+        assert list(postings) == APP_DATA["jobBoard"]["jobPostings"]
+
+    @pytest.mark.parametrize("source", _sources(APP_DATA))
+    def test_raw_returns_postings_array(self, source):
+        raw = JobPostings.from_app_data(source).raw()
+
+        assert json.loads(bytes(raw) if isinstance(raw, memoryview) else raw) == APP_DATA["jobBoard"]["jobPostings"]
+
+    def test_iteration_is_lazy_and_repeatable(self):
+        postings = JobPostings.from_app_data(json.dumps(APP_DATA))
+        iterator = iter(postings)
+
+        assert next(iterator)["id"] == "1"
+        assert [posting["id"] for posting in postings] == ["1", "2"]
+
+    @pytest.mark.parametrize("source", _sources({"jobBoard": {"jobPostings": []}}))
+    def test_empty_postings(self, source):
+        assert list(JobPostings.from_app_data(source)) == []
+
+    def test_from_json(self):
+        assert list(JobPostings.from_json(b'  [{"id": "1"}, {"id": "2"}]')) == [{"id": "1"}, {"id": "2"}]
+
+    def test_from_json_not_an_array(self):
+        with pytest.raises(TypeError, match="not an array"):
+            JobPostings.from_json('{"id": "1"}')
+
+    def test_missing_job_board(self):
+        with pytest.raises(KeyError, match="jobBoard"):
+            JobPostings.from_app_data('{"otherData": "value"}')
+
+    def test_missing_job_postings(self):
+        with pytest.raises(KeyError, match="jobPostings"):
+            JobPostings.from_app_data(b'{"jobBoard": {"otherData": "value"}}')
+
+    def test_null_job_board(self):
+        with pytest.raises(TypeError, match="jobBoard is not an object"):
+            JobPostings.from_app_data('{"jobBoard": null}')
+
+    def test_job_postings_not_an_array(self):
+        with pytest.raises(TypeError, match="jobPostings is not an array"):
+            JobPostings.from_app_data('{"jobBoard": {"jobPostings": {}}}')
+
+    @pytest.mark.parametrize("source", [
+        '{invalid json}',
+        '[]',
+        '{"a" 1, "jobBoard": {}}',
+        '{"a": 1 "jobBoard": {}}',
+        '{"a": , "jobBoard": {}}',
+        '{"a": {"b": [1, 2}',
+    ])
+    def test_malformed_documents(self, source):
+        with pytest.raises(ValueError):
+            JobPostings.from_app_data(source)
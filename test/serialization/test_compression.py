@@ -0,0 +1,85 @@
+import gzip
+import sys
+import zlib
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.serialization.compression import ZSTD_LEVEL, BodyCompressor
+
+BODY = b'[' + b','.join(b'{"id":"job-%d","title":"Senior Software Engineer","company":"deel"}' % index for index in range(50)) + b']'
+
+
+class _ZstdCompressorStandIn:
+    levels = []
+
+    def __init__(self, level):
+        self.levels.append(level)
+
+    def compress(self, body):
+        return b"zstd:" + zlib.compress(body)
+
+
+class TestBodyCompressor:
+    def test_disabled_by_default(self):
+        compressor = BodyCompressor()
+
+        assert compressor.compress(BODY) == (BODY, None)
+        assert compressor.get_stats()["compressedBodies"] == 0
+
+    def test_gzip_above_threshold(self):
+        compressor = BodyCompressor("gzip", min_bytes=100)
+
+        compressed, encoding = compressor.compress(BODY)
+
+        assert encoding == "gzip"
+        assert gzip.decompress(compressed) == BODY
+        assert compressor.get_stats() == {"encoding": "gzip", "compressedBodies": 1, "rawBytes": len(BODY),
+                                          "compressedBytes": len(compressed)}
+
+    def test_gzip_output_is_deterministic(self):
+        compressor = BodyCompressor("gzip", min_bytes=0)
+
+        assert compressor.compress(BODY) == compressor.compress(BODY)
+
+    def test_small_and_empty_bodies_are_sent_as_is(self):
+        compressor = BodyCompressor(" GZIP ", min_bytes=len(BODY) + 1)
+
+        assert compressor.compress(BODY) == (BODY, None)
+        assert compressor.compress(None) == (None, None)
+
+    def test_zstd(self):
+        zstandard = pytest.importorskip("zstandard")
+        compressor = BodyCompressor("zstd", min_bytes=0)
+
+        compressed, encoding = compressor.compress(BODY)
+
+        assert encoding == "zstd"
+        assert zstandard.ZstdDecompressor().decompress(compressed) == BODY
+
+    def test_zstd_with_stand_in_module(self):
+        _ZstdCompressorStandIn.levels = []
+
+        with patch.dict(sys.modules, {"zstandard": SimpleNamespace(ZstdCompressor=_ZstdCompressorStandIn)}):
+            compressor = BodyCompressor("zstd", min_bytes=0)
+
+        compressed, encoding = compressor.compress(BODY)
+
+        assert encoding == "zstd"
+        assert _ZstdCompressorStandIn.levels == [ZSTD_LEVEL]
+        assert zlib.decompress(compressed.removeprefix(b"zstd:")) == BODY
+        assert compressor.get_stats()["compressedBytes"] == len(compressed)
+
+    def test_zstd_falls_back_to_gzip_when_not_installed(self):
+        with patch.dict(sys.modules, {"zstandard": None}):
+            compressor = BodyCompressor("zstd", min_bytes=0)
+
+        compressed, encoding = compressor.compress(BODY)
+
+        assert encoding == "gzip"
+        assert gzip.decompress(compressed) == BODY
+
+    def test_unknown_encoding_raises(self):
+        with pytest.raises(ValueError):
+            BodyCompressor("brotli")
@@ -0,0 +1,157 @@
+import json
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.serialization import json_codec
+from src.serialization.json_codec import create_codec
+
+DOCUMENT = {"title": "Engenheira de Software São Paulo", "id": "1", "tags": ["remote", None, True], "salary": 1500}
+
+
+def _stdlib_dumps(obj, sort_keys=False):
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _stdlib_loads(data):
+    return json.loads(data.tobytes() if isinstance(data, memoryview) else data)
+
+
+class _MsgspecDecodeError(Exception):
+    pass
+
+
+class _MsgspecDecoder:
+    def decode(self, data):
+        try:
+            return _stdlib_loads(data)
+        except ValueError as e:
+            raise _MsgspecDecodeError(str(e))
+
+
+class _MsgspecEncoder:
+    def __init__(self, order=None):
+        self.order = order
+
+    def encode(self, obj):
+        return _stdlib_dumps(obj, sort_keys=self.order == "sorted")
+
+
+# Stand-ins with the slice of the orjson/msgspec APIs the codecs use, so their wiring is tested without the packages
+ORJSON_STAND_IN = SimpleNamespace(OPT_SORT_KEYS=1, loads=_stdlib_loads,
+                                  dumps=lambda obj, option=0: _stdlib_dumps(obj, sort_keys=bool(option & 1)))
+MSGSPEC_STAND_IN = SimpleNamespace(DecodeError=_MsgspecDecodeError, json=SimpleNamespace(Decoder=_MsgspecDecoder, Encoder=_MsgspecEncoder))
+
+
+def _installed_backends():
+    backends = ["json"]
+    for name in ("orjson", "msgspec"):
+        try:
+            __import__(name)
+            backends.append(name)
+        except ImportError:
+            pass
+    return backends
+
+
+class TestCreateCodec:
+    @pytest.mark.parametrize("backend", _installed_backends())
+    def test_round_trips_documents(self, backend):
+        codec = create_codec(backend)
+
+        encoded = codec.dumps(DOCUMENT)
+
+        assert codec.name == backend
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == DOCUMENT
+
+    @pytest.mark.parametrize("backend", _installed_backends())
+    def test_loads_accepts_str_bytes_and_memoryview(self, backend):
+        codec = create_codec(backend)
+        payload = json.dumps(DOCUMENT, ensure_ascii=False)
+
+        assert codec.loads(payload) == DOCUMENT
+        assert codec.loads(payload.encode()) == DOCUMENT
+        assert codec.loads(memoryview(b"xx" + payload.encode())[2:]) == DOCUMENT
+
+    @pytest.mark.parametrize("backend", _installed_backends())
+    def test_sort_keys_matches_stdlib_canonical_form(self, backend):
+        codec = create_codec(backend)
+
+        expected = json.dumps(DOCUMENT, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+        assert codec.dumps(DOCUMENT, sort_keys=True) == expected
+
+    @pytest.mark.parametrize("backend", _installed_backends())
+    def test_malformed_input_raises_value_error(self, backend):
+        codec = create_codec(backend)
+
+        with pytest.raises(ValueError):
+            codec.loads(b'{"id": ')
+
+    def test_auto_falls_back_to_stdlib_when_fast_backends_are_missing(self):
+        with patch.dict(sys.modules, {"orjson": None, "msgspec": None}):
+            codec = create_codec("auto")
+
+        assert codec.name == "json"
+
+    def test_auto_prefers_msgspec_when_orjson_is_missing(self):
+        pytest.importorskip("msgspec")
+
+        with patch.dict(sys.modules, {"orjson": None}):
+            codec = create_codec("auto")
+
+        assert codec.name == "msgspec"
+
+    def test_requested_backend_falls_back_to_stdlib_when_missing(self):
+        with patch.dict(sys.modules, {"orjson": None}):
+            codec = create_codec("orjson")
+
+        assert codec.name == "json"
+
+    def test_backend_name_is_case_insensitive(self):
+        assert create_codec(" JSON ").name == "json"
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError):
+            create_codec("yaml")
+
+
+@pytest.mark.parametrize("backend, module", [("orjson", ORJSON_STAND_IN), ("msgspec", MSGSPEC_STAND_IN)])
+class TestFastBackends:
+    def test_round_trips_documents(self, backend, module):
+        with patch.dict(sys.modules, {backend: module}):
+            codec = create_codec(backend)
+
+        assert codec.name == backend
+        assert codec.loads(codec.dumps(DOCUMENT)) == DOCUMENT
+        assert codec.loads(memoryview(codec.dumps(DOCUMENT))) == DOCUMENT
+
+    def test_sort_keys_matches_stdlib_canonical_form(self, backend, module):
+        with patch.dict(sys.modules, {backend: module}):
+            codec = create_codec(backend)
+
+        assert codec.dumps({"b": 1, "a": 2}, sort_keys=True) == b'{"a":2,"b":1}'
+        assert codec.dumps({"b": 1, "a": 2}) == b'{"b":1,"a":2}'
+
+    def test_malformed_input_raises_value_error(self, backend, module):
+        with patch.dict(sys.modules, {backend: module}):
+            codec = create_codec(backend)
+
+        with pytest.raises(ValueError):
+            codec.loads(b'{"id": ')
+
+    def test_auto_picks_the_first_available_backend(self, backend, module):
+        with patch.dict(sys.modules, {"orjson": None, "msgspec": None, backend: module}):
+            codec = create_codec("auto")
+
+        assert codec.name == backend
+
+
+class TestModuleFunctions:
+    def test_delegates_to_selected_codec(self):
+        assert json_codec.backend_name() in ("orjson", "msgspec", "json")
+        assert json_codec.loads(json_codec.dumps(DOCUMENT)) == DOCUMENT
+        assert json_codec.dumps({"b": 1, "a": 2}, sort_keys=True) == b'{"a":2,"b":1}'
@@ -1,118 +1,273 @@
 import json
-from unittest.mock import patch, MagicMock
-from src.services.fetch_jobs_service import fetch_jobs, APP_DATA_REGEX
+from unittest.mock import patch
+from src.models.board_page import BoardPage
+from src.models.board_snapshot import BoardSnapshot
+from src.services.fetch_jobs_service import fetch_board, save_board, _fingerprint_job_postings
+from src.storage.board_cache import BoardCache
 
 
+@patch("src.services.fetch_jobs_service._board_cache", None)
 class TestFetchJobsService:
-    @patch("src.services.fetch_jobs_service.ashby_client.fetch_listings")
-    def test_fetch_jobs_no_response(self, mock_fetch_listings):
-        mock_fetch_listings.return_value = None
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_no_response(self, mock_fetch_board_page):
+        mock_fetch_board_page.return_value = None
 
-        result = fetch_jobs("test-company")
+        result = fetch_board("test-company")
 
         assert result is None
-        mock_fetch_listings.assert_called_once_with("test-company")
+        mock_fetch_board_page.assert_called_once_with("test-company", None, None)
 
-    @patch("src.services.fetch_jobs_service.ashby_client.fetch_listings")
-    def test_fetch_jobs_empty_response(self, mock_fetch_listings):
-        mock_fetch_listings.return_value = ""
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_empty_response(self, mock_fetch_board_page):
+        mock_fetch_board_page.return_value = BoardPage("")
 
-        result = fetch_jobs("test-company")
+        result = fetch_board("test-company")
 
         assert result is None
 
-    @patch("src.services.fetch_jobs_service.ashby_client.fetch_listings")
-    def test_fetch_jobs_no_app_data_match(self, mock_fetch_listings):
-        mock_fetch_listings.return_value = "<html><body>No app data here</body></html>"
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_no_app_data_match(self, mock_fetch_board_page):
+        mock_fetch_board_page.return_value = BoardPage("<html><body>No app data here</body></html>")
 
-        result = fetch_jobs("test-company")
+        result = fetch_board("test-company")
 
         assert result is None
 
-    @patch("src.services.fetch_jobs_service.ashby_client.fetch_listings")
-    def test_fetch_jobs_invalid_json(self, mock_fetch_listings):
-        mock_fetch_listings.return_value = 'window.__appData = {invalid json};'
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_invalid_json(self, mock_fetch_board_page):
+        mock_fetch_board_page.return_value = BoardPage('window.__appData = {invalid json};')
 
-        result = fetch_jobs("test-company")
+        result = fetch_board("test-company")
 
         assert result is None
 
-    @patch("src.services.fetch_jobs_service.ashby_client.fetch_listings")
-    def test_fetch_jobs_missing_job_board_key(self, mock_fetch_listings):
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_missing_job_board_key(self, mock_fetch_board_page):
         app_data = json.dumps({"otherData": "value"})
-        mock_fetch_listings.return_value = f'window.__appData = {app_data};'
+        mock_fetch_board_page.return_value = BoardPage(f'window.__appData = {app_data};')
 
-        result = fetch_jobs("test-company")
+        result = fetch_board("test-company")
 
         assert result is None
 
-    @patch("src.services.fetch_jobs_service.ashby_client.fetch_listings")
-    def test_fetch_jobs_missing_job_postings_key(self, mock_fetch_listings):
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_missing_job_postings_key(self, mock_fetch_board_page):
         app_data = json.dumps({"jobBoard": {"otherData": "value"}})
-        mock_fetch_listings.return_value = f'window.__appData = {app_data};'
+        mock_fetch_board_page.return_value = BoardPage(f'window.__appData = {app_data};')
 
-        result = fetch_jobs("test-company")
+        result = fetch_board("test-company")
 
         assert result is None
 
-    @patch("src.services.fetch_jobs_service.ashby_client.fetch_listings")
-    def test_fetch_jobs_null_job_board(self, mock_fetch_listings):
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_null_job_board(self, mock_fetch_board_page):
         app_data = json.dumps({"jobBoard": None})
-        mock_fetch_listings.return_value = f'window.__appData = {app_data};'
+        mock_fetch_board_page.return_value = BoardPage(f'window.__appData = {app_data};')
 
-        result = fetch_jobs("test-company")
+        result = fetch_board("test-company")
 
         assert result is None
 
-    @patch("src.services.fetch_jobs_service.ashby_client.fetch_listings")
-    @patch("src.services.fetch_jobs_service.dicts_to_jobs")
-    def test_fetch_jobs_success(self, mock_dicts_to_jobs, mock_fetch_listings):
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_success(self, mock_fetch_board_page):
         job_postings = [
             {"id": 1, "title": "Job 1"},
             {"id": 2, "title": "Job 2"}
         ]
         app_data = json.dumps({"jobBoard": {"jobPostings": job_postings}})
-        mock_fetch_listings.return_value = f'window.__appData = {app_data};'
+        mock_fetch_board_page.return_value = BoardPage(f'window.__appData = {app_data};')
 
-        mock_job1 = MagicMock()
-        mock_job2 = MagicMock()
-        mock_dicts_to_jobs.return_value = [mock_job1, mock_job2]
+        result = fetch_board("test-company")
 
-        result = fetch_jobs("test-company")
+        assert list(result.job_postings) == job_postings
 
-        assert result == [mock_job1, mock_job2]
-        mock_dicts_to_jobs.assert_called_once_with(job_postings)
-
-    @patch("src.services.fetch_jobs_service.ashby_client.fetch_listings")
-    @patch("src.services.fetch_jobs_service.dicts_to_jobs")
-    def test_fetch_jobs_empty_job_postings(self, mock_dicts_to_jobs, mock_fetch_listings):
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_empty_job_postings(self, mock_fetch_board_page):
         app_data = json.dumps({"jobBoard": {"jobPostings": []}})
-        mock_fetch_listings.return_value = f'window.__appData = {app_data};'
-        mock_dicts_to_jobs.return_value = []
-
-        result = fetch_jobs("test-company")
-
-        assert result == []
-        mock_dicts_to_jobs.assert_called_once_with([])
-
-    def test_app_data_regex_pattern(self):
-        html = 'window.__appData = {"test": "value"};'
-        match = APP_DATA_REGEX.search(html)
-        assert match is not None
-        assert match.group(1) == '{"test": "value"}'
-
-        html = 'window.__appData={"test": "value"};'
-        match = APP_DATA_REGEX.search(html)
-        assert match is not None
-        assert match.group(1) == '{"test": "value"}'
-
-        html = '''window.__appData = {
-            "test": "value",
-            "nested": {"key": "value"}
-        };'''
-        match = APP_DATA_REGEX.search(html)
-        assert match is not None
-
-        html = 'no app data here'
-        match = APP_DATA_REGEX.search(html)
-        assert match is None
+        mock_fetch_board_page.return_value = BoardPage(f'window.__appData = {app_data};')
+
+        result = fetch_board("test-company")
+
+        assert list(result.job_postings) == []
+
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_posting_containing_statement_terminator(self, mock_fetch_board_page):
+        job_postings = [{"id": "1", "title": "Engineer", "compensationTierSummary": "if (x) { y(); };"}]
+        app_data = json.dumps({"jobBoard": {"jobPostings": job_postings}})
+        mock_fetch_board_page.return_value = BoardPage(f'<script>window.__appData = {app_data};</script>')
+
+        result = fetch_board("test-company")
+
+        assert list(result.job_postings) == job_postings
+
+
+class TestFetchBoard:
+    def _page(self, postings, etag=None, last_modified=None):
+        app_data = json.dumps({"jobBoard": {"jobPostings": postings}})
+        return BoardPage(f'window.__appData = {app_data};', etag, last_modified)
+
+    @patch("src.services.fetch_jobs_service._board_cache", None)
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_without_cache(self, mock_fetch_board_page):
+        mock_fetch_board_page.return_value = self._page([{"id": "1"}], etag='"v1"')
+
+        board = fetch_board("test-company")
+
+        assert list(board.job_postings) == [{"id": "1"}]
+        assert board.etag == '"v1"'
+        assert board.not_modified is False
+        mock_fetch_board_page.assert_called_once_with("test-company", None, None)
+
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_sends_cached_validators(self, mock_fetch_board_page, tmp_path):
+        cache = BoardCache(str(tmp_path))
+        cache.put("test-company", {"etag": '"v1"', "lastModified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+        cache.put_payload("test-company", '[{"id": "1"}]')
+        mock_fetch_board_page.return_value = BoardPage(None, '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT", not_modified=True)
+
+        with patch("src.services.fetch_jobs_service._board_cache", cache):
+            board = fetch_board("test-company")
+
+        assert board.not_modified is True
+        assert board.job_postings is None
+        mock_fetch_board_page.assert_called_once_with("test-company", '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT")
+
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_invalid_page(self, mock_fetch_board_page):
+        mock_fetch_board_page.return_value = BoardPage("<html></html>")
+
+        assert fetch_board("test-company") is None
+
+    def test_save_board_stores_validators_and_postings(self, tmp_path):
+        cache = BoardCache(str(tmp_path))
+        board = BoardSnapshot("test-company", [{"id": "1"}], '"v2"', "Tue, 02 Jan 2024 00:00:00 GMT")
+
+        with patch("src.services.fetch_jobs_service._board_cache", cache):
+            save_board(board)
+
+        assert cache.get("test-company") == {
+            "etag": '"v2"',
+            "lastModified": "Tue, 02 Jan 2024 00:00:00 GMT",
+            "fingerprint": None,
+            "rules": None
+        }
+        assert json.loads(cache.get_payload("test-company")) == [{"id": "1"}]
+
+    def test_save_board_skips_not_modified_boards(self, tmp_path):
+        cache = BoardCache(str(tmp_path))
+        board = BoardSnapshot("test-company", [{"id": "1"}], '"v1"', None, not_modified=True)
+
+        with patch("src.services.fetch_jobs_service._board_cache", cache):
+            save_board(board)
+
+        assert cache.get("test-company") is None
+
+    @patch("src.services.fetch_jobs_service._board_cache", None)
+    def test_save_board_without_cache(self):
+        save_board(BoardSnapshot("test-company", []))
+
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_detects_unchanged_content(self, mock_fetch_board_page, tmp_path):
+        cache = BoardCache(str(tmp_path))
+        postings = [{"id": "1", "title": "Engineer"}]
+        cache.put("test-company", {"fingerprint": _fingerprint_job_postings(postings)})
+        mock_fetch_board_page.return_value = self._page([{"title": "Engineer", "id": "1"}], etag='"v2"')
+
+        with patch("src.services.fetch_jobs_service._board_cache", cache):
+            board = fetch_board("test-company")
+
+        assert board.unchanged is True
+        assert board.not_modified is False
+        assert board.etag == '"v2"'
+
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_detects_changed_content(self, mock_fetch_board_page, tmp_path):
+        cache = BoardCache(str(tmp_path))
+        cache.put("test-company", {"fingerprint": _fingerprint_job_postings([{"id": "1"}])})
+        mock_fetch_board_page.return_value = self._page([{"id": "1"}, {"id": "2"}])
+
+        with patch("src.services.fetch_jobs_service._board_cache", cache):
+            board = fetch_board("test-company")
+
+        assert board.unchanged is False
+        assert board.fingerprint == _fingerprint_job_postings([{"id": "1"}, {"id": "2"}])
+
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_first_run_is_not_unchanged(self, mock_fetch_board_page, tmp_path):
+        mock_fetch_board_page.return_value = self._page([])
+
+        with patch("src.services.fetch_jobs_service._board_cache", BoardCache(str(tmp_path))):
+            board = fetch_board("test-company")
+
+        assert board.unchanged is False
+        assert board.fingerprint is not None
+
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_with_same_rules_sends_validators(self, mock_fetch_board_page, tmp_path):
+        cache = BoardCache(str(tmp_path))
+        cache.put("test-company", {"etag": '"v1"', "rules": "abc"})
+        mock_fetch_board_page.return_value = BoardPage(None, '"v1"', None, not_modified=True)
+
+        with patch("src.services.fetch_jobs_service._board_cache", cache):
+            board = fetch_board("test-company", "abc")
+
+        assert board.not_modified is True
+        mock_fetch_board_page.assert_called_once_with("test-company", '"v1"', None)
+
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_after_rules_change_refetches_and_reprocesses(self, mock_fetch_board_page, tmp_path):
+        cache = BoardCache(str(tmp_path))
+        postings = [{"id": "1"}]
+        cache.put("test-company", {"etag": '"v1"', "fingerprint": _fingerprint_job_postings(postings, "abc"), "rules": "abc"})
+        mock_fetch_board_page.return_value = self._page(postings, etag='"v1"')
+
+        with patch("src.services.fetch_jobs_service._board_cache", cache):
+            board = fetch_board("test-company", "def")
+            save_board(board)
+
+        mock_fetch_board_page.assert_called_once_with("test-company", None, None)
+        assert board.unchanged is False
+        assert board.fingerprint == _fingerprint_job_postings(postings, "def")
+        assert cache.get("test-company")["rules"] == "def"
+
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_with_malformed_posting(self, mock_fetch_board_page, tmp_path, caplog):
+        mock_fetch_board_page.return_value = BoardPage('window.__appData = {"jobBoard": {"jobPostings": [{"id": "1"}, {"id": oops}]}};')
+
+        with patch("src.services.fetch_jobs_service._board_cache", BoardCache(str(tmp_path))):
+            assert fetch_board("test-company") is None
+
+        assert "Failed to parse app data JSON for company: test-company" in caplog.text
+
+    def test_fingerprint_is_canonical(self):
+        assert _fingerprint_job_postings([{"a": 1, "b": [1, 2]}]) == _fingerprint_job_postings([{"b": [1, 2], "a": 1}])
+        assert _fingerprint_job_postings([{"a": 1}, {"b": 2}]) != _fingerprint_job_postings([{"b": 2}, {"a": 1}])
+        assert _fingerprint_job_postings(iter([{"a": 1}])) == _fingerprint_job_postings([{"a": 1}])
+        assert _fingerprint_job_postings([{"a": 1}], "abc") != _fingerprint_job_postings([{"a": 1}], "def")
+
+    @patch("src.services.fetch_jobs_service._board_cache", None)
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_from_streamed_app_data(self, mock_fetch_board_page):
+        app_data = json.dumps({"jobBoard": {"jobPostings": [{"id": "1"}]}}).encode()
+        mock_fetch_board_page.return_value = BoardPage(None, app_data=memoryview(app_data))
+
+        board = fetch_board("test-company")
+
+        assert list(board.job_postings) == [{"id": "1"}]
+
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_fetch_board_streamed_page_without_app_data(self, mock_fetch_board_page):
+        mock_fetch_board_page.return_value = BoardPage(None)
+
+        assert fetch_board("test-company") is None
+
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_save_board_stores_raw_postings_without_reencoding(self, mock_fetch_board_page, tmp_path):
+        cache = BoardCache(str(tmp_path))
+        raw_postings = '[{"id": "1",   "title": "Engenheiro"}]'
+        mock_fetch_board_page.return_value = BoardPage(f'window.__appData = {{"jobBoard": {{"jobPostings": {raw_postings}}}}};')
+
+        with patch("src.services.fetch_jobs_service._board_cache", cache):
+            save_board(fetch_board("test-company"))
+
+        assert cache.get_payload("test-company") == raw_postings.encode()
@@ -1,96 +1,80 @@
+import json
+import os
+import pytest
 from unittest.mock import MagicMock, patch
+from src.filters.location_index import location_index
+from src.filters.rule_store import RuleStore
+from src.mappers.job_mapper import dicts_to_jobs, iter_dicts_to_projections
 from src.services.filter_jobs_service import (
-    _lower, _attr_or_key, _filter_by_company, filter_brazilian_friendly_jobs,
-    _mark_brazilian_friendly, _has_brazil_in_secondary_locations,
-    _global_filter, _eightsleep_filter, _supabase_filter, _deel_filter, _resend_filter,
+    _filter_by_company, filter_brazilian_friendly_jobs, _mark_brazilian_friendly,
     REASON_GLOBAL_TITLE_OR_LOCATION, REASON_GLOBAL_SECONDARY_LOCATION,
     REASON_GLOBAL_DEFAULT, REASON_EIGHTSLEEP_MATCH, REASON_EIGHTSLEEP_DEFAULT,
     REASON_SUPABASE_MATCH, REASON_SUPABASE_DEFAULT, REASON_DEEL_MATCH,
-    REASON_DEEL_DEFAULT, REASON_RESEND_MATCH, REASON_RESEND_DEFAULT, IS_BRAZILIAN_FRIENDLY_KEY
+    REASON_DEEL_DEFAULT, REASON_RESEND_MATCH, REASON_RESEND_DEFAULT, IS_BRAZILIAN_FRIENDLY_KEY, COMPANY_RULES,
+    _create_decision_memo, _create_rule_store, get_decision_memo_stats, save_decision_memo
 )
 
 
 class TestFilterJobsService:
-    def test_lower_with_string(self):
-        assert _lower("HELLO") == "hello"
-        assert _lower("  Test  ") == "test"
-
-    def test_lower_with_none(self):
-        assert _lower(None) == ""
-
-    def test_lower_with_number(self):
-        assert _lower(123) == "123"
-
-    def test_attr_or_key_with_dict(self):
-        obj = {"name": "test", "value": 123}
-        assert _attr_or_key(obj, "name") == "test"
-        assert _attr_or_key(obj, "value") == 123
-        assert _attr_or_key(obj, "missing", "default") == "default"
-
-    def test_attr_or_key_with_object(self):
-        obj = MagicMock()
-        obj.name = "test"
-        obj.value = 123
-
-        assert _attr_or_key(obj, "name") == "test"
-        assert _attr_or_key(obj, "value") == 123
-
-    def test_attr_or_key_with_object_missing_attr(self):
-        obj = MagicMock()
-        obj.name = "test"
-
-        del obj.missing
-        assert _attr_or_key(obj, "missing", "default") == "default"
-
-    @patch("src.services.filter_jobs_service._global_filter")
-    def test_filter_by_company_commure_athelas(self, mock_global_filter):
-        mock_global_filter.return_value = True
+    @staticmethod
+    def _job(title="Engineer", location="US Office", secondary_locations=None):
         job = MagicMock()
+        job.title = title
+        job.locationName = location
+        job.secondaryLocations = secondary_locations or []
+        return job
+
+    def test_filter_by_company_commure_athelas(self):
+        job = self._job(title="Engineer - Brazil")
 
         result = _filter_by_company(job, "commure-athelas")
 
         assert result is True
-        mock_global_filter.assert_called_once_with(job)
+        assert job.is_brazilian_friendly == {'isFriendly': True, 'reason': REASON_GLOBAL_TITLE_OR_LOCATION}
 
-    @patch("src.services.filter_jobs_service._global_filter")
-    def test_filter_by_company_posthog(self, mock_global_filter):
-        mock_global_filter.return_value = False
-        job = MagicMock()
+    def test_filter_by_company_posthog(self):
+        job = self._job()
 
         result = _filter_by_company(job, "posthog")
 
         assert result is False
-        mock_global_filter.assert_called_once_with(job)
+        assert job.is_brazilian_friendly == {'isFriendly': False, 'reason': REASON_GLOBAL_DEFAULT}
 
-    @patch("src.services.filter_jobs_service._eightsleep_filter")
-    def test_filter_by_company_eightsleep(self, mock_eightsleep_filter):
-        mock_eightsleep_filter.return_value = True
-        job = MagicMock()
+    def test_filter_by_company_eightsleep(self):
+        job = self._job(location="Remote - LATAM")
 
         result = _filter_by_company(job, "eightsleep")
 
         assert result is True
-        mock_eightsleep_filter.assert_called_once_with(job)
+        assert job.is_brazilian_friendly == {'isFriendly': True, 'reason': REASON_EIGHTSLEEP_MATCH}
 
-    @patch("src.services.filter_jobs_service._supabase_filter")
-    def test_filter_by_company_supabase(self, mock_supabase_filter):
-        mock_supabase_filter.return_value = True
-        job = MagicMock()
+    def test_filter_by_company_supabase(self):
+        job = self._job(title="Engineer - Americas")
 
         result = _filter_by_company(job, "supabase")
 
         assert result is True
-        mock_supabase_filter.assert_called_once_with(job)
+        assert job.is_brazilian_friendly == {'isFriendly': True, 'reason': REASON_SUPABASE_MATCH}
 
-    @patch("src.services.filter_jobs_service._deel_filter")
-    def test_filter_by_company_deel(self, mock_deel_filter):
-        mock_deel_filter.return_value = True
-        job = MagicMock()
+    def test_filter_by_company_deel(self):
+        job = self._job(location="Anywhere (LATAM)")
 
         result = _filter_by_company(job, "deel")
 
         assert result is True
-        mock_deel_filter.assert_called_once_with(job)
+        assert job.is_brazilian_friendly == {'isFriendly': True, 'reason': REASON_DEEL_MATCH}
+
+    def test_filter_by_company_global_match_wins_over_company_rules(self):
+        job = self._job(title="Engineer - Brazil", location="Anywhere (LATAM)")
+
+        assert _filter_by_company(job, "deel") is True
+        assert job.is_brazilian_friendly['reason'] == REASON_GLOBAL_TITLE_OR_LOCATION
+
+    def test_filter_by_company_uses_company_default_reason(self):
+        job = self._job()
+
+        assert _filter_by_company(job, "deel") is False
+        assert job.is_brazilian_friendly == {'isFriendly': False, 'reason': REASON_DEEL_DEFAULT}
 
     def test_filter_by_company_unknown(self):
         job = MagicMock()
@@ -151,6 +135,22 @@ class TestFilterJobsService:
         mock_job_to_friendly.assert_not_called()
         mock_filter_by_company.assert_not_called()
 
+    @pytest.mark.parametrize("company", ["eightsleep", "supabase", "deel", "resend", "other"])
+    def test_filter_brazilian_friendly_jobs_projections_match_full_jobs(self, company):
+        postings = [
+            {"id": "job-1", "title": " Engineer (Brazil) ", "locationName": "Remote", "teamName": " Core "},
+            {"id": "job-2", "title": "Engineer", "locationName": " LATAM ", "secondaryLocations": None},
+            {"id": "job-3", "title": "Engineer", "locationName": "Remote "},
+            {"id": "job-4", "title": "Engineer, Americas", "locationName": "Anywhere (LATAM)"},
+            {"id": "job-5", "title": "Engineer", "locationName": "Berlin", "secondaryLocations": [{"locationName": "São Paulo, Brazil"}]},
+            {"id": "job-6", "title": None, "locationName": None},
+        ]
+
+        from_jobs = filter_brazilian_friendly_jobs(dicts_to_jobs(postings), company)
+        from_projections = filter_brazilian_friendly_jobs(iter_dicts_to_projections(postings), company)
+
+        assert [job.to_dict() for job in from_projections] == [job.to_dict() for job in from_jobs]
+
     def test_mark_brazilian_friendly(self):
         job = MagicMock()
         _mark_brazilian_friendly(job, True, "test_reason")
@@ -158,7 +158,7 @@ class TestFilterJobsService:
         assert hasattr(job, 'is_brazilian_friendly')
         assert job.is_brazilian_friendly == {'isFriendly': True, 'reason': 'test_reason'}
 
-    def test_has_brazil_in_secondary_locations_with_brazil(self):
+    def test_global_filter_secondary_locations_with_brazil(self):
         job = MagicMock()
         location1 = MagicMock()
         location1.locationName = "Brazil Office"
@@ -166,10 +166,10 @@ class TestFilterJobsService:
         location2.locationName = "US Office"
         job.secondaryLocations = [location1, location2]
 
-        result = _has_brazil_in_secondary_locations(job)
+        result = _filter_by_company(job, "unknown")
         assert result is True
 
-    def test_has_brazil_in_secondary_locations_without_brazil(self):
+    def test_global_filter_secondary_locations_without_brazil(self):
         job = MagicMock()
         location1 = MagicMock()
         location1.locationName = "US Office"
@@ -177,21 +177,21 @@ class TestFilterJobsService:
         location2.locationName = "UK Office"
         job.secondaryLocations = [location1, location2]
 
-        result = _has_brazil_in_secondary_locations(job)
+        result = _filter_by_company(job, "unknown")
         assert result is False
 
-    def test_has_brazil_in_secondary_locations_empty_list(self):
+    def test_global_filter_secondary_locations_empty_list(self):
         job = MagicMock()
         job.secondaryLocations = []
 
-        result = _has_brazil_in_secondary_locations(job)
+        result = _filter_by_company(job, "unknown")
         assert result is False
 
-    def test_has_brazil_in_secondary_locations_none(self):
+    def test_global_filter_secondary_locations_none(self):
         job = MagicMock()
         job.secondaryLocations = None
 
-        result = _has_brazil_in_secondary_locations(job)
+        result = _filter_by_company(job, "unknown")
         assert result is False
 
     def test_global_filter_brazil_in_title(self):
@@ -200,7 +200,7 @@ class TestFilterJobsService:
         job.locationName = "Remote"
         job.secondaryLocations = []
 
-        result = _global_filter(job)
+        result = _filter_by_company(job, "unknown")
         assert result is True
 
     def test_global_filter_brazil_in_location(self):
@@ -209,17 +209,16 @@ class TestFilterJobsService:
         job.locationName = "Brazil Remote"
         job.secondaryLocations = []
 
-        result = _global_filter(job)
+        result = _filter_by_company(job, "unknown")
         assert result is True
 
-    @patch('src.services.filter_jobs_service._has_brazil_in_secondary_locations')
-    def test_global_filter_brazil_in_secondary_locations(self, mock_has_brazil):
+    def test_global_filter_brazil_in_secondary_locations(self):
         job = MagicMock()
         job.title = "Software Engineer"
         job.locationName = "Remote"
-        mock_has_brazil.return_value = True
+        job.secondaryLocations = [{"locationName": "São Paulo, Brazil"}]
 
-        result = _global_filter(job)
+        result = _filter_by_company(job, "unknown")
         assert result is True
 
     def test_global_filter_no_brazil_match(self):
@@ -228,21 +227,21 @@ class TestFilterJobsService:
         job.locationName = "Remote"
         job.secondaryLocations = []
 
-        result = _global_filter(job)
+        result = _filter_by_company(job, "unknown")
         assert result is False
 
     def test_eightsleep_filter_latam_in_location(self):
         job = MagicMock()
         job.locationName = "LATAM Remote"
 
-        result = _eightsleep_filter(job)
+        result = _filter_by_company(job, "eightsleep")
         assert result is True
 
     def test_eightsleep_filter_no_latam_match(self):
         job = MagicMock()
         job.locationName = "US Remote"
 
-        result = _eightsleep_filter(job)
+        result = _filter_by_company(job, "eightsleep")
         assert result is False
 
     def test_supabase_filter_remote_americas_in_title(self):
@@ -250,7 +249,7 @@ class TestFilterJobsService:
         job.title = "Software Engineer - Americas"
         job.locationName = "Remote"
 
-        result = _supabase_filter(job)
+        result = _filter_by_company(job, "supabase")
         assert result is True
 
     def test_supabase_filter_global_remote_no_parentheses(self):
@@ -258,7 +257,7 @@ class TestFilterJobsService:
         job.title = "Software Engineer"
         job.locationName = "Remote"
 
-        result = _supabase_filter(job)
+        result = _filter_by_company(job, "supabase")
         assert result is True
 
     def test_supabase_filter_us_time_zones_in_title(self):
@@ -266,7 +265,7 @@ class TestFilterJobsService:
         job.title = "Engineer - US time zones"
         job.locationName = "Remote"
 
-        result = _supabase_filter(job)
+        result = _filter_by_company(job, "supabase")
         assert result is True
 
     def test_supabase_filter_title_with_parentheses(self):
@@ -274,7 +273,7 @@ class TestFilterJobsService:
         job.title = "Engineer (Remote)"
         job.locationName = "Remote"
 
-        result = _supabase_filter(job)
+        result = _filter_by_company(job, "supabase")
         assert result is False
 
     def test_supabase_filter_not_remote_location(self):
@@ -282,7 +281,7 @@ class TestFilterJobsService:
         job.title = "Americas Engineer"
         job.locationName = "San Francisco"
 
-        result = _supabase_filter(job)
+        result = _filter_by_company(job, "supabase")
         assert result is True
 
     def test_supabase_filter_no_match(self):
@@ -290,77 +289,77 @@ class TestFilterJobsService:
         job.title = "Software Engineer"
         job.locationName = "US Office"
 
-        result = _supabase_filter(job)
+        result = _filter_by_company(job, "supabase")
         assert result is False
 
     def test_deel_filter_anywhere_latam(self):
         job = MagicMock()
         job.locationName = "Anywhere (LATAM)"
 
-        result = _deel_filter(job)
+        result = _filter_by_company(job, "deel")
         assert result is True
 
     def test_deel_filter_anywhere_only(self):
         job = MagicMock()
         job.locationName = "Anywhere"
 
-        result = _deel_filter(job)
+        result = _filter_by_company(job, "deel")
         assert result is False
 
     def test_deel_filter_latam_only(self):
         job = MagicMock()
         job.locationName = "LATAM Office"
 
-        result = _deel_filter(job)
+        result = _filter_by_company(job, "deel")
         assert result is False
 
     def test_deel_filter_no_match(self):
         job = MagicMock()
         job.locationName = "US Remote"
 
-        result = _deel_filter(job)
+        result = _filter_by_company(job, "deel")
         assert result is False
 
     def test_resend_filter_americas_in_location(self):
         job = MagicMock()
         job.locationName = "Americas Remote"
 
-        result = _resend_filter(job)
+        result = _filter_by_company(job, "resend")
         assert result is True
 
     def test_resend_filter_americas_case_insensitive(self):
         job = MagicMock()
         job.locationName = "AMERICAS Office"
 
-        result = _resend_filter(job)
+        result = _filter_by_company(job, "resend")
         assert result is True
 
     def test_resend_filter_americas_with_whitespace(self):
         job = MagicMock()
         job.locationName = "  Americas  "
 
-        result = _resend_filter(job)
+        result = _filter_by_company(job, "resend")
         assert result is True
 
     def test_resend_filter_no_americas_match(self):
         job = MagicMock()
         job.locationName = "US Remote"
 
-        result = _resend_filter(job)
+        result = _filter_by_company(job, "resend")
         assert result is False
 
     def test_resend_filter_none_location(self):
         job = MagicMock()
         job.locationName = None
 
-        result = _resend_filter(job)
+        result = _filter_by_company(job, "resend")
         assert result is False
 
     def test_resend_filter_empty_location(self):
         job = MagicMock()
         job.locationName = ""
 
-        result = _resend_filter(job)
+        result = _filter_by_company(job, "resend")
         assert result is False
 
     def test_filter_by_company_resend_calls_resend_filter(self):
@@ -385,7 +384,7 @@ class TestFilterJobsService:
         job.locationName = "Remote"
         job.secondaryLocations = []
 
-        result = _global_filter(job)
+        result = _filter_by_company(job, "unknown")
         assert result is True
 
     def test_global_filter_brazil_case_insensitive_location(self):
@@ -394,7 +393,7 @@ class TestFilterJobsService:
         job.locationName = "BRAZIL Remote"
         job.secondaryLocations = []
 
-        result = _global_filter(job)
+        result = _filter_by_company(job, "unknown")
         assert result is True
 
     def test_global_filter_none_title(self):
@@ -403,7 +402,7 @@ class TestFilterJobsService:
         job.locationName = "Remote"
         job.secondaryLocations = []
 
-        result = _global_filter(job)
+        result = _filter_by_company(job, "unknown")
         assert result is False
 
     def test_global_filter_none_location(self):
@@ -412,48 +411,48 @@ class TestFilterJobsService:
         job.locationName = None
         job.secondaryLocations = []
 
-        result = _global_filter(job)
+        result = _filter_by_company(job, "unknown")
         assert result is False
 
-    def test_has_brazil_in_secondary_locations_with_dict_structure(self):
+    def test_global_filter_secondary_locations_with_dict_structure(self):
         job = MagicMock()
         location1 = {"locationName": "Brazil Office"}
         location2 = {"locationName": "US Office"}
         job.secondaryLocations = [location1, location2]
 
-        result = _has_brazil_in_secondary_locations(job)
+        result = _filter_by_company(job, "unknown")
         assert result is True
 
-    def test_has_brazil_in_secondary_locations_case_insensitive(self):
+    def test_global_filter_secondary_locations_case_insensitive(self):
         job = MagicMock()
         location1 = MagicMock()
         location1.locationName = "BRAZIL Office"
         job.secondaryLocations = [location1]
 
-        result = _has_brazil_in_secondary_locations(job)
+        result = _filter_by_company(job, "unknown")
         assert result is True
 
-    def test_has_brazil_in_secondary_locations_none_location_name(self):
+    def test_global_filter_secondary_locations_none_location_name(self):
         job = MagicMock()
         location1 = MagicMock()
         location1.locationName = None
         job.secondaryLocations = [location1]
 
-        result = _has_brazil_in_secondary_locations(job)
+        result = _filter_by_company(job, "unknown")
         assert result is False
 
     def test_eightsleep_filter_latam_case_insensitive(self):
         job = MagicMock()
         job.locationName = "latam remote"
 
-        result = _eightsleep_filter(job)
+        result = _filter_by_company(job, "eightsleep")
         assert result is True
 
     def test_eightsleep_filter_none_location(self):
         job = MagicMock()
         job.locationName = None
 
-        result = _eightsleep_filter(job)
+        result = _filter_by_company(job, "eightsleep")
         assert result is False
 
     def test_supabase_filter_none_title(self):
@@ -461,7 +460,7 @@ class TestFilterJobsService:
         job.title = None
         job.locationName = "Remote"
 
-        result = _supabase_filter(job)
+        result = _filter_by_company(job, "supabase")
         assert result is True
 
     def test_supabase_filter_none_location(self):
@@ -469,7 +468,7 @@ class TestFilterJobsService:
         job.title = "Engineer"
         job.locationName = None
 
-        result = _supabase_filter(job)
+        result = _filter_by_company(job, "supabase")
         assert result is False
 
     def test_supabase_filter_americas_case_insensitive(self):
@@ -477,7 +476,7 @@ class TestFilterJobsService:
         job.title = "Engineer - AMERICAS"
         job.locationName = "Remote"
 
-        result = _supabase_filter(job)
+        result = _filter_by_company(job, "supabase")
         assert result is True
 
     def test_supabase_filter_us_time_zones_case_insensitive(self):
@@ -485,37 +484,23 @@ class TestFilterJobsService:
         job.title = "Engineer - US TIME ZONES"
         job.locationName = "Remote"
 
-        result = _supabase_filter(job)
+        result = _filter_by_company(job, "supabase")
         assert result is True
 
     def test_deel_filter_anywhere_latam_case_insensitive(self):
         job = MagicMock()
         job.locationName = "anywhere (latam)"
 
-        result = _deel_filter(job)
+        result = _filter_by_company(job, "deel")
         assert result is True
 
     def test_deel_filter_none_location(self):
         job = MagicMock()
         job.locationName = None
 
-        result = _deel_filter(job)
+        result = _filter_by_company(job, "deel")
         assert result is False
 
-    def test_attr_or_key_with_empty_dict(self):
-        obj = {}
-        assert _attr_or_key(obj, "missing") is None
-        assert _attr_or_key(obj, "missing", "default") == "default"
-
-    def test_attr_or_key_with_object_none_attribute(self):
-        obj = MagicMock()
-        obj.name = None
-        assert _attr_or_key(obj, "name") is None
-
-    def test_lower_with_empty_string(self):
-        assert _lower("") == ""
-        assert _lower("   ") == ""
-
     def test_mark_brazilian_friendly_sets_correct_attribute_name(self):
         job = MagicMock()
         _mark_brazilian_friendly(job, False, "test_reason")
@@ -547,7 +532,7 @@ class TestMarkingReasonAssignment:
         job.locationName = "Remote"
         job.secondaryLocations = []
 
-        _global_filter(job)
+        _filter_by_company(job, "unknown")
 
         assert hasattr(job, IS_BRAZILIAN_FRIENDLY_KEY)
         assert getattr(job, IS_BRAZILIAN_FRIENDLY_KEY)['reason'] == REASON_GLOBAL_TITLE_OR_LOCATION
@@ -558,19 +543,18 @@ class TestMarkingReasonAssignment:
         job.locationName = "Brazil Office"
         job.secondaryLocations = []
 
-        _global_filter(job)
+        _filter_by_company(job, "unknown")
 
         assert hasattr(job, IS_BRAZILIAN_FRIENDLY_KEY)
         assert getattr(job, IS_BRAZILIAN_FRIENDLY_KEY)['reason'] == REASON_GLOBAL_TITLE_OR_LOCATION
 
-    @patch('src.services.filter_jobs_service._has_brazil_in_secondary_locations')
-    def test_global_filter_sets_correct_reason_for_secondary_location_match(self, mock_has_brazil):
+    def test_global_filter_sets_correct_reason_for_secondary_location_match(self):
         job = MagicMock()
         job.title = "Engineer"
         job.locationName = "Remote"
-        mock_has_brazil.return_value = True
+        job.secondaryLocations = [{"locationName": "São Paulo, Brazil"}]
 
-        _global_filter(job)
+        _filter_by_company(job, "unknown")
 
         assert hasattr(job, IS_BRAZILIAN_FRIENDLY_KEY)
         assert getattr(job, IS_BRAZILIAN_FRIENDLY_KEY)['reason'] == REASON_GLOBAL_SECONDARY_LOCATION
@@ -581,7 +565,7 @@ class TestMarkingReasonAssignment:
         job.locationName = "US Office"
         job.secondaryLocations = []
 
-        _global_filter(job)
+        _filter_by_company(job, "unknown")
 
         assert hasattr(job, IS_BRAZILIAN_FRIENDLY_KEY)
         assert getattr(job, IS_BRAZILIAN_FRIENDLY_KEY)['reason'] == REASON_GLOBAL_DEFAULT
@@ -590,7 +574,7 @@ class TestMarkingReasonAssignment:
         job = MagicMock()
         job.locationName = "LATAM Remote"
 
-        _eightsleep_filter(job)
+        _filter_by_company(job, "eightsleep")
 
         assert hasattr(job, IS_BRAZILIAN_FRIENDLY_KEY)
         assert getattr(job, IS_BRAZILIAN_FRIENDLY_KEY)['reason'] == REASON_EIGHTSLEEP_MATCH
@@ -599,7 +583,7 @@ class TestMarkingReasonAssignment:
         job = MagicMock()
         job.locationName = "US Remote"
 
-        _eightsleep_filter(job)
+        _filter_by_company(job, "eightsleep")
 
         assert hasattr(job, IS_BRAZILIAN_FRIENDLY_KEY)
         assert getattr(job, IS_BRAZILIAN_FRIENDLY_KEY)['reason'] == REASON_EIGHTSLEEP_DEFAULT
@@ -609,7 +593,7 @@ class TestMarkingReasonAssignment:
         job.title = "Engineer - Americas"
         job.locationName = "Remote"
 
-        _supabase_filter(job)
+        _filter_by_company(job, "supabase")
 
         assert hasattr(job, IS_BRAZILIAN_FRIENDLY_KEY)
         assert getattr(job, IS_BRAZILIAN_FRIENDLY_KEY)['reason'] == REASON_SUPABASE_MATCH
@@ -619,7 +603,7 @@ class TestMarkingReasonAssignment:
         job.title = "Engineer"
         job.locationName = "US Office"
 
-        _supabase_filter(job)
+        _filter_by_company(job, "supabase")
 
         assert hasattr(job, IS_BRAZILIAN_FRIENDLY_KEY)
         assert getattr(job, IS_BRAZILIAN_FRIENDLY_KEY)['reason'] == REASON_SUPABASE_DEFAULT
@@ -628,7 +612,7 @@ class TestMarkingReasonAssignment:
         job = MagicMock()
         job.locationName = "Anywhere (LATAM)"
 
-        _deel_filter(job)
+        _filter_by_company(job, "deel")
 
         assert hasattr(job, IS_BRAZILIAN_FRIENDLY_KEY)
         assert getattr(job, IS_BRAZILIAN_FRIENDLY_KEY)['reason'] == REASON_DEEL_MATCH
@@ -637,7 +621,7 @@ class TestMarkingReasonAssignment:
         job = MagicMock()
         job.locationName = "US Remote"
 
-        _deel_filter(job)
+        _filter_by_company(job, "deel")
 
         assert hasattr(job, IS_BRAZILIAN_FRIENDLY_KEY)
         assert getattr(job, IS_BRAZILIAN_FRIENDLY_KEY)['reason'] == REASON_DEEL_DEFAULT
@@ -646,7 +630,7 @@ class TestMarkingReasonAssignment:
         job = MagicMock()
         job.locationName = "Americas Remote"
 
-        _resend_filter(job)
+        _filter_by_company(job, "resend")
 
         assert hasattr(job, IS_BRAZILIAN_FRIENDLY_KEY)
         assert getattr(job, IS_BRAZILIAN_FRIENDLY_KEY)['reason'] == REASON_RESEND_MATCH
@@ -655,7 +639,7 @@ class TestMarkingReasonAssignment:
         job = MagicMock()
         job.locationName = "US Remote"
 
-        _resend_filter(job)
+        _filter_by_company(job, "resend")
 
         assert hasattr(job, IS_BRAZILIAN_FRIENDLY_KEY)
         assert getattr(job, IS_BRAZILIAN_FRIENDLY_KEY)['reason'] == REASON_RESEND_DEFAULT
@@ -701,3 +685,85 @@ class TestGlobalFilterPriorityIntegration:
         result = _filter_by_company(job, "resend")
         assert result is True
         assert getattr(job, IS_BRAZILIAN_FRIENDLY_KEY)['reason'] == REASON_GLOBAL_TITLE_OR_LOCATION
+
+
+class TestRulesFile:
+    def test_example_file_matches_builtin_rules(self):
+        with open(os.path.join(os.path.dirname(__file__), "..", "..", "filter_rules.example.json"), encoding="utf-8") as file:
+            assert json.load(file) == COMPANY_RULES
+
+    def test_filter_uses_one_plan_per_board_and_picks_up_file_changes(self, tmp_path):
+        path = tmp_path / "filter_rules.json"
+        path.write_text(json.dumps(COMPANY_RULES), encoding="utf-8")
+        store = RuleStore(COMPANY_RULES, str(path))
+        job = {"id": "1", "title": "Engineer", "locationName": "Remote - Europe", "secondaryLocations": []}
+
+        with patch("src.services.filter_jobs_service._rule_store", store):
+            assert filter_brazilian_friendly_jobs(iter_dicts_to_projections([job]), "resend") == []
+
+            rules = {**COMPANY_RULES, "resend": {"default_reason": REASON_RESEND_DEFAULT, "rules": [
+                {"field": "locationName", "operator": "contains", "pattern": "europe", "reason": "[resend_filter] Europe"}]}}
+            path.write_text(json.dumps(rules), encoding="utf-8")
+            os.utime(path, ns=(1, 1))
+            with patch.object(store, "current", wraps=store.current) as current:
+                result = filter_brazilian_friendly_jobs(iter_dicts_to_projections([job, dict(job, id="2")]), "resend")
+
+        assert current.call_count == 1
+        assert [getattr(friendly, IS_BRAZILIAN_FRIENDLY_KEY)["reason"] for friendly in result] == ["[resend_filter] Europe"] * 2
+        assert store.recompiled_rule_sets == len(COMPANY_RULES) + 1
+
+    @pytest.mark.parametrize("value, expected", [("true", location_index), ("false", None)])
+    def test_location_index_flag(self, value, expected):
+        with patch.dict(os.environ, {"LOCATION_INDEX": value}):
+            store = _create_rule_store()
+
+        assert store.locations is expected
+        assert store.current().locations is expected
+
+
+class TestDecisionMemoConfiguration:
+    @patch.dict(os.environ, {"FILTER_MEMO_SIZE": "0"})
+    def test_memo_can_be_disabled(self):
+        assert _create_decision_memo() == (None, None)
+
+    @patch.dict(os.environ, {"FILTER_MEMO_SIZE": "16", "FILTER_MEMO_PERSIST": "false"})
+    def test_memo_is_in_memory_by_default(self):
+        memo, path = _create_decision_memo()
+
+        assert memo.max_entries == 16
+        assert path is None
+
+    def test_persisted_memo_survives_runs(self, tmp_path):
+        job = MagicMock()
+        job.title, job.locationName, job.secondaryLocations = "Engineer", "Remote - LATAM", []
+
+        with patch.dict(os.environ, {"STATE_DIR": str(tmp_path / "state"), "FILTER_MEMO_PERSIST": "true"}):
+            memo, path = _create_decision_memo()
+            with patch("src.services.filter_jobs_service._decision_memo", memo), \
+                    patch("src.services.filter_jobs_service._memo_path", path):
+                assert _filter_by_company(job, "eightsleep") is True
+                save_decision_memo()
+                assert get_decision_memo_stats()["misses"] == 1
+
+            restored, _ = _create_decision_memo()
+
+        assert path == str(tmp_path / "state" / "filter_decisions.json")
+        with patch("src.services.filter_jobs_service._decision_memo", restored):
+            assert _filter_by_company(job, "eightsleep") is True
+            assert get_decision_memo_stats()["hits"] == 1
+
+    def test_save_without_persistence_is_a_no_op(self, tmp_path):
+        with patch("src.services.filter_jobs_service._memo_path", None):
+            save_decision_memo()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_save_failures_are_logged(self, tmp_path, caplog):
+        with patch("src.services.filter_jobs_service._memo_path", str(tmp_path / "missing" / "filter_decisions.json")):
+            save_decision_memo()
+
+        assert "Could not persist filter decision memo" in caplog.text
+
+    def test_stats_without_memo(self):
+        with patch("src.services.filter_jobs_service._decision_memo", None):
+            assert get_decision_memo_stats() is None
@@ -1,6 +1,23 @@
+import json
+import os
 import pytest
 from unittest.mock import patch, MagicMock
-from src.services.jobs_service import _save_to_db, get_jobs
+from src.clients import database_client
+from src.clients.database_client import DatabaseClient
+from src.filters.rule_engine import GLOBAL_RULE_SET
+from src.filters.rule_store import RuleStore
+from src.models.board_page import BoardPage
+from src.models.board_snapshot import BoardSnapshot
+from src.models.enums.insert_status_enum import InsertStatusEnum
+from src.models.enums.run_status_enum import RunStatusEnum
+from src.models.insert_result import InsertResult
+from src.parsers.job_postings_parser import JobPostings
+from src.services.filter_jobs_service import COMPANY_RULES, get_rule_signature
+from src.services.jobs_service import _save_to_db, _stream_to_db, _sync_removals, get_jobs, replay_outbox
+from src.storage.board_cache import BoardCache
+from src.storage.job_fingerprint_store import JobFingerprintStore, fingerprint_job
+from src.storage.outbox import Outbox
+from test.clients.crud_stand_in import CrudStandIn
 
 
 class TestJobsService:
@@ -13,104 +30,654 @@ class TestJobsService:
 
         jobs = [mock_job1, mock_job2]
 
-        with patch("src.services.jobs_service.insert_job") as mock_insert:
+        with patch("src.clients.database_client.insert_job") as mock_insert:
             _save_to_db(jobs)
 
             assert mock_insert.call_count == 2
             mock_insert.assert_any_call({"title": "Job 1", "company": "Company A"})
             mock_insert.assert_any_call({"title": "Job 2", "company": "Company B"})
 
-    @patch("src.services.jobs_service.fetch_jobs")
+    def test_save_to_db_continues_after_failed_job(self):
+        jobs = [MagicMock(), MagicMock(), MagicMock()]
+        for index, job in enumerate(jobs):
+            job.to_dict.return_value = {"id": f"job-{index}"}
+
+        def insert(job):
+            if job["id"] == "job-1":
+                raise Exception("Error inserting job: 500")
+            return InsertResult(job["id"], InsertStatusEnum.INSERTED)
+
+        with patch("src.clients.database_client.insert_job", side_effect=insert):
+            results = _save_to_db(jobs)
+
+        assert [(result.job_id, result.status) for result in results] == [
+            ("job-0", InsertStatusEnum.INSERTED), ("job-1", InsertStatusEnum.FAILED), ("job-2", InsertStatusEnum.INSERTED)
+        ]
+        assert results[1].error == "Error inserting job: 500"
+
+    def test_save_to_db_skips_unchanged_jobs(self, tmp_path):
+        def job(job_id, title):
+            mock_job = MagicMock()
+            mock_job.to_dict.return_value = {"id": job_id, "title": title}
+            return mock_job
+
+        def insert(job_dict):
+            if job_dict["id"] == "job-3":
+                raise Exception("Error inserting job: 422")
+            return InsertResult(job_dict["id"], InsertStatusEnum.INSERTED)
+
+        with patch("src.services.jobs_service._fingerprint_store", JobFingerprintStore(str(tmp_path / "jobs.sqlite3"))), \
+                patch("src.clients.database_client.insert_job", side_effect=insert) as mock_insert:
+            _save_to_db([job("job-1", "Engineer"), job("job-2", "Designer"), job("job-3", "Broken")], "deel")
+            mock_insert.reset_mock()
+
+            results = _save_to_db([job("job-1", "Engineer"), job("job-2", "Senior Designer"), job("job-3", "Broken")], "deel")
+
+        assert [call.args[0]["id"] for call in mock_insert.call_args_list] == ["job-2", "job-3"]
+        assert [(result.job_id, result.status) for result in results] == [
+            ("job-1", InsertStatusEnum.SKIPPED), ("job-2", InsertStatusEnum.INSERTED), ("job-3", InsertStatusEnum.FAILED)
+        ]
+
+    def test_save_to_db_without_pending_jobs_sends_nothing(self, tmp_path):
+        store = JobFingerprintStore(str(tmp_path / "jobs.sqlite3"))
+        mock_job = MagicMock()
+        mock_job.to_dict.return_value = {"id": "job-1"}
+
+        with patch("src.services.jobs_service._fingerprint_store", store), \
+                patch("src.services.jobs_service.insert_jobs_concurrently", return_value=[InsertResult("job-1", InsertStatusEnum.INSERTED)]) as mock_insert:
+            _save_to_db([mock_job], "deel")
+            results = _save_to_db([mock_job], "deel")
+
+        mock_insert.assert_called_once()
+        assert [result.status for result in results] == [InsertStatusEnum.SKIPPED]
+
+    @patch.dict("os.environ", {"API_BULK_INSERT": "true"})
+    def test_save_to_db_bulk_insert(self):
+        job = MagicMock()
+        job.to_dict.return_value = {"id": "job-1"}
+
+        with patch("src.services.jobs_service.insert_jobs_bulk") as mock_bulk, \
+                patch("src.services.jobs_service.insert_jobs_concurrently") as mock_concurrent:
+            mock_bulk.return_value = [InsertResult("job-1", InsertStatusEnum.INSERTED)]
+            results = _save_to_db([job])
+
+        mock_bulk.assert_called_once_with([{"id": "job-1"}])
+        mock_concurrent.assert_not_called()
+        assert results == mock_bulk.return_value
+
+    @patch("src.services.jobs_service.fetch_board")
     def test_get_jobs_no_listings(self, mock_fetch):
         mock_fetch.return_value = None
 
-        get_jobs("test-company")
+        result = get_jobs("test-company")
 
-        mock_fetch.assert_called_once_with("test-company")
+        assert result.status == RunStatusEnum.NO_LISTINGS
+        mock_fetch.assert_called_once_with("test-company", get_rule_signature("test-company"))
 
-    @patch("src.services.jobs_service.fetch_jobs")
+    @patch("src.services.jobs_service.fetch_board")
     def test_get_jobs_empty_listings(self, mock_fetch):
-        mock_fetch.return_value = []
+        mock_fetch.return_value = BoardSnapshot("test-company", [])
 
         get_jobs("test-company")
 
-        mock_fetch.assert_called_once_with("test-company")
+        mock_fetch.assert_called_once_with("test-company", get_rule_signature("test-company"))
 
-    @patch("src.services.jobs_service.fetch_jobs")
+    @patch("src.services.jobs_service.fetch_board")
     @patch("src.services.jobs_service.filter_brazilian_friendly_jobs")
     def test_get_jobs_no_brazilian_jobs(self, mock_filter, mock_fetch):
-        mock_fetch.return_value = [MagicMock()]
+        mock_fetch.return_value = BoardSnapshot("test-company", [{"id": "job-1"}])
         mock_filter.return_value = []
 
         get_jobs("test-company")
 
-        mock_fetch.assert_called_once_with("test-company")
+        mock_fetch.assert_called_once_with("test-company", get_rule_signature("test-company"))
         mock_filter.assert_called_once()
 
-    @patch("src.services.jobs_service.fetch_jobs")
+    @patch("src.services.jobs_service.fetch_board")
     @patch("src.services.jobs_service.filter_brazilian_friendly_jobs")
     def test_get_jobs_no_brazilian_jobs_none(self, mock_filter, mock_fetch):
-        mock_fetch.return_value = [MagicMock()]
+        mock_fetch.return_value = BoardSnapshot("test-company", [{"id": "job-1"}])
         mock_filter.return_value = None
 
         get_jobs("test-company")
 
-        mock_fetch.assert_called_once_with("test-company")
+        mock_fetch.assert_called_once_with("test-company", get_rule_signature("test-company"))
         mock_filter.assert_called_once()
 
-    @patch("src.services.jobs_service.fetch_jobs")
+    @patch("src.services.jobs_service.fetch_board")
     @patch("src.services.jobs_service.filter_brazilian_friendly_jobs")
     @patch("src.services.jobs_service.normalize_jobs")
     def test_get_jobs_no_normalized_jobs(self, mock_normalize, mock_filter, mock_fetch):
-        mock_fetch.return_value = [MagicMock()]
+        mock_fetch.return_value = BoardSnapshot("test-company", [{"id": "job-1"}])
         mock_filter.return_value = [MagicMock()]
         mock_normalize.return_value = []
 
         get_jobs("test-company")
 
-        mock_fetch.assert_called_once_with("test-company")
+        mock_fetch.assert_called_once_with("test-company", get_rule_signature("test-company"))
         mock_filter.assert_called_once()
         mock_normalize.assert_called_once()
 
-    @patch("src.services.jobs_service.fetch_jobs")
+    @patch("src.services.jobs_service.fetch_board")
     @patch("src.services.jobs_service.filter_brazilian_friendly_jobs")
     @patch("src.services.jobs_service.normalize_jobs")
     def test_get_jobs_no_normalized_jobs_none(self, mock_normalize, mock_filter, mock_fetch):
-        mock_fetch.return_value = [MagicMock()]
+        mock_fetch.return_value = BoardSnapshot("test-company", [{"id": "job-1"}])
         mock_filter.return_value = [MagicMock()]
         mock_normalize.return_value = None
 
         get_jobs("test-company")
 
-        mock_fetch.assert_called_once_with("test-company")
+        mock_fetch.assert_called_once_with("test-company", get_rule_signature("test-company"))
         mock_filter.assert_called_once()
         mock_normalize.assert_called_once()
 
-    @patch("src.services.jobs_service.fetch_jobs")
+    @patch("src.services.jobs_service.fetch_board")
     @patch("src.services.jobs_service.filter_brazilian_friendly_jobs")
     @patch("src.services.jobs_service.normalize_jobs")
     @patch("src.services.jobs_service._save_to_db")
     def test_get_jobs_success(self, mock_save, mock_normalize, mock_filter, mock_fetch):
-        mock_fetch.return_value = [MagicMock()]
+        mock_fetch.return_value = BoardSnapshot("test-company", [{"id": "job-1"}])
         mock_filter.return_value = [MagicMock()]
         mock_normalize.return_value = [MagicMock()]
+        mock_save.return_value = [InsertResult("job-1", InsertStatusEnum.INSERTED)]
 
-        get_jobs("test-company")
+        result = get_jobs("test-company")
 
-        mock_fetch.assert_called_once_with("test-company")
+        mock_fetch.assert_called_once_with("test-company", get_rule_signature("test-company"))
         mock_filter.assert_called_once()
         mock_normalize.assert_called_once()
         mock_save.assert_called_once()
+        assert result.status == RunStatusEnum.SUCCESS
+        assert result.saved_jobs == 1
+        assert result.inserted_jobs == 1
 
-    @patch("src.services.jobs_service.fetch_jobs")
+    @patch("src.services.jobs_service.fetch_board")
+    @patch("src.services.jobs_service.filter_brazilian_friendly_jobs")
+    @patch("src.services.jobs_service.normalize_jobs")
+    @patch("src.services.jobs_service._save_to_db")
+    @patch("src.services.jobs_service.save_board")
+    def test_get_jobs_aggregates_insert_outcomes(self, mock_save_board, mock_save, mock_normalize, mock_filter, mock_fetch):
+        mock_fetch.return_value = BoardSnapshot("test-company", [{"id": "job-1"}])
+        mock_filter.return_value = [MagicMock(), MagicMock(), MagicMock()]
+        mock_normalize.return_value = [MagicMock(), MagicMock(), MagicMock()]
+        mock_save.return_value = [InsertResult("job-1", InsertStatusEnum.INSERTED),
+                                  InsertResult("job-2", InsertStatusEnum.FAILED, error="Error inserting job: 422"),
+                                  InsertResult("job-3", InsertStatusEnum.ALREADY_EXISTS),
+                                  InsertResult("job-4", InsertStatusEnum.SKIPPED)]
+
+        result = get_jobs("test-company")
+
+        mock_save.assert_called_once_with(mock_normalize.return_value, "test-company")
+        assert result.status == RunStatusEnum.PARTIAL_FAILURE
+        assert (result.saved_jobs, result.inserted_jobs, result.existing_jobs, result.skipped_jobs, result.failed_jobs) == (2, 1, 1, 1, 1)
+        assert result.error == "1 of 4 jobs failed to save: Error inserting job: 422"
+        mock_save_board.assert_not_called()
+
+    @patch("src.services.jobs_service.fetch_board")
     @patch("src.services.jobs_service.filter_brazilian_friendly_jobs")
     @patch("src.services.jobs_service.normalize_jobs")
     @patch("src.services.jobs_service._save_to_db")
     def test_get_jobs_save_error(self, mock_save, mock_normalize, mock_filter, mock_fetch):
-        mock_fetch.return_value = [MagicMock()]
+        mock_fetch.return_value = BoardSnapshot("test-company", [{"id": "job-1"}])
+        mock_filter.return_value = [MagicMock()]
+        mock_normalize.return_value = [MagicMock()]
+        mock_save.side_effect = Exception("Database error")
+
+        with pytest.raises(Exception, match="Database error"):
+            get_jobs("test-company")
+
+    @patch("src.services.jobs_service.fetch_board")
+    @patch("src.services.jobs_service.filter_brazilian_friendly_jobs")
+    def test_get_jobs_not_modified_skips_pipeline(self, mock_filter, mock_fetch):
+        mock_fetch.return_value = BoardSnapshot("test-company", [{"id": "job-1"}], '"v1"', None, not_modified=True)
+
+        result = get_jobs("test-company")
+
+        assert result.status == RunStatusEnum.NOT_MODIFIED
+        mock_filter.assert_not_called()
+
+    @patch("src.services.jobs_service.fetch_board")
+    @patch("src.services.jobs_service.filter_brazilian_friendly_jobs")
+    @patch("src.services.jobs_service.normalize_jobs")
+    @patch("src.services.jobs_service._save_to_db")
+    @patch("src.services.jobs_service.save_board")
+    def test_get_jobs_saves_board_after_success(self, mock_save_board, mock_save, mock_normalize, mock_filter, mock_fetch):
+        board = BoardSnapshot("test-company", [{"id": "job-1"}], '"v1"', None)
+        mock_fetch.return_value = board
+        mock_filter.return_value = [MagicMock()]
+        mock_normalize.return_value = [MagicMock()]
+
+        get_jobs("test-company")
+
+        mock_save_board.assert_called_once_with(board)
+
+    @patch("src.services.jobs_service.fetch_board")
+    @patch("src.services.jobs_service.filter_brazilian_friendly_jobs")
+    @patch("src.services.jobs_service.normalize_jobs")
+    @patch("src.services.jobs_service._save_to_db")
+    @patch("src.services.jobs_service.save_board")
+    def test_get_jobs_does_not_save_board_when_save_fails(self, mock_save_board, mock_save, mock_normalize, mock_filter, mock_fetch):
+        mock_fetch.return_value = BoardSnapshot("test-company", [{"id": "job-1"}], '"v1"', None)
         mock_filter.return_value = [MagicMock()]
         mock_normalize.return_value = [MagicMock()]
         mock_save.side_effect = Exception("Database error")
 
         with pytest.raises(Exception, match="Database error"):
             get_jobs("test-company")
+
+        mock_save_board.assert_not_called()
+
+    @patch("src.services.jobs_service.fetch_board")
+    @patch("src.services.jobs_service.iter_dicts_to_projections")
+    @patch("src.services.jobs_service.save_board")
+    def test_get_jobs_unchanged_content_skips_pipeline(self, mock_save_board, mock_dicts_to_projections, mock_fetch):
+        board = BoardSnapshot("test-company", [{"id": "job-1"}], '"v2"', None, fingerprint="abc", unchanged=True)
+        mock_fetch.return_value = board
+
+        result = get_jobs("test-company")
+
+        assert result.status == RunStatusEnum.UNCHANGED
+        mock_dicts_to_projections.assert_not_called()
+        mock_save_board.assert_called_once_with(board)
+
+    @patch("src.services.jobs_service.fetch_board")
+    @patch("src.services.jobs_service.normalize_jobs")
+    @patch("src.services.jobs_service._save_to_db")
+    def test_get_jobs_streams_postings_through_filter(self, mock_save, mock_normalize, mock_fetch):
+        consumed = []
+
+        def postings():
+            for index in range(3):
+                consumed.append(index)
+                yield {"id": f"job-{index}", "title": "Engineer", "locationName": "Brazil" if index == 1 else "Remote US"}
+
+        mock_fetch.return_value = BoardSnapshot("test-company", postings())
+        mock_normalize.side_effect = lambda jobs, company: list(jobs)
+
+        result = get_jobs("test-company")
+
+        assert consumed == [0, 1, 2]
+        assert result.status == RunStatusEnum.SUCCESS
+        assert result.total_jobs == 3
+        assert result.friendly_jobs == 1
+        assert [job.id for job in mock_save.call_args.args[0]] == ["job-1"]
+
+    @patch("src.services.jobs_service.fetch_board")
+    @patch("src.services.jobs_service._sync_removals")
+    @patch("src.services.jobs_service.save_board")
+    def test_get_jobs_with_malformed_posting(self, mock_save_board, mock_sync, mock_fetch, caplog):
+        app_data = '{"jobBoard": {"jobPostings": [{"id": "job-1", "title": "Engineer"}, {"id": oops}]}}'
+        mock_fetch.return_value = BoardSnapshot("test-company", JobPostings.from_app_data(app_data))
+
+        result = get_jobs("test-company")
+
+        assert result.status == RunStatusEnum.NO_LISTINGS
+        assert "Failed to parse app data JSON for company: test-company" in caplog.text
+        mock_sync.assert_not_called()
+        mock_save_board.assert_not_called()
+
+    @patch("src.services.jobs_service._sync_removals", return_value=0)
+    @patch("src.services.jobs_service.normalize_jobs")
+    @patch("src.services.jobs_service._save_to_db")
+    @patch("src.services.fetch_jobs_service.ashby_client.fetch_board_page")
+    def test_get_jobs_reprocesses_unchanged_board_after_rules_reload(self, mock_fetch_board_page, mock_save, mock_normalize, mock_sync,
+                                                                      tmp_path):
+        app_data = json.dumps({"jobBoard": {"jobPostings": [{"id": "job-1", "title": "Engineer", "locationName": "Americas"}]}})
+        mock_fetch_board_page.side_effect = lambda company, etag, last_modified: (
+            BoardPage(None, etag, last_modified, not_modified=True) if etag else BoardPage(f'window.__appData = {app_data};', '"v1"'))
+        mock_normalize.side_effect = lambda jobs, company: list(jobs)
+        mock_save.side_effect = lambda jobs, company: [InsertResult(job.id, InsertStatusEnum.INSERTED) for job in jobs]
+        rules_file = tmp_path / "rules.json"
+        rules_file.write_text(json.dumps({key: COMPANY_RULES[key] for key in (GLOBAL_RULE_SET, "deel")}))
+        rule_store = RuleStore(COMPANY_RULES, str(rules_file))
+
+        with patch("src.services.fetch_jobs_service._board_cache", BoardCache(str(tmp_path / "boards"))), \
+                patch("src.services.filter_jobs_service._rule_store", rule_store):
+            first = get_jobs("resend")
+            second = get_jobs("resend")
+            rules_file.write_text(json.dumps({key: COMPANY_RULES[key] for key in (GLOBAL_RULE_SET, "deel", "resend")}))
+            third = get_jobs("resend")
+
+        assert [first.status, second.status, third.status] == [RunStatusEnum.NO_FRIENDLY_JOBS, RunStatusEnum.NOT_MODIFIED,
+                                                               RunStatusEnum.SUCCESS]
+        assert third.friendly_jobs == 1
+        assert [call.args[1:] for call in mock_fetch_board_page.call_args_list] == [(None, None), ('"v1"', None), (None, None)]
+
+
+class TestSyncRemovals:
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = JobFingerprintStore(str(tmp_path / "jobs.sqlite3"))
+        store.put("deel", {"job-1": "a", "job-2": "b", "job-3": "c"})
+        with patch("src.services.jobs_service._fingerprint_store", store):
+            yield store
+
+    @patch.dict("os.environ", {"API_SYNC_REMOVALS": "true", "API_MAX_REMOVAL_SHARE": "1"})
+    def test_removes_jobs_missing_from_current_board(self, store):
+        with patch("src.services.jobs_service.delete_jobs", side_effect=lambda job_ids: job_ids[:1]) as mock_delete:
+            removed = _sync_removals("deel", {"job-2"})
+
+        mock_delete.assert_called_once_with(["job-1", "job-3"])
+        assert removed == 1
+        assert store.get("deel") == {"job-2": "b", "job-3": "c"}
+
+    def test_only_reports_closed_jobs_when_sync_is_disabled(self, store, caplog):
+        with caplog.at_level("INFO"), patch("src.services.jobs_service.delete_jobs") as mock_delete:
+            removed = _sync_removals("deel", {"job-1"})
+
+        mock_delete.assert_not_called()
+        assert removed == 0
+        assert len(store.get("deel")) == 3
+        assert "Closed: 2 | Removal sync disabled" in caplog.text
+
+    @patch.dict("os.environ", {"API_SYNC_REMOVALS": "true", "API_MAX_REMOVAL_SHARE": "1", "API_REMOVAL_GUARD_MIN_JOBS": "3"})
+    def test_never_removes_every_job_at_once(self, store, caplog):
+        with patch("src.services.jobs_service.delete_jobs") as mock_delete:
+            assert _sync_removals("deel", set()) == 0
+
+        mock_delete.assert_not_called()
+        assert len(store.get("deel")) == 3
+        assert "No current jobs left to keep" in caplog.text
+
+    @patch.dict("os.environ", {"API_SYNC_REMOVALS": "true", "API_REMOVAL_GUARD_MIN_JOBS": "3"})
+    def test_caps_the_share_of_jobs_removed_per_run(self, store, caplog):
+        with patch("src.services.jobs_service.delete_jobs", side_effect=lambda job_ids: job_ids) as mock_delete:
+            assert _sync_removals("deel", {"job-1"}) == 0
+            mock_delete.assert_not_called()
+
+            assert _sync_removals("deel", {"job-1", "job-2"}) == 1
+
+        mock_delete.assert_called_once_with(["job-3"])
+        assert "Closed: 2 of 3 | Above API_MAX_REMOVAL_SHARE: 50%" in caplog.text
+
+    @patch.dict("os.environ", {"API_SYNC_REMOVALS": "true"})
+    def test_removes_the_only_job_of_a_small_company(self, store):
+        store.put("resend", {"job-9": "z"})
+
+        with patch("src.services.jobs_service.delete_jobs", side_effect=lambda job_ids: job_ids) as mock_delete:
+            assert _sync_removals("resend", set()) == 1
+
+        mock_delete.assert_called_once_with(["job-9"])
+        assert store.get("resend") == {}
+
+    @patch.dict("os.environ", {"API_SYNC_REMOVALS": "true"})
+    def test_guards_wait_for_the_minimum_of_sent_jobs(self, store):
+        with patch("src.services.jobs_service.delete_jobs", side_effect=lambda job_ids: job_ids) as mock_delete:
+            assert _sync_removals("deel", {"job-1"}) == 2
+
+        mock_delete.assert_called_once_with(["job-2", "job-3"])
+        assert store.get("deel") == {"job-1": "a"}
+
+    @patch.dict("os.environ", {"API_SYNC_REMOVALS": "true"})
+    def test_nothing_to_remove(self, store):
+        with patch("src.services.jobs_service.delete_jobs") as mock_delete:
+            assert _sync_removals("deel", {"job-1", "job-2", "job-3", "job-4"}) == 0
+
+        mock_delete.assert_not_called()
+
+    def test_without_state_dir(self):
+        with patch("src.services.jobs_service._fingerprint_store", None):
+            assert _sync_removals("deel", set()) == 0
+
+    @patch("src.services.jobs_service.fetch_board")
+    @patch("src.services.jobs_service.filter_brazilian_friendly_jobs")
+    @patch("src.services.jobs_service.save_board")
+    @patch("src.services.jobs_service._sync_removals")
+    def test_get_jobs_syncs_removals_when_no_friendly_jobs(self, mock_sync, mock_save_board, mock_filter, mock_fetch):
+        mock_fetch.return_value = BoardSnapshot("deel", [{"id": "job-1"}])
+        mock_filter.return_value = []
+        mock_sync.return_value = 3
+
+        result = get_jobs("deel")
+
+        mock_sync.assert_called_once_with("deel", set())
+        assert result.removed_jobs == 3
+
+    @patch("src.services.jobs_service.fetch_board")
+    @patch("src.services.jobs_service.filter_brazilian_friendly_jobs")
+    @patch("src.services.jobs_service.normalize_jobs")
+    @patch("src.services.jobs_service._save_to_db")
+    @patch("src.services.jobs_service.save_board")
+    @patch("src.services.jobs_service._sync_removals")
+    def test_get_jobs_removes_jobs_missing_after_save(self, mock_sync, mock_save_board, mock_save, mock_normalize, mock_filter, mock_fetch):
+        mock_fetch.return_value = BoardSnapshot("deel", [{"id": "job-1"}])
+        mock_filter.return_value = [MagicMock()]
+        mock_normalize.return_value = [MagicMock(id="job-1")]
+        mock_save.return_value = [InsertResult("job-1", InsertStatusEnum.SKIPPED)]
+        mock_sync.return_value = 2
+
+        result = get_jobs("deel")
+
+        mock_sync.assert_called_once_with("deel", {"job-1"})
+        assert result.status == RunStatusEnum.SUCCESS
+        assert result.removed_jobs == 2
+
+    @patch("src.services.jobs_service.fetch_board")
+    @patch("src.services.jobs_service._sync_removals")
+    def test_get_jobs_does_not_remove_when_fetch_fails(self, mock_sync, mock_fetch):
+        mock_fetch.return_value = None
+
+        get_jobs("deel")
+
+        mock_sync.assert_not_called()
+
+
+def _normalized(job_id: str, title: str = "Engineer"):
+    job = MagicMock()
+    job.to_dict.return_value = {"id": job_id, "title": title}
+    return job
+
+
+class TestOutboxSpool:
+    @pytest.fixture
+    def state(self, tmp_path):
+        store = JobFingerprintStore(str(tmp_path / "jobs.sqlite3"))
+        outbox = Outbox(str(tmp_path / "outbox"))
+        with patch("src.services.jobs_service._fingerprint_store", store), patch("src.services.jobs_service._outbox", outbox):
+            yield store, outbox
+
+    def test_failed_jobs_are_spooled(self, state):
+        store, outbox = state
+        results = [InsertResult("job-1", InsertStatusEnum.INSERTED), InsertResult("job-2", InsertStatusEnum.FAILED, error="boom")]
+
+        with patch("src.services.jobs_service.insert_jobs_concurrently", return_value=results):
+            saved = _save_to_db([_normalized("job-1"), _normalized("job-2")], "deel")
+
+        assert [(result.job_id, result.status, result.error) for result in saved] == [
+            ("job-1", InsertStatusEnum.INSERTED, None), ("job-2", InsertStatusEnum.SPOOLED, "boom")
+        ]
+        assert outbox.pending() == [("deel", {"id": "job-2", "title": "Engineer"})]
+        assert list(store.get("deel")) == ["job-1"]
+
+    def test_unreachable_api_spools_every_pending_job(self, state):
+        _, outbox = state
+
+        with patch("src.services.jobs_service.insert_jobs_concurrently", side_effect=Exception("Failed to connect to API")):
+            saved = _save_to_db([_normalized("job-1"), _normalized("job-2")], "deel")
+
+        assert [result.status for result in saved] == [InsertStatusEnum.SPOOLED] * 2
+        assert [job["id"] for _, job in outbox.pending()] == ["job-1", "job-2"]
+
+    def test_unreachable_api_raises_without_outbox(self, tmp_path):
+        with patch("src.services.jobs_service._fingerprint_store", JobFingerprintStore(str(tmp_path / "jobs.sqlite3"))), \
+                patch("src.services.jobs_service._outbox", None), \
+                patch("src.services.jobs_service.insert_jobs_concurrently", side_effect=Exception("Failed to connect to API")):
+            with pytest.raises(Exception, match="Failed to connect to API"):
+                _save_to_db([_normalized("job-1")], "deel")
+
+    @patch.dict("os.environ", {"API_BATCH_SIZE": "2"})
+    def test_replay_delivers_in_batches_and_records_fingerprints(self, state):
+        store, outbox = state
+        outbox.append("deel", [{"id": "job-1"}, {"id": "job-2"}])
+        outbox.append("supabase", [{"id": "job-3"}])
+
+        def insert(jobs):
+            return [InsertResult(job["id"], InsertStatusEnum.FAILED if job["id"] == "job-2" else InsertStatusEnum.ALREADY_EXISTS)
+                    for job in jobs]
+
+        with patch("src.services.jobs_service.insert_jobs_concurrently", side_effect=insert) as mock_insert:
+            delivered = replay_outbox()
+
+        assert [len(call.args[0]) for call in mock_insert.call_args_list] == [2, 1]
+        assert delivered == 2
+        assert outbox.pending() == [("deel", {"id": "job-2"})]
+        assert list(store.get("deel")) == ["job-1"]
+        assert list(store.get("supabase")) == ["job-3"]
+
+    @patch.dict("os.environ", {"API_BATCH_SIZE": "1"})
+    def test_replay_stops_when_api_is_still_down(self, state):
+        _, outbox = state
+        outbox.append("deel", [{"id": "job-1"}, {"id": "job-2"}])
+
+        with patch("src.services.jobs_service.insert_jobs_concurrently", side_effect=Exception("Failed to connect to API")) as mock_insert:
+            assert replay_outbox() == 0
+
+        mock_insert.assert_called_once()
+        assert len(outbox.pending()) == 2
+
+    @patch.dict("os.environ", {"API_BATCH_SIZE": "1"})
+    def test_replay_stops_after_batch_fails_entirely(self, state):
+        _, outbox = state
+        outbox.append("deel", [{"id": "job-1"}, {"id": "job-2"}])
+
+        with patch("src.services.jobs_service.insert_jobs_concurrently",
+                   return_value=[InsertResult("job-1", InsertStatusEnum.FAILED)]) as mock_insert:
+            assert replay_outbox() == 0
+
+        mock_insert.assert_called_once()
+
+    def test_replay_without_pending_jobs(self, state):
+        with patch("src.services.jobs_service.insert_jobs_concurrently") as mock_insert:
+            assert replay_outbox() == 0
+
+        mock_insert.assert_not_called()
+
+    def test_replay_without_state_dir(self):
+        with patch("src.services.jobs_service._outbox", None):
+            assert replay_outbox() == 0
+
+    @patch("src.services.jobs_service.fetch_board")
+    @patch("src.services.jobs_service.filter_brazilian_friendly_jobs")
+    @patch("src.services.jobs_service.normalize_jobs")
+    @patch("src.services.jobs_service._save_to_db")
+    @patch("src.services.jobs_service.save_board")
+    def test_get_jobs_saves_board_when_failures_are_spooled(self, mock_save_board, mock_save, mock_normalize, mock_filter, mock_fetch):
+        mock_fetch.return_value = BoardSnapshot("deel", [{"id": "job-1"}])
+        mock_filter.return_value = [MagicMock()]
+        mock_normalize.return_value = [MagicMock(id="job-1")]
+        mock_save.return_value = [InsertResult("job-1", InsertStatusEnum.SPOOLED, error="boom")]
+
+        result = get_jobs("deel")
+
+        assert result.status == RunStatusEnum.SUCCESS
+        assert result.spooled_jobs == 1
+        mock_save_board.assert_called_once()
+
+
+class TestStreamUpload:
+    @pytest.fixture
+    def stand_in(self):
+        with CrudStandIn(failing_ids={"job-2"}) as stand_in, \
+                patch.dict(os.environ, {"API_URL": stand_in.url, "API_STREAM_UPLOAD": "true"}):
+            with patch.object(database_client, "_client", DatabaseClient()):
+                yield stand_in
+
+    @staticmethod
+    def _iter_normalized(jobs, company):
+        for job in jobs:
+            yield _normalized(job)
+
+    def test_streams_normalized_jobs_in_one_request(self, stand_in):
+        with patch("src.services.jobs_service._fingerprint_store", None), \
+                patch("src.services.jobs_service.iter_normalized_jobs", side_effect=self._iter_normalized):
+            results = _stream_to_db(["job-1", "job-2", "job-3"], "deel")
+
+        assert [(result.job_id, result.status) for result in results] == [
+            ("job-1", InsertStatusEnum.INSERTED), ("job-2", InsertStatusEnum.FAILED), ("job-3", InsertStatusEnum.INSERTED)
+        ]
+        assert [(method, path) for method, path, _ in stand_in.requests] == [("POST", "/jobs/stream")]
+
+    def test_skips_unchanged_jobs_and_records_fingerprints(self, stand_in, tmp_path):
+        store = JobFingerprintStore(str(tmp_path / "jobs.sqlite3"))
+
+        with patch("src.services.jobs_service._fingerprint_store", store), \
+                patch("src.services.jobs_service.iter_normalized_jobs", side_effect=self._iter_normalized):
+            _stream_to_db(["job-1", "job-2"], "deel")
+            results = _stream_to_db(["job-1", "job-2"], "deel")
+
+        assert [(result.job_id, result.status) for result in results] == [
+            ("job-1", InsertStatusEnum.SKIPPED), ("job-2", InsertStatusEnum.FAILED)
+        ]
+        assert [len(payload) for _, _, payload in stand_in.requests] == [2, 1]
+        assert list(store.get("deel")) == ["job-1"]
+
+    def test_nothing_is_sent_when_every_job_is_unchanged(self, stand_in, tmp_path):
+        store = JobFingerprintStore(str(tmp_path / "jobs.sqlite3"))
+        store.put("deel", {"job-1": fingerprint_job({"id": "job-1", "title": "Engineer"})})
+
+        with patch("src.services.jobs_service._fingerprint_store", store), \
+                patch("src.services.jobs_service.iter_normalized_jobs", side_effect=self._iter_normalized):
+            results = _stream_to_db(["job-1"], "deel")
+
+        assert [result.status for result in results] == [InsertStatusEnum.SKIPPED]
+        assert stand_in.requests == []
+
+    def test_falls_back_to_in_memory_save_when_streaming_is_unsupported(self, stand_in):
+        stand_in.stream_supported = False
+
+        with patch("src.services.jobs_service._fingerprint_store", None), \
+                patch("src.services.jobs_service.iter_normalized_jobs", side_effect=self._iter_normalized), \
+                patch("src.services.jobs_service.normalize_jobs", side_effect=lambda jobs, company: [_normalized(job) for job in jobs]):
+            results = _stream_to_db(["job-1"], "deel")
+
+        assert [result.status for result in results] == [InsertStatusEnum.INSERTED]
+        assert [path for _, path, _ in stand_in.requests] == ["/jobs/stream", "/jobs"]
+
+    def test_failed_upload_is_spooled_to_outbox(self, stand_in, tmp_path):
+        stand_in.throttled_requests = 1
+        outbox = Outbox(str(tmp_path / "outbox"))
+
+        with patch("src.services.jobs_service._fingerprint_store", None), patch("src.services.jobs_service._outbox", outbox), \
+                patch("src.services.jobs_service.iter_normalized_jobs", side_effect=self._iter_normalized):
+            results = _stream_to_db(["job-1", "job-3"], "deel")
+
+        assert [(result.job_id, result.status) for result in results] == [
+            ("job-1", InsertStatusEnum.SPOOLED), ("job-3", InsertStatusEnum.SPOOLED)
+        ]
+        assert [job["id"] for _, job in outbox.pending()] == ["job-1", "job-3"]
+        assert stand_in.jobs == {}
+
+    def test_failed_streamed_jobs_are_spooled_to_outbox(self, stand_in, tmp_path):
+        outbox = Outbox(str(tmp_path / "outbox"))
+
+        with patch("src.services.jobs_service._fingerprint_store", None), patch("src.services.jobs_service._outbox", outbox), \
+                patch("src.services.jobs_service.iter_normalized_jobs", side_effect=self._iter_normalized):
+            results = _stream_to_db(["job-1", "job-2"], "deel")
+
+        assert [(result.job_id, result.status) for result in results] == [
+            ("job-1", InsertStatusEnum.INSERTED), ("job-2", InsertStatusEnum.SPOOLED)
+        ]
+        assert outbox.pending() == [("deel", {"id": "job-2", "title": "Engineer"})]
+
+    def test_stream_errors_are_raised(self, stand_in):
+        with patch("src.services.jobs_service._fingerprint_store", None), \
+                patch("src.services.jobs_service.iter_normalized_jobs", side_effect=self._iter_normalized), \
+                patch("src.services.jobs_service.NdjsonUploadSink", side_effect=Exception("Streaming upload failed")):
+            with pytest.raises(Exception, match="Streaming upload failed"):
+                _stream_to_db(["job-1"], "deel")
+
+    @patch("src.services.jobs_service.fetch_board")
+    @patch("src.services.jobs_service.normalize_jobs")
+    @patch("src.services.jobs_service.save_board")
+    def test_get_jobs_streams_without_materializing_normalized_jobs(self, mock_save_board, mock_normalize, mock_fetch, stand_in):
+        mock_fetch.return_value = BoardSnapshot("test-company", [{"id": "job-1", "title": "Engineer", "locationName": "Brazil"}])
+
+        with patch("src.services.jobs_service._fingerprint_store", None):
+            result = get_jobs("test-company")
+
+        mock_normalize.assert_not_called()
+        assert result.status == RunStatusEnum.SUCCESS
+        assert result.inserted_jobs == 1
+        assert stand_in.requests[0][:2] == ("POST", "/jobs/stream")
+        assert stand_in.jobs["job-1"]["url"].endswith("test-company/job-1")
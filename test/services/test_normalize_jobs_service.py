@@ -3,8 +3,9 @@ import os
 from unittest.mock import patch, MagicMock
 from src.services.normalize_jobs_service import (
     _define_url, _set_seniority, _normalize_seniority, _set_field,
-    _normalize_field, normalize_jobs
+    _normalize_field, normalize_jobs, _register_keywords, KEYWORD_GROUP, SENIORITY_KEYWORDS, FIELD_KEYWORDS
 )
+from src.matching.keyword_matcher import KeywordIndex, keyword_index
 from src.models.enums.seniority_enum import SeniorityEnum
 from src.models.enums.field_enum import FieldEnum
 
@@ -273,3 +274,41 @@ class TestNormalizeJobsService:
         assert result == []
         mock_friendly_to_normalized.assert_not_called()
         mock_define_url.assert_not_called()
+
+
+class TestNormalizeWithKeywordIndex:
+    @pytest.mark.parametrize("title, department", [
+        ("Staff Engineer", "Engineering"), ("Senior Engineering Manager", "Engineering"), ("Tech Lead", "Engineering"),
+        ("Sr. Data Scientist", "Data"), ("Head of IT ", "Support"), ("Machine Learning Intern", "Research"),
+        ("Associate QA Analyst", "Quality"), ("Growth Engineer", "Hardware Engineering"), ("Account Executive", "S&M"),
+        ("Product Designer", "Design"), ("", ""),
+    ])
+    def test_same_result_as_substring_checks(self, title, department):
+        index = KeywordIndex()
+        index.register(KEYWORD_GROUP, SENIORITY_KEYWORDS + FIELD_KEYWORDS)
+        results = []
+        for use_index in (False, True):
+            job = MagicMock()
+            job.title, job.departmentName = title, department
+            with patch("src.services.normalize_jobs_service._use_keyword_index", use_index), \
+                    patch("src.services.normalize_jobs_service.keyword_index", index):
+                _normalize_seniority(job)
+                _normalize_field(job)
+            results.append((job.seniority_level, job.field))
+
+        assert results[0] == results[1]
+
+    def test_keywords_are_registered_only_when_the_index_is_enabled(self, monkeypatch):
+        index = KeywordIndex()
+        monkeypatch.setattr("src.services.normalize_jobs_service.keyword_index", index)
+
+        monkeypatch.setenv("KEYWORD_INDEX", "false")
+        assert _register_keywords() is False
+        assert index.matcher.keywords == frozenset()
+
+        monkeypatch.setenv("KEYWORD_INDEX", "true")
+        assert _register_keywords() is True
+        assert index.matcher.keywords == set(SENIORITY_KEYWORDS + FIELD_KEYWORDS)
+
+    def test_keywords_are_not_registered_at_import_while_the_index_is_disabled(self):
+        assert not keyword_index.matcher.keywords & set(SENIORITY_KEYWORDS + FIELD_KEYWORDS)
@@ -0,0 +1,57 @@
+import os
+
+from src.storage.board_cache import BoardCache
+
+
+class TestBoardCache:
+    def test_get_missing_entry(self, tmp_path):
+        cache = BoardCache(str(tmp_path))
+
+        assert cache.get("deel") is None
+
+    def test_put_and_get(self, tmp_path):
+        cache = BoardCache(str(tmp_path))
+
+        cache.put("deel", {"etag": '"abc"', "jobPostings": [{"id": "1", "title": "Engenheiro São Paulo"}]})
+
+        assert cache.get("deel") == {"etag": '"abc"', "jobPostings": [{"id": "1", "title": "Engenheiro São Paulo"}]}
+
+    def test_company_slug_is_sanitized(self, tmp_path):
+        cache = BoardCache(str(tmp_path))
+
+        cache.put("Infinite Lambda/../x", {"etag": "1"})
+
+        assert os.listdir(tmp_path) == ["infinite-lambda-..-x.json"]
+        assert cache.get("infinite lambda/../x") == {"etag": "1"}
+
+    def test_update_merges_fields(self, tmp_path):
+        cache = BoardCache(str(tmp_path))
+        cache.put("deel", {"etag": "1", "lastModified": "yesterday"})
+
+        cache.update("deel", etag="2")
+
+        assert cache.get("deel") == {"etag": "2", "lastModified": "yesterday"}
+
+    def test_corrupt_entry_is_ignored(self, tmp_path):
+        cache = BoardCache(str(tmp_path))
+        (tmp_path / "deel.json").write_text("{not json")
+
+        assert cache.get("deel") is None
+
+    def test_creates_directory(self, tmp_path):
+        BoardCache(str(tmp_path / "state" / "boards"))
+
+        assert (tmp_path / "state" / "boards").is_dir()
+
+    def test_payload_round_trip(self, tmp_path):
+        cache = BoardCache(str(tmp_path))
+
+        cache.put_payload("deel", '[{"title": "São Paulo"}]')
+        cache.put_payload("supabase", memoryview(b'[]'))
+
+        assert cache.get_payload("deel") == '[{"title": "São Paulo"}]'.encode()
+        assert cache.get_payload("supabase") == b'[]'
+        assert cache.get("deel") is None
+
+    def test_missing_payload(self, tmp_path):
+        assert BoardCache(str(tmp_path)).get_payload("deel") is None
@@ -0,0 +1,52 @@
+from src.storage.job_fingerprint_store import JobFingerprintStore, fingerprint_job
+
+
+class TestJobFingerprintStore:
+    def test_get_unknown_company(self, tmp_path):
+        store = JobFingerprintStore(str(tmp_path / "jobs.sqlite3"))
+
+        assert store.get("deel") == {}
+
+    def test_put_and_get(self, tmp_path):
+        store = JobFingerprintStore(str(tmp_path / "jobs.sqlite3"))
+
+        store.put("deel", {"job-1": "a", "job-2": "b"})
+        store.put("supabase", {"job-1": "c"})
+
+        assert store.get("deel") == {"job-1": "a", "job-2": "b"}
+        assert store.get("supabase") == {"job-1": "c"}
+
+    def test_put_replaces_existing_fingerprint(self, tmp_path):
+        store = JobFingerprintStore(str(tmp_path / "jobs.sqlite3"))
+
+        store.put("deel", {"job-1": "a"})
+        store.put("deel", {"job-1": "b"})
+        store.put("deel", {})
+
+        assert store.get("deel") == {"job-1": "b"}
+
+    def test_delete(self, tmp_path):
+        store = JobFingerprintStore(str(tmp_path / "jobs.sqlite3"))
+        store.put("deel", {"job-1": "a", "job-2": "b"})
+        store.put("supabase", {"job-1": "c"})
+
+        store.delete("deel", ["job-1", "job-9"])
+
+        assert store.get("deel") == {"job-2": "b"}
+        assert store.get("supabase") == {"job-1": "c"}
+
+    def test_fingerprints_persist_across_instances(self, tmp_path):
+        path = str(tmp_path / "state" / "jobs.sqlite3")
+        store = JobFingerprintStore(path)
+        store.put("deel", {"job-1": "a"})
+        store.close()
+
+        assert JobFingerprintStore(path).get("deel") == {"job-1": "a"}
+
+
+class TestFingerprintJob:
+    def test_ignores_key_order(self):
+        assert fingerprint_job({"id": "1", "title": "Engenheiro"}) == fingerprint_job({"title": "Engenheiro", "id": "1"})
+
+    def test_changes_with_content(self):
+        assert fingerprint_job({"id": "1", "title": "Engenheiro"}) != fingerprint_job({"id": "1", "title": "Engenheira"})
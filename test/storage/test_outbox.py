@@ -0,0 +1,93 @@
+import os
+from unittest.mock import patch
+
+from src.storage.outbox import Outbox
+
+
+def _job(job_id: str, title: str = "Engineer") -> dict:
+    return {"id": job_id, "title": title}
+
+
+class TestOutbox:
+    def test_empty_outbox(self, tmp_path):
+        outbox = Outbox(str(tmp_path))
+
+        assert outbox.pending() == []
+
+    def test_append_and_pending(self, tmp_path):
+        outbox = Outbox(str(tmp_path))
+
+        outbox.append("deel", [_job("1"), _job("2")])
+        outbox.append("supabase", [_job("1")])
+
+        assert outbox.pending() == [("deel", _job("1")), ("deel", _job("2")), ("supabase", _job("1"))]
+
+    def test_ack_removes_pending_jobs(self, tmp_path):
+        outbox = Outbox(str(tmp_path))
+        outbox.append("deel", [_job("1"), _job("2")])
+
+        outbox.ack("deel", ["1"])
+        outbox.ack("supabase", ["2"])
+
+        assert outbox.pending() == [("deel", _job("2"))]
+
+    def test_latest_payload_wins_per_job_id(self, tmp_path):
+        outbox = Outbox(str(tmp_path))
+
+        outbox.append("deel", [_job("1", "Engineer"), _job("2")])
+        outbox.append("deel", [_job("1", "Senior Engineer")])
+
+        assert outbox.pending() == [("deel", _job("2")), ("deel", _job("1", "Senior Engineer"))]
+
+    def test_appends_are_fsynced(self, tmp_path):
+        outbox = Outbox(str(tmp_path))
+
+        with patch("src.storage.outbox.os.fsync") as mock_fsync:
+            outbox.append("deel", [_job("1")])
+            outbox.append("deel", [])
+
+        assert mock_fsync.call_count == 2
+
+    def test_pending_jobs_survive_restart(self, tmp_path):
+        Outbox(str(tmp_path)).append("deel", [_job("1")])
+
+        assert Outbox(str(tmp_path)).pending() == [("deel", _job("1"))]
+
+    def test_rotates_segments(self, tmp_path):
+        outbox = Outbox(str(tmp_path), segment_max_bytes=1)
+
+        outbox.append("deel", [_job("1")])
+        outbox.append("deel", [_job("2")])
+        outbox.ack("deel", ["1"])
+
+        assert sorted(os.listdir(tmp_path)) == ["segment-00000001.ndjson", "segment-00000002.ndjson", "segment-00000003.ndjson"]
+        assert outbox.pending() == [("deel", _job("2"))]
+
+    def test_compact_keeps_only_pending_jobs(self, tmp_path):
+        outbox = Outbox(str(tmp_path), segment_max_bytes=1)
+        outbox.append("deel", [_job("1"), _job("2")])
+        outbox.append("deel", [_job("3")])
+        outbox.ack("deel", ["1", "3"])
+
+        outbox.compact()
+
+        assert os.listdir(tmp_path) == ["segment-00000004.ndjson"]
+        assert outbox.pending() == [("deel", _job("2"))]
+
+    def test_compact_removes_drained_segments(self, tmp_path):
+        outbox = Outbox(str(tmp_path))
+        outbox.compact()
+        outbox.append("deel", [_job("1")])
+        outbox.ack("deel", ["1"])
+
+        outbox.compact()
+
+        assert os.listdir(tmp_path) == []
+
+    def test_ignores_torn_records(self, tmp_path):
+        outbox = Outbox(str(tmp_path))
+        outbox.append("deel", [_job("1")])
+        with open(tmp_path / "segment-00000001.ndjson", "ab") as file:
+            file.write(b'{"op": "put", "company": "deel", "job": {"id": "2"')
+
+        assert outbox.pending() == [("deel", _job("1"))]
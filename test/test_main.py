@@ -0,0 +1,182 @@
+import os
+import threading
+from unittest.mock import patch
+import pytest
+
+from src.main import _parse_companies, _process_company, _log_summary, run, main
+from src.models.company_result import CompanyResult
+from src.models.enums.run_status_enum import RunStatusEnum
+
+
+class TestMain:
+    @patch.dict(os.environ, {"COMPANIES": " deel, supabase ,,eightsleep "})
+    def test_parse_companies_strips_and_skips_empty(self):
+        assert _parse_companies() == ["deel", "supabase", "eightsleep"]
+
+    @patch("src.main.get_jobs")
+    def test_process_company_success(self, mock_get_jobs):
+        mock_get_jobs.return_value = CompanyResult("deel", RunStatusEnum.SUCCESS, total_jobs=10, friendly_jobs=2, saved_jobs=2)
+
+        result = _process_company("deel")
+
+        assert result.status == RunStatusEnum.SUCCESS
+        assert result.saved_jobs == 2
+        assert result.elapsed_seconds >= 0
+        mock_get_jobs.assert_called_once_with("deel")
+
+    @patch("src.main.get_jobs")
+    def test_process_company_error_is_isolated(self, mock_get_jobs):
+        mock_get_jobs.side_effect = Exception("Database error")
+
+        result = _process_company("deel")
+
+        assert result.status == RunStatusEnum.ERROR
+        assert result.error == "Database error"
+
+    @patch.dict(os.environ, {"COMPANIES": "a,b,c,d", "MAX_WORKERS": "4"})
+    @patch("src.main.get_jobs")
+    def test_run_fetches_companies_concurrently(self, mock_get_jobs):
+        barrier = threading.Barrier(4, timeout=5)
+
+        def get_jobs(company):
+            barrier.wait()
+            return CompanyResult(company, RunStatusEnum.SUCCESS)
+
+        mock_get_jobs.side_effect = get_jobs
+
+        results = run()
+
+        assert [result.company for result in results] == ["a", "b", "c", "d"]
+
+    @patch.dict(os.environ, {"COMPANIES": "slow,fast,broken", "MAX_WORKERS": "3"})
+    @patch("src.main.get_jobs")
+    def test_run_summary_is_deterministic(self, mock_get_jobs):
+        release_slow = threading.Event()
+
+        def get_jobs(company):
+            if company == "slow":
+                release_slow.wait(timeout=5)
+                return CompanyResult(company, RunStatusEnum.SUCCESS, saved_jobs=3)
+            if company == "broken":
+                raise Exception("boom")
+            release_slow.set()
+            return CompanyResult(company, RunStatusEnum.NO_LISTINGS)
+
+        mock_get_jobs.side_effect = get_jobs
+
+        results = run()
+
+        assert [(result.company, result.status) for result in results] == [
+            ("slow", RunStatusEnum.SUCCESS),
+            ("fast", RunStatusEnum.NO_LISTINGS),
+            ("broken", RunStatusEnum.ERROR),
+        ]
+
+    @patch.dict(os.environ, {"COMPANIES": "deel", "MAX_WORKERS": "0"})
+    @patch("src.main.get_jobs")
+    def test_run_with_invalid_worker_count_uses_one_worker(self, mock_get_jobs):
+        mock_get_jobs.return_value = CompanyResult("deel", RunStatusEnum.SUCCESS)
+
+        results = run()
+
+        assert len(results) == 1
+
+    @patch.dict(os.environ, {"COMPANIES": "deel", "MAX_WORKERS": "1"})
+    @patch("src.main.get_jobs")
+    @patch("src.main.replay_outbox")
+    def test_run_replays_outbox_before_fresh_work(self, mock_replay, mock_get_jobs):
+        calls = []
+        mock_replay.side_effect = lambda: calls.append("replay") or 2
+        mock_get_jobs.side_effect = lambda company: calls.append(company) or CompanyResult(company, RunStatusEnum.SUCCESS)
+
+        run()
+
+        assert calls == ["replay", "deel"]
+
+    @patch.dict(os.environ, {"COMPANIES": "", "MAX_WORKERS": "1"})
+    @patch("src.main.replay_outbox", return_value=0)
+    @patch("src.main.reset_location_index")
+    def test_run_resolves_location_ids_again(self, mock_reset, _):
+        run()
+
+        mock_reset.assert_called_once()
+
+    @patch.dict("os.environ", {"RUN_INTERVAL_SECONDS": "60"})
+    @patch("src.main.time.sleep")
+    @patch("src.main.run")
+    def test_main_keeps_running_on_an_interval(self, mock_run, mock_sleep):
+        mock_run.side_effect = [Exception("unexpected"), []]
+        mock_sleep.side_effect = [None, KeyboardInterrupt]
+
+        with pytest.raises(KeyboardInterrupt):
+            main()
+
+        assert mock_run.call_count == 2
+        mock_sleep.assert_called_with(60.0)
+
+    @patch("src.main.run")
+    def test_main_logs_unexpected_errors(self, mock_run):
+        mock_run.side_effect = Exception("unexpected")
+
+        main()
+
+        mock_run.assert_called_once()
+
+    @patch("src.main.ashby_client.get_stream_stats")
+    def test_log_summary_reports_streaming(self, mock_stream_stats, caplog):
+        mock_stream_stats.return_value = {"streamedPages": 2, "earlyTerminations": 1, "bytesRead": 100, "contentLength": 300}
+        results = [CompanyResult("deel", RunStatusEnum.NOT_MODIFIED), CompanyResult("resend", RunStatusEnum.SUCCESS, saved_jobs=2)]
+
+        with caplog.at_level("INFO"):
+            _log_summary(results)
+
+        assert "Hit ratio: 50%" in caplog.text
+        assert "Bytes read: 100 of 300" in caplog.text
+
+    @patch("src.main.database_client.get_compression_stats")
+    def test_log_summary_reports_compression(self, mock_compression_stats, caplog):
+        mock_compression_stats.return_value = {"encoding": "gzip", "compressedBodies": 3, "rawBytes": 1000, "compressedBytes": 250}
+
+        with caplog.at_level("INFO"):
+            _log_summary([CompanyResult("deel", RunStatusEnum.SUCCESS, saved_jobs=2)])
+
+        assert "Bytes: 1000 -> 250 (75% saved)" in caplog.text
+
+    @patch("src.main.get_decision_memo_stats")
+    def test_log_summary_reports_decision_memo(self, mock_memo_stats, caplog):
+        mock_memo_stats.return_value = {"entries": 3, "maxEntries": 4096, "hits": 9, "misses": 3, "evictions": 0, "hitRatio": 0.75}
+
+        with caplog.at_level("INFO"):
+            _log_summary([CompanyResult("deel", RunStatusEnum.SUCCESS)])
+
+        assert "Filter decision memo | Hits: 9 | Misses: 3 | Hit ratio: 75% | Entries: 3/4096" in caplog.text
+
+    @patch.dict(os.environ, {"COMPANIES": "", "MAX_WORKERS": "1"})
+    @patch("src.main.replay_outbox", return_value=0)
+    @patch("src.main.get_decision_memo_stats")
+    @patch("src.main.ashby_client.get_rate_limiter_stats")
+    def test_run_logs_counters_of_its_own(self, mock_throttling_stats, mock_memo_stats, _, caplog):
+        mock_throttling_stats.side_effect = [
+            {"totalRequests": requests, "throttledRequests": 1, "throttledSeconds": seconds, "retryAfterPauses": 0}
+            for requests, seconds in ((0, 0.0), (5, 1.5), (5, 1.5), (8, 2.0))
+        ]
+        mock_memo_stats.side_effect = [
+            {"entries": hits, "maxEntries": 4096, "hits": hits, "misses": misses, "evictions": 0, "hitRatio": 0.0}
+            for hits, misses in ((4, 4), (7, 5), (7, 5), (10, 5))
+        ]
+
+        with caplog.at_level("INFO"):
+            run()
+            run()
+
+        assert "Ashby rate limiter | Requests: 5 | Throttled: 0 | Time throttled: 1.50s" in caplog.text
+        assert "Ashby rate limiter | Requests: 3 | Throttled: 0 | Time throttled: 0.50s" in caplog.text
+        assert "Filter decision memo | Hits: 3 | Misses: 1 | Hit ratio: 75% | Entries: 7/4096" in caplog.text
+        assert "Filter decision memo | Hits: 3 | Misses: 0 | Hit ratio: 100% | Entries: 10/4096" in caplog.text
+
+    @patch("src.main.get_decision_memo_stats", return_value=None)
+    def test_log_summary_without_decision_memo(self, _, caplog):
+        with caplog.at_level("INFO"):
+            _log_summary([CompanyResult("deel", RunStatusEnum.SUCCESS)])
+
+        assert "Filter decision memo" not in caplog.text